@@ -0,0 +1,73 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Final/ 모듈(text_analysis)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_analysis  # noqa: E402
+from bench_text_preprocess import SAMPLE_DIR, load_samples, scale  # noqa: E402
+
+# ========================================
+# 키워드 동시출현 벤치마크
+# - 기존: 댓글마다 키워드 k개 × k개를 돌며 cooc_matrix.loc[w1, w2] += 1 (--legacy 일 때만, 느림)
+# - 희소 행렬: 단위(댓글/슬라이딩 창) × 키워드 0/1 행렬 B → B.T @ B, 지표(count/lift/pmi)별
+#
+# 사용 예)
+#   python benchmarks/bench_cooccurrence.py --rows 100000 --top 15,100,300 --windows 5,10
+#   python benchmarks/bench_cooccurrence.py --rows 5000 --top 15 --legacy
+# ========================================
+
+
+def legacy_cooccurrence(texts, keywords):
+    matrix = pd.DataFrame(0, index=keywords, columns=keywords)
+    for text in texts:
+        words = set(text_analysis.preprocess_text(text).split())
+        for word1 in keywords:
+            if word1 in words:
+                for word2 in keywords:
+                    if word2 in words:
+                        matrix.loc[word1, word2] += 1
+    return matrix
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 동시출현 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--top", default="15,100,300", help="키워드 개수 (쉼표 구분)")
+    parser.add_argument("--windows", default="5,10", help="슬라이딩 창 크기 (쉼표 구분)")
+    parser.add_argument("--legacy", action="store_true", help="기존 loc 루프도 측정 (가장 작은 키워드 개수만)")
+    parser.add_argument("--samples", default=SAMPLE_DIR, help="샘플 CSV 폴더")
+    args = parser.parse_args()
+
+    texts = scale(load_samples(args.samples), args.rows)
+    seconds, corpus = timed(text_analysis.get_corpus, texts)
+    print(f"문서 {len(texts):,}개 | 토큰화 {seconds:.2f}초 (공유 캐시, 1회)")
+    windows = [None] + [int(w) for w in args.windows.split(",") if w]
+    for top_n in (int(n) for n in args.top.split(",")):
+        keywords = [w for w, _ in text_analysis.top_keywords(corpus, top_n)]
+        for window in windows:
+            unit = f"{window}단어 창" if window else "댓글"
+            timings = []
+            for measure in text_analysis.COOCCURRENCE_MEASURES:
+                seconds, matrix = timed(text_analysis.cooccurrence_matrix, corpus, keywords, window, measure)
+                timings.append(f"{measure} {seconds * 1000:7.1f}ms")
+            print(f"[키워드 {len(keywords):>3}개, {unit:<6}] " + " | ".join(timings))
+    if args.legacy:
+        keywords = [w for w, _ in text_analysis.top_keywords(corpus, int(args.top.split(",")[0]))]
+        seconds, expected = timed(legacy_cooccurrence, texts, keywords)
+        assert expected.equals(text_analysis.cooccurrence_matrix(corpus, keywords))
+        print(f"[기존 loc 루프, 키워드 {len(keywords)}개] {seconds:.2f}초")
+
+
+if __name__ == "__main__":
+    main()
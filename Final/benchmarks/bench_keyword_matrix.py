@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+# Final/ 모듈(text_analysis)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_analysis  # noqa: E402
+from bench_text_preprocess import SAMPLE_DIR, load_samples, scale  # noqa: E402
+
+# ========================================
+# 키워드 분석 벤치마크 (Counter vs 문서-단어 희소 행렬)
+# - 기존: 전체/그룹마다 ' '.join → split → Counter
+# - DTM: 데이터셋당 한 번 CSR 행렬을 만든 뒤 열 합(전체) / 행 부분합(그룹)
+# - 그룹은 서브레딧처럼 문서마다 임의로 배정 (--groups 개)
+#
+# 사용 예)
+#   python benchmarks/bench_keyword_matrix.py --rows 1000000 --groups 20
+# ========================================
+
+
+def legacy_top(clean, top_n, stopwords):
+    words = ' '.join(clean).split()
+    return Counter(w for w in words if len(w) >= 2 and w not in stopwords).most_common(top_n)
+
+
+def legacy_groups(clean, groups, top_n, stopwords):
+    result = {}
+    for value in np.unique(groups):
+        selected = [text for text, group in zip(clean, groups) if group == value]
+        result[value] = [w for w, _ in legacy_top(selected, top_n, stopwords)]
+    return result
+
+
+def timed(label, func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"  {label:<28} {time.perf_counter() - started:7.3f}초")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 분석(Counter vs DTM) 벤치마크")
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--samples", default=SAMPLE_DIR, help="샘플 CSV 폴더")
+    args = parser.parse_args()
+
+    texts = scale(load_samples(args.samples), args.rows)
+    groups = np.random.default_rng(0).integers(0, args.groups, len(texts))
+    stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'is', 'are'}
+    print(f"문서 {len(texts):,}개 | 그룹 {args.groups}개")
+
+    corpus = timed("토큰화 (공유 캐시, 1회)", text_analysis.get_corpus, texts)
+    timed("DTM 생성 (1회)", lambda: corpus.dtm)
+    print(f"  → 단어 {len(corpus.vocabulary):,}개, 0 아닌 칸 {corpus.dtm.nnz:,}개")
+
+    print("[기존 Counter]")
+    expected_top = timed("전체 상위 50", legacy_top, corpus.clean, 50, stopwords)
+    expected_groups = timed("그룹별 상위 5", legacy_groups, corpus.clean, groups, 5, stopwords)
+    print("[DTM]")
+    result_top = timed("전체 상위 50", text_analysis.top_keywords, corpus, 50, 2, stopwords)
+    result_groups = timed("그룹별 상위 5", text_analysis.group_top_words, corpus, groups, np.unique(groups),
+                          5, 2, stopwords)
+    timed("키워드 20개 문서별 빈도", text_analysis.keyword_doc_matrix, corpus, [w for w, _ in result_top[:20]])
+    assert expected_top == result_top
+    assert expected_groups == result_groups
+
+
+if __name__ == "__main__":
+    main()
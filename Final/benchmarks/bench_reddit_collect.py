@@ -0,0 +1,133 @@
+import argparse
+import os
+import sys
+import time
+
+# Final/ 모듈(reddit_collector, fake_reddit)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_reddit import FakeRedditServer, generate_fixture, load_fixture
+from reddit_collector import collect_subreddits_parallel, create_reddit_client, get_listing
+
+# ========================================
+# Reddit 수집 벤치마크 (가짜 API 서버 사용, 네트워크/API 키 불필요)
+# - 기존 직렬 수집 루프 vs 병렬 수집(collect_subreddits_parallel)의 처리량 비교
+#
+# 사용 예)
+#   python benchmarks/bench_reddit_collect.py --subreddits 4 --posts 200 --comments 20 --latency 0.05
+#   python benchmarks/bench_reddit_collect.py --fixture recorded.json --latency 0.1
+# ========================================
+
+
+def post_to_dict(post, subreddit_name):
+    subreddit_display = post.subreddit.display_name if hasattr(post.subreddit, 'display_name') else subreddit_name
+    return {
+        'post_id': post.id,
+        'subreddit': subreddit_display,
+        'title': post.title,
+        'selftext': post.selftext,
+        'author': str(post.author) if post.author else '[deleted]',
+        'score': post.score,
+        'upvote_ratio': post.upvote_ratio,
+        'num_comments': post.num_comments,
+        'created_utc': post.created_utc,
+        'url': post.url,
+        'permalink': f"https://reddit.com{post.permalink}"
+    }
+
+
+def comment_to_dict(comment, post_data):
+    return {
+        'comment_id': comment.id,
+        'post_id': post_data['post_id'],
+        'subreddit': post_data['subreddit'],
+        'author': str(comment.author) if comment.author else '[deleted]',
+        'body': comment.body,
+        'score': comment.score,
+        'created_utc': comment.created_utc,
+        'post_title': post_data['title']
+    }
+
+
+def collect_serial(credentials, subreddit_list, search_query, post_limit, sort_by, time_filter, comment_limit):
+    """기존 페이지의 직렬 수집 루프 (게시물마다 댓글 트리를 바로 요청)"""
+    reddit = create_reddit_client(credentials)
+    all_posts, all_comments = [], []
+
+    for subreddit_name in subreddit_list:
+        try:
+            subreddit = reddit.subreddit(subreddit_name)
+            _ = subreddit.title
+            for post in get_listing(subreddit, search_query, post_limit, sort_by, time_filter):
+                post_data = post_to_dict(post, subreddit_name)
+                all_posts.append(post_data)
+                if comment_limit > 0 and post.num_comments > 0:
+                    try:
+                        post.comments.replace_more(limit=0)
+                        for comment in post.comments.list()[:comment_limit]:
+                            if hasattr(comment, 'body') and comment.body is not None:
+                                all_comments.append(comment_to_dict(comment, post_data))
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+    return all_posts, all_comments
+
+
+def report(label, seconds, posts, comments, requests):
+    print(f"[{label}] {seconds:.2f}초 | 게시물 {posts}개 ({posts / seconds:.1f}/s) | "
+          f"댓글 {comments}개 ({comments / seconds:.1f}/s) | 요청 {requests}회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reddit 수집 처리량 벤치마크")
+    parser.add_argument("--fixture", help="녹화된 픽스처 JSON (없으면 합성 데이터 생성)")
+    parser.add_argument("--subreddits", type=int, default=4, help="합성 데이터의 서브레딧 수")
+    parser.add_argument("--posts", type=int, default=200, help="서브레딧당 수집할 게시물 수")
+    parser.add_argument("--comments", type=int, default=20, help="게시물당 수집할 댓글 수")
+    parser.add_argument("--sort", default="hot")
+    parser.add_argument("--query", default="")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 서버의 요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=10**7,
+                        help="가짜 서버의 윈도우당 허용 요청 수 (기본값은 사실상 무제한)")
+    parser.add_argument("--requests-per-minute", type=int, default=10**6, help="병렬 수집의 요청 예산")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--comment-workers", type=int, default=8)
+    parser.add_argument("--skip-serial", action="store_true", help="직렬 수집(느림) 생략")
+    args = parser.parse_args()
+
+    if args.fixture:
+        fixture = load_fixture(args.fixture)
+    else:
+        names = [f"bench{i}" for i in range(args.subreddits)]
+        fixture = generate_fixture(names, args.posts, args.comments)
+    subreddit_list = list(fixture["subreddits"])
+
+    with FakeRedditServer(fixture, latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit) as server:
+        credentials = {"client_id": "bench", "client_secret": "bench", "base_url": server.base_url}
+        print(f"가짜 서버 {server.base_url} | 서브레딧 {len(subreddit_list)}개 | 지연 {args.latency}초")
+
+        if not args.skip_serial:
+            start_requests = server.state.total_requests
+            started = time.perf_counter()
+            posts, comments = collect_serial(credentials, subreddit_list, args.query, args.posts, args.sort,
+                                             "all", args.comments)
+            report("직렬", time.perf_counter() - started, len(posts), len(comments),
+                   server.state.total_requests - start_requests)
+
+        start_requests = server.state.total_requests
+        started = time.perf_counter()
+        posts_df, comments_df, stats = collect_subreddits_parallel(
+            credentials, subreddit_list, args.query, args.posts, args.sort, "all", args.comments > 0,
+            args.comments, max_workers=args.workers, requests_per_minute=args.requests_per_minute,
+            comment_workers=args.comment_workers
+        )
+        report("병렬", time.perf_counter() - started, len(posts_df),
+               0 if comments_df is None else len(comments_df), server.state.total_requests - start_requests)
+        print(f"  리스팅 {stats['listing_seconds']}초 / 댓글 {stats.get('comment_seconds', 0)}초 / "
+              f"예산 대기 {stats['rate_wait_seconds']}초 / 서버 429 응답 {server.state.throttled}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Final/ 모듈(text_analysis)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_analysis  # noqa: E402
+from bench_text_preprocess import SAMPLE_DIR, load_samples, scale  # noqa: E402
+
+# ========================================
+# 감성 사전 분류 벤치마크
+# - 기존: 댓글마다 전처리 → 단어 수 계산 → pd.Series 생성(apply) → apply(axis=1)로 분류
+# - SentimentLexicon: 캐시된 토큰 id → 극성 코드 조회 → 문서별 bincount (부정어 창 포함/미포함)
+#
+# 사용 예)
+#   python benchmarks/bench_sentiment.py --rows 1000000 --legacy-rows 50000
+# ========================================
+
+POSITIVE = {'good', 'great', 'best', 'love', 'amazing', 'perfect', 'nice', 'happy', '좋다', '최고', '좋아요'}
+NEGATIVE = {'bad', 'worst', 'terrible', 'awful', 'hate', 'poor', 'waste', '별로', '최악', '실망'}
+
+
+def legacy_sentiment(texts):
+    def calculate_sentiment(text):
+        words = text_analysis.preprocess_text(text).split()
+        return {'PositiveCount': sum(1 for w in words if w in POSITIVE),
+                'NegativeCount': sum(1 for w in words if w in NEGATIVE)}
+
+    df = texts.apply(lambda x: pd.Series(calculate_sentiment(x)))
+    df['sentiment'] = df.apply(lambda row: '긍정' if row['PositiveCount'] > row['NegativeCount']
+                               else '부정' if row['PositiveCount'] < row['NegativeCount'] else '중립', axis=1)
+    return df
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감성 사전 분류 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--legacy-rows", type=int, default=50_000, help="기존 방식을 측정할 행 수 (느림)")
+    parser.add_argument("--samples", default=SAMPLE_DIR, help="샘플 CSV 폴더")
+    args = parser.parse_args()
+
+    samples = load_samples(args.samples)
+    legacy_texts = scale(samples, args.legacy_rows)
+    seconds, expected = timed(legacy_sentiment, legacy_texts)
+    print(f"[기존 apply] {len(legacy_texts):,}행 {seconds:.2f}초 ({len(legacy_texts) / seconds:,.0f}행/s)")
+    labels = text_analysis.SentimentLexicon(POSITIVE, NEGATIVE).classify(text_analysis.get_corpus(legacy_texts))[2]
+    assert expected['sentiment'].tolist() == labels.tolist()
+
+    texts = scale(samples, args.rows)
+    seconds, corpus = timed(text_analysis.get_corpus, texts)
+    print(f"[토큰화] {len(texts):,}행 {seconds:.2f}초 (공유 캐시, 탭 간 1회)")
+    for window in (0, text_analysis.DEFAULT_NEGATION_WINDOW):
+        lexicon = text_analysis.SentimentLexicon(POSITIVE, NEGATIVE, negation_window=window)
+        seconds, (_, _, labels) = timed(lexicon.classify, corpus)
+        counts = pd.Series(labels).value_counts().to_dict()
+        print(f"[사전 분류, 부정어 창 {window}] {seconds:.2f}초 ({len(texts) / seconds:,.0f}행/s) | {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+import pandas as pd
+
+# Final/ 모듈(text_analysis, fake_youtube)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_analysis  # noqa: E402
+from fake_youtube import SAMPLE_WORDS  # noqa: E402
+
+# ========================================
+# 분석 탭 지연 시간 벤치마크 (그래프 그리기 제외, 계산만)
+# - 기존: 탭마다 전체 댓글에 preprocess_text(정규식 3회)를 다시 실행
+# - 공유 토큰 캐시: 데이터셋당 한 번만 토큰화 → 이후 탭은 캐시된 토큰만 읽음
+#   (Streamlit은 탭 클릭마다 페이지를 다시 실행하므로 분석 객체도 매번 새로 만듦)
+#
+# 사용 예)
+#   python benchmarks/bench_text_analysis.py --rows 20000 --rounds 2
+# ========================================
+
+STOPWORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'is', 'are'}
+POSITIVE = {'good', 'love', 'best', '좋아요', '추천'}
+NEGATIVE = {'bad', 'not', '별로'}
+
+
+def legacy_preprocess(text):
+    if pd.isna(text):
+        return ""
+    text = str(text).lower()
+    text = re.sub(r'http\S+|www\S+', '', text)
+    text = re.sub(r'[^가-힣a-z0-9\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def legacy_keywords(df, top_n=50):
+    words = ' '.join(df['text'].apply(legacy_preprocess)).split()
+    words = [w for w in words if len(w) >= 2 and w not in STOPWORDS]
+    return Counter(words).most_common(top_n)
+
+
+def legacy_wordcloud_text(df):
+    return ' '.join(df['text'].apply(legacy_preprocess))
+
+
+def legacy_sentiment(df):
+    def calculate(text):
+        words = legacy_preprocess(text).split()
+        return sum(1 for w in words if w in POSITIVE), sum(1 for w in words if w in NEGATIVE)
+    counts = df['text'].apply(calculate)
+    return [('긍정' if p > n else '부정' if p < n else '중립') for p, n in counts]
+
+
+def legacy_cooccurrence(df, top_n=15):
+    keywords = [w for w, _ in legacy_keywords(df, top_n)]
+    matrix = pd.DataFrame(0, index=keywords, columns=keywords)
+    for text in df['text']:
+        words = set(legacy_preprocess(text).split())
+        for word1 in keywords:
+            if word1 in words:
+                for word2 in keywords:
+                    if word2 in words:
+                        matrix.loc[word1, word2] += 1
+    return matrix
+
+
+def legacy_topics(df):
+    result = {}
+    for title in df['video_title'].unique()[:10]:
+        words = ' '.join(df[df['video_title'] == title]['text'].apply(legacy_preprocess)).split()
+        result[title] = [w for w, _ in Counter(w for w in words if len(w) >= 2).most_common(5)]
+    return result
+
+
+def cached_keywords(df, top_n=50):
+    return text_analysis.top_keywords(text_analysis.get_corpus(df['text']), top_n, 2, STOPWORDS)
+
+
+def cached_wordcloud_text(df):
+    return text_analysis.get_corpus(df['text']).text
+
+
+def cached_sentiment(df):
+    lexicon = text_analysis.SentimentLexicon(POSITIVE, NEGATIVE)
+    return lexicon.classify(text_analysis.get_corpus(df['text']))[2].tolist()
+
+
+def cached_cooccurrence(df, top_n=15):
+    keywords = [w for w, _ in cached_keywords(df, top_n)]
+    return text_analysis.cooccurrence_matrix(text_analysis.get_corpus(df['text']), keywords)
+
+
+def cached_topics(df):
+    titles = df['video_title'].unique()[:10]
+    return text_analysis.group_top_words(text_analysis.get_corpus(df['text']), df['video_title'], titles)
+
+
+TABS = [
+    ("키워드 빈도", legacy_keywords, cached_keywords),
+    ("워드클라우드", legacy_wordcloud_text, cached_wordcloud_text),
+    ("감성 분석", legacy_sentiment, cached_sentiment),
+    ("동시출현", legacy_cooccurrence, cached_cooccurrence),
+    ("토픽 비교", legacy_topics, cached_topics),
+]
+
+
+def make_comments(rows, seed=42):
+    rng = random.Random(seed)
+    texts = [" ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(3, 30)))
+             + (" https://youtu.be/x!" if rng.random() < 0.05 else "") for _ in range(rows)]
+    titles = [f"video {rng.randint(0, 49)}" for _ in range(rows)]
+    return pd.DataFrame({"text": texts, "video_title": titles})
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 탭 지연 시간 벤치마크 (기존 vs 공유 토큰 캐시)")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=2, help="모든 탭을 차례로 누르는 횟수")
+    args = parser.parse_args()
+
+    df = make_comments(args.rows)
+    print(f"댓글 {args.rows:,}개 | 탭 {len(TABS)}개 × {args.rounds}회")
+    legacy_total = cached_total = 0.0
+    for round_no in range(1, args.rounds + 1):
+        for name, legacy, cached in TABS:
+            frame = df.copy()  # 페이지 재실행마다 분석 객체가 새 DataFrame 복사본을 받음
+            legacy_seconds, expected = timed(legacy, frame)
+            cached_seconds, result = timed(cached, frame)
+            if isinstance(expected, pd.DataFrame):
+                assert expected.equals(result)
+            else:
+                assert list(expected) == list(result) if not isinstance(expected, dict) else expected == result
+            legacy_total += legacy_seconds
+            cached_total += cached_seconds
+            print(f"  [{round_no}회차] {name:<6} 기존 {legacy_seconds * 1000:8.1f}ms | 캐시 {cached_seconds * 1000:8.1f}ms")
+    cache = text_analysis.get_token_cache()
+    print(f"합계: 기존 {legacy_total:.2f}초 → 캐시 {cached_total:.2f}초 "
+          f"(토큰화 {cache.misses}회, 캐시 적중 {cache.hits}회)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import glob
+import os
+import sys
+import time
+
+import pandas as pd
+
+# Final/ 모듈(text_analysis)을 불러오기 위해 상위 폴더를 경로에 추가
+FINAL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, FINAL_DIR)
+
+from text_analysis import preprocess_text, preprocess_texts  # noqa: E402
+
+# ========================================
+# 텍스트 전처리 벤치마크 (행 단위 apply vs 열 전체 pyarrow compute)
+# - 샘플 말뭉치: yj/sns_total_db/analysis_results/ 의 Reddit 댓글/게시물/감성 분석 텍스트
+# - 샘플을 반복해 원하는 행 수(최대 100만)로 늘린 뒤 두 방식의 결과가 같은지도 확인
+#
+# 사용 예)
+#   python benchmarks/bench_text_preprocess.py --rows 10000,100000,1000000
+# ========================================
+
+SAMPLE_DIR = os.path.join(os.path.dirname(FINAL_DIR), "yj", "sns_total_db", "analysis_results")
+SAMPLE_COLUMNS = {
+    "reddit_comments_data_*.csv": ["body", "post_title"],
+    "reddit_posts_data_*.csv": ["title", "selftext"],
+    "reddit_sentiment_analysis_*.csv": ["본문_또는_내용"],
+}
+
+
+def load_samples(sample_dir=SAMPLE_DIR):
+    """샘플 CSV들의 텍스트 열을 하나의 Series로 (빈 값도 그대로 포함)"""
+    texts = []
+    for pattern, columns in SAMPLE_COLUMNS.items():
+        for path in sorted(glob.glob(os.path.join(sample_dir, pattern))):
+            df = pd.read_csv(path)
+            texts.extend(df[column] for column in columns if column in df.columns)
+    if not texts:
+        raise FileNotFoundError(f"샘플 말뭉치가 없습니다: {sample_dir}")
+    return pd.concat(texts, ignore_index=True)
+
+
+def scale(samples, rows):
+    repeats = -(-rows // len(samples))
+    return pd.concat([samples] * repeats, ignore_index=True).iloc[:rows]
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 전처리(행 단위 vs 열 전체) 벤치마크")
+    parser.add_argument("--rows", default="10000,100000,1000000", help="비교할 행 수 (쉼표 구분)")
+    parser.add_argument("--samples", default=SAMPLE_DIR, help="샘플 CSV 폴더")
+    args = parser.parse_args()
+
+    samples = load_samples(args.samples)
+    print(f"샘플 {len(samples):,}행 (빈 값 {samples.isna().sum():,}개, 평균 {samples.dropna().str.len().mean():.0f}자)")
+    for rows in (int(r) for r in args.rows.split(",")):
+        texts = scale(samples, rows)
+        legacy_seconds, expected = timed(lambda s: s.apply(preprocess_text).tolist(), texts)
+        vector_seconds, result = timed(preprocess_texts, texts)
+        assert expected == result
+        print(f"[{rows:>9,}행] apply {legacy_seconds:6.2f}초 ({rows / legacy_seconds:>9,.0f}/s) | "
+              f"열 전체 {vector_seconds:6.2f}초 ({rows / vector_seconds:>9,.0f}/s) | "
+              f"{legacy_seconds / vector_seconds:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
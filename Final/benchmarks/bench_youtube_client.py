@@ -0,0 +1,138 @@
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httplib2
+from googleapiclient.discovery import build
+
+# Final/ 모듈(youtube_collector 등)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import youtube_collector  # noqa: E402
+from youtube_http_cache import CachingHttp, ResponseCache  # noqa: E402
+from youtube_quota import QuotaLedger, make_request_builder  # noqa: E402
+
+# ========================================
+# YouTube 클라이언트 생성/연결 재사용 벤치마크 (네트워크/API 키 불필요)
+# 1) 클라이언트 생성: 수집마다 스레드별 build() (기존) vs 프로세스 공용 클라이언트 (get_youtube_client)
+# 2) 연결: 수집마다 스레드별 새 httplib2.Http (기존) vs 공용 연결 풀 (PooledHttp)
+#    로컬 서버가 새 연결마다 --handshake초 지연 → 실제 API의 TCP+TLS 연결 비용을 흉내
+#
+# 사용 예)
+#   python benchmarks/bench_youtube_client.py --crawls 5 --workers 8 --requests 40 --handshake 0.08
+# ========================================
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (연결 재사용 가능)
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+        time.sleep(self.server.handshake)  # 새 연결 비용
+
+    def do_GET(self):
+        body = b'{"items": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(handshake):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.handshake = handshake
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_construction(crawls, workers, state_dir):
+    """수집 1회 = 메인 스레드 + 워커 수만큼 클라이언트 준비"""
+    ledger = QuotaLedger(state_dir)
+    cache = ResponseCache(os.path.join(state_dir, "http_cache"))
+
+    started = time.perf_counter()
+    for _ in range(crawls):
+        for _ in range(workers + 1):
+            build("youtube", "v3", developerKey="bench", http=CachingHttp(cache, httplib2.Http()),
+                  requestBuilder=make_request_builder(ledger))
+    legacy = time.perf_counter() - started
+
+    started = time.perf_counter()
+    first = None
+    for _ in range(crawls):
+        factory = youtube_collector.make_youtube_client_factory("bench", ledger, cache)
+        for _ in range(workers + 1):
+            factory()
+        first = first or time.perf_counter() - started
+    shared = time.perf_counter() - started
+    return legacy, shared, first
+
+
+def run_crawl(url, workers, requests, get_http):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda _: get_http().request(url), range(requests)))
+
+
+def bench_connections(server, crawls, workers, requests):
+    url = f"http://127.0.0.1:{server.server_address[1]}/youtube/v3/commentThreads"
+
+    server.connections = 0
+    started = time.perf_counter()
+    for _ in range(crawls):
+        local = threading.local()  # 기존: 수집마다 스레드별 새 Http
+
+        def thread_http():
+            if not hasattr(local, "http"):
+                local.http = httplib2.Http(timeout=10)
+            return local.http
+        run_crawl(url, workers, requests, thread_http)
+    legacy = (time.perf_counter() - started, server.connections)
+
+    server.connections = 0
+    pool = youtube_collector.PooledHttp(timeout=10)
+    started = time.perf_counter()
+    for _ in range(crawls):
+        run_crawl(url, workers, requests, lambda: pool)
+    pooled = (time.perf_counter() - started, server.connections)
+    return legacy, pooled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube 클라이언트 생성/연결 재사용 벤치마크")
+    parser.add_argument("--crawls", type=int, default=5, help="연속 수집 횟수")
+    parser.add_argument("--workers", type=int, default=youtube_collector.DEFAULT_COMMENT_WORKERS)
+    parser.add_argument("--requests", type=int, default=40, help="수집 1회의 요청 수")
+    parser.add_argument("--handshake", type=float, default=0.08, help="새 연결마다 지연(초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as state_dir:  # 벤치마크용 할당량 기록/응답 캐시 (실제 기록과 분리)
+        legacy, shared, first = bench_construction(args.crawls, args.workers, state_dir)
+    print(f"[클라이언트 생성] 수집 {args.crawls}회 × 클라이언트 {args.workers + 1}개")
+    print(f"  기존 build(): {legacy * 1000:.1f}ms (수집당 {legacy / args.crawls * 1000:.1f}ms)")
+    print(f"  공용 클라이언트: {shared * 1000:.1f}ms (첫 수집 {first * 1000:.1f}ms, 이후 거의 0)")
+
+    server = start_server(args.handshake)
+    try:
+        (legacy_s, legacy_c), (pooled_s, pooled_c) = bench_connections(server, args.crawls, args.workers,
+                                                                       args.requests)
+    finally:
+        server.shutdown()
+    print(f"[연결] 수집 {args.crawls}회 × 요청 {args.requests}회, 워커 {args.workers}개, 새 연결 비용 {args.handshake}초")
+    print(f"  스레드별 새 Http: {legacy_s:.2f}초, 새 연결 {legacy_c}개")
+    print(f"  공용 연결 풀:     {pooled_s:.2f}초, 새 연결 {pooled_c}개")
+
+
+if __name__ == "__main__":
+    main()
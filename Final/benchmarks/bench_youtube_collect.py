@@ -0,0 +1,81 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Final/ 모듈(youtube_collector, fake_youtube)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_youtube import FakeYouTubeServer, generate_fixture, load_fixture  # noqa: E402
+from youtube_collector import (  # noqa: E402
+    DEFAULT_COMMENT_WORKERS, iter_video_batches, make_youtube_client_factory, search_video_ids
+)
+from youtube_quota import QuotaLedger  # noqa: E402
+
+# ========================================
+# YouTube 수집 벤치마크 (가짜 API 서버 사용, 네트워크/API 키/할당량 불필요)
+# - 검색 → 영상 정보 → 영상별 댓글(+답글) 수집 전체 경로의 처리량을 워커 수별로 비교
+# - 응답 디스크 캐시는 끄고(매번 서버에 요청), 할당량 기록은 임시 폴더에 따로 남김
+#
+# 사용 예)
+#   python benchmarks/bench_youtube_collect.py --videos 200 --comments 300 --latency 0.05
+#   python benchmarks/bench_youtube_collect.py --fixture yt_fixture.json --workers 1,4,8,16 --replies
+# ========================================
+
+
+def collect(base_url, ledger, keyword, max_videos, max_comments, order, max_workers, include_replies):
+    """iter_youtube_batches와 같은 순서로 수집하고 (영상 수, 댓글 수, 수집 통계) 반환"""
+    client_factory = make_youtube_client_factory("bench", ledger, cache=False, api_root=base_url)
+    video_ids = search_video_ids(client_factory(), keyword, max_videos, order)
+    videos, comments, stats = 0, 0, {}
+    for event in iter_video_batches(client_factory, video_ids, max_comments, max_workers, include_replies):
+        if event[0] == "videos":
+            videos = len(event[1])
+        elif event[0] == "comments":
+            comments += len(event[2])
+        else:
+            stats = event[1]
+    return videos, comments, stats
+
+
+def report(label, seconds, videos, comments, requests, quota):
+    print(f"[{label}] {seconds:.2f}초 | 영상 {videos}개 ({videos / seconds:.1f}/s) | "
+          f"댓글 {comments}개 ({comments / seconds:.1f}/s) | 요청 {requests}회 | 할당량 {quota}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube 수집 처리량 벤치마크")
+    parser.add_argument("--fixture", help="픽스처 JSON (없으면 합성 데이터 생성)")
+    parser.add_argument("--videos", type=int, default=200, help="수집할 영상 수 (합성 데이터도 이만큼 생성)")
+    parser.add_argument("--comments", type=int, default=200, help="영상당 수집할 최상위 댓글 수")
+    parser.add_argument("--keyword", default="", help="검색어 (기본: 전체 영상)")
+    parser.add_argument("--order", default="relevance")
+    parser.add_argument("--replies", action="store_true", help="답글 포함 수집")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 서버의 요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--workers", default=f"1,{DEFAULT_COMMENT_WORKERS}", help="비교할 댓글 워커 수 (쉼표 구분)")
+    args = parser.parse_args()
+
+    fixture = load_fixture(args.fixture) if args.fixture else generate_fixture(args.videos, args.comments)
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    with FakeYouTubeServer(fixture, latency=args.latency, jitter=args.jitter, quota=10**9) as server, \
+            tempfile.TemporaryDirectory() as state_dir:
+        ledger = QuotaLedger(state_dir)  # 실제 할당량 기록(quota_state/)과 분리
+        print(f"가짜 서버 {server.base_url} | 영상 {len(fixture['videos'])}개 | 지연 {args.latency}초 | "
+              f"답글 {'포함' if args.replies else '제외'}")
+
+        for workers in worker_counts:
+            start_requests, start_quota = server.state.total_requests, server.state.quota_used
+            started = time.perf_counter()
+            videos, comments, stats = collect(server.base_url, ledger, args.keyword, args.videos, args.comments,
+                                              args.order, workers, args.replies)
+            report(f"워커 {workers}", time.perf_counter() - started, videos, comments,
+                   server.state.total_requests - start_requests, server.state.quota_used - start_quota)
+            print(f"  댓글 단계 {stats.get('comment_seconds', 0)}초 / 답글 {stats.get('replies', 0)}개 / "
+                  f"백오프 {stats.get('backoff_seconds', 0)}초")
+
+
+if __name__ == "__main__":
+    main()
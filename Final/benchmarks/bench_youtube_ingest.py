@@ -0,0 +1,121 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+# Final/ 모듈(youtube_collector, fake_youtube)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar import ColumnBatch  # noqa: E402
+from fake_youtube import FakeYouTubeState, generate_fixture, handle_comment_threads, handle_videos  # noqa: E402
+from youtube_collector import (  # noqa: E402
+    COMMENT_SCHEMA, attach_video_info, comment_thread_columns, concat_comments, video_to_dict
+)
+
+# ========================================
+# YouTube 댓글 적재 벤치마크 (네트워크 없음 - 가짜 서버의 응답 페이지를 메모리에서 바로 사용)
+# - 기존: 댓글마다 dict를 만들고 영상 제목/채널/URL을 복사 → 마지막에 pd.DataFrame(list of dict)
+# - 열 단위: 페이지마다 열 리스트로 모음 → 영상별 DataFrame → concat 후 영상 정보 merge 1회
+#
+# 사용 예)
+#   python benchmarks/bench_youtube_ingest.py --videos 500 --comments 1000
+# ========================================
+
+
+def legacy_comment_to_dict(item, video_id, video_info):
+    """기존 방식: 댓글마다 dict + 영상 정보 복사"""
+    top_comment = item["snippet"]["topLevelComment"]["snippet"]
+    return {
+        "comment_id": item["snippet"]["topLevelComment"]["id"],
+        "parent_id": None,
+        "video_id": video_id,
+        "author": top_comment["authorDisplayName"],
+        "text": top_comment["textDisplay"],
+        "like_count": top_comment["likeCount"],
+        "published_at": top_comment["publishedAt"],
+        "reply_count": item["snippet"]["totalReplyCount"],
+        "video_title": video_info["title"],
+        "video_channel": video_info["channel"],
+        "video_url": video_info["url"],
+    }
+
+
+def load_pages(state, video_ids):
+    """영상별 commentThreads 응답 페이지 (100개씩)"""
+    pages = {}
+    for video_id in video_ids:
+        pages[video_id], token = [], None
+        while True:
+            params = {"videoId": video_id, "maxResults": "100", "part": "snippet"}
+            if token:
+                params["pageToken"] = token
+            status, response = handle_comment_threads(state, params)
+            if status != 200:
+                break
+            pages[video_id].append(response["items"])
+            token = response.get("nextPageToken")
+            if not token:
+                break
+    return pages
+
+
+def ingest_legacy(videos_df, pages):
+    video_info = {row["video_id"]: row for _, row in videos_df.iterrows()}
+    comments = []
+    for video_id, video_pages in pages.items():
+        for items in video_pages:
+            comments.extend(legacy_comment_to_dict(item, video_id, video_info[video_id]) for item in items)
+    return pd.DataFrame(comments)
+
+
+def ingest_columnar(videos_df, pages):
+    frames = []
+    for video_id, video_pages in pages.items():
+        batch = ColumnBatch(COMMENT_SCHEMA)
+        for items in video_pages:
+            batch.add(comment_thread_columns(items, video_id))
+        frames.append(batch.to_frame())
+    return attach_video_info(concat_comments(frames), videos_df)
+
+
+def measure(label, func, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = result.memory_usage(deep=True).sum()
+    print(f"[{label}] {seconds:.2f}초 | 댓글 {len(result):,}개 ({len(result) / seconds:,.0f}/s) | "
+          f"최대 메모리 {peak / 2**20:.0f}MB | 결과 {size / 2**20:.0f}MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube 댓글 적재(dict vs 열 단위) 벤치마크")
+    parser.add_argument("--videos", type=int, default=300)
+    parser.add_argument("--comments", type=int, default=1000, help="영상당 최대 댓글 수")
+    args = parser.parse_args()
+
+    fixture = generate_fixture(args.videos, args.comments, max_replies=0, disabled_ratio=0)
+    state = FakeYouTubeState(fixture)
+    video_ids = [v["id"] for v in fixture["videos"]]
+    videos = []
+    for i in range(0, len(video_ids), 50):
+        _, response = handle_videos(state, {"id": ",".join(video_ids[i:i + 50]),
+                                            "part": "snippet,statistics,contentDetails"})
+        videos.extend(video_to_dict(item) for item in response["items"])
+    videos_df = pd.DataFrame(videos)
+    pages = load_pages(state, video_ids)
+    print(f"영상 {len(video_ids)}개 | 페이지 {sum(len(p) for p in pages.values()):,}개")
+
+    legacy = measure("기존 dict", ingest_legacy, videos_df, pages)
+    columnar = measure("열 단위", ingest_columnar, videos_df, pages)
+    assert legacy["comment_id"].tolist() == columnar["comment_id"].tolist()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+import threading
+import time
+from collections import Counter
+
+import pandas as pd
+
+from reddit_collector import (
+    DEFAULT_COMMENT_WORKERS, DEFAULT_MAX_WORKERS, DEFAULT_REQUESTS_PER_MINUTE,
+    RateLimitBudget, budget_stats, concat_posts, fetch_comments_parallel, iter_collect_subreddits,
+    make_client_factory, parse_subreddit_list
+)
+import youtube_collector
+from youtube_collector import (
+    MAX_SEARCH_RESULTS, attach_video_info, concat_comments, fetch_video_comments_parallel, fetch_video_details,
+    iter_search_pages, make_youtube_client_factory
+)
+
+# ========================================
+# 수집 결과 캐시 (정규화된 키 + 상위 집합 재사용)
+# - "kbeauty,AsianBeauty"와 "asianbeauty, kbeauty"는 같은 요청으로 취급
+# - 서브레딧/영상 단위로 보관하므로 일부만 겹치는 요청도 겹치는 부분은 재사용
+# - 더 작은 요청(post_limit, 댓글 수, 영상 수)은 캐시된 결과를 잘라서 반환
+# - 부족한 부분(새 서브레딧, 더 많은 게시물/댓글)만 API로 추가 수집
+# ========================================
+
+
+def normalize_query(query):
+    """검색어 정규화 (앞뒤/중복 공백 제거, 소문자) - Reddit/YouTube 검색은 대소문자를 구분하지 않음"""
+    return " ".join(str(query or "").split()).lower()
+
+
+def canonical_subreddits(subreddit_names):
+    """서브레딧 목록의 중복 제거 (대소문자 무시, 처음 입력한 표기와 순서 유지)"""
+    names = parse_subreddit_list(subreddit_names) if isinstance(subreddit_names, str) else subreddit_names
+    unique = {}
+    for name in names:
+        unique.setdefault(name.lower(), name)
+    return list(unique.values())
+
+
+def listing_key(subreddit_name, search_query, sort_by, time_filter):
+    """리스팅 캐시 키: get_listing이 실제로 같은 리스팅을 요청하는 조건은 같은 키가 되도록 정규화"""
+    query = normalize_query(search_query)
+    if query:
+        return (subreddit_name.lower(), "search", sort_by, time_filter, query)
+    if sort_by == 'new':
+        return (subreddit_name.lower(), "new", None, None, "")
+    if sort_by == 'top':
+        return (subreddit_name.lower(), "top", None, time_filter, "")
+    return (subreddit_name.lower(), "hot", None, None, "")  # 'rising' 등은 hot 리스팅으로 수집됨
+
+
+def reddit_request_key(subreddit_names, search_query, post_limit, sort_by, time_filter, collect_comments,
+                       comment_limit, comment_options=None):
+    """요청 전체를 나타내는 정규화된 키 (스트리밍 결과 캐시 등에서 사용)"""
+    subreddits = tuple(sorted(name.lower() for name in canonical_subreddits(subreddit_names)))
+    listings = tuple(listing_key("", search_query, sort_by, time_filter)[1:])
+    comments = (comment_limit, tuple(sorted((comment_options or {}).items()))) if collect_comments else None
+    return ("reddit", subreddits, listings, post_limit, comments)
+
+
+def youtube_request_key(keyword, max_videos, max_comments_per_video, order, include_replies=False):
+    return ("youtube", normalize_query(keyword), order, max_videos, max_comments_per_video, include_replies)
+
+
+def slice_comments(comments, max_comments, include_replies):
+    """댓글 DataFrame에서 최상위 댓글 max_comments개까지 (include_replies면 그 댓글들의 답글 포함)"""
+    is_top = comments["parent_id"].isna()
+    keep = is_top & (is_top.cumsum() <= max_comments)
+    if include_replies:
+        keep |= comments["parent_id"].isin(comments.loc[keep, "comment_id"])
+    return comments[keep]
+
+
+class RedditCollectionCache:
+    """서브레딧 단위 Reddit 수집 결과 캐시
+
+    - 리스팅: listing_key → 지금까지 받은 게시물(리스팅 순서)과 리스팅 끝에 도달했는지 여부
+      더 많은 게시물이 필요하면 마지막 게시물 다음(after)부터 부족분만 이어서 수집
+    - 댓글: (post_id, '더 보기' 펼침 횟수, 최대 깊이) → 받은 댓글과 당시 댓글 수 제한
+    """
+
+    def __init__(self):
+        self._listings = {}
+        self._comments = {}
+        self._lock = threading.Lock()
+
+    def _plan_listings(self, subreddits, search_query, post_limit, sort_by, time_filter):
+        """캐시로 부족한 서브레딧별 (추가로 받을 게시물 수, 이어서 받을 시작 지점)"""
+        limits, after = {}, {}
+        with self._lock:
+            for name in subreddits:
+                entry = self._listings.get(listing_key(name, search_query, sort_by, time_filter))
+                if entry is None:
+                    limits[name] = post_limit
+                elif len(entry["posts"]) < post_limit and not entry["complete"]:
+                    limits[name] = post_limit - len(entry["posts"])
+                    if not entry["posts"].empty:
+                        after[name] = f"t3_{entry['posts']['post_id'].iloc[-1]}"
+        return limits, after
+
+    def _store_listing(self, key, posts, requested):
+        with self._lock:
+            entry = self._listings.setdefault(key, {"posts": concat_posts([]), "complete": False})
+            new_posts = posts[~posts['post_id'].isin(entry["posts"]['post_id'])]
+            entry["posts"] = concat_posts([entry["posts"], new_posts])
+            # 요청한 수보다 적게 왔으면 리스팅 끝까지 받은 것
+            entry["complete"] = len(posts) < requested
+
+    def collect(self, credentials, subreddit_names, search_query, post_limit, sort_by, time_filter,
+                collect_comments, comment_limit, replace_more_limit=0, max_comment_depth=None,
+                max_comment_requests=None, max_workers=DEFAULT_MAX_WORKERS,
+                requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, comment_workers=DEFAULT_COMMENT_WORKERS,
+                on_fetch=None):
+        """collect_subreddits_parallel과 같은 (게시물 df, 댓글 df 또는 None, 통계)를 반환
+
+        on_fetch(posts_df, comments_df): 새로 API에서 받은 행만 넘겨받는 콜백 (저장소 반영용)
+        """
+        started = time.perf_counter()
+        subreddits = canonical_subreddits(subreddit_names)
+        budget = RateLimitBudget(requests_per_minute)
+        client_factory = make_client_factory(credentials, budget)
+
+        # 1단계: 캐시에 없는 서브레딧 / 부족한 게시물만 수집
+        limits, after = self._plan_listings(subreddits, search_query, post_limit, sort_by, time_filter)
+        timings, uncached_posts, fetched_posts = {}, {}, []
+        if limits:
+            for event in iter_collect_subreddits(
+                credentials, list(limits), search_query, post_limit, sort_by, time_filter, False, 0,
+                max_workers=max_workers, budget=budget, post_limits=limits, resume_after=after
+            ):
+                if event[0] != "posts":
+                    continue
+                _, name, posts, timing = event
+                fetched_posts.append(posts)
+                timings[name] = dict(timing, 상태="캐시+추가 수집" if name in after and timing['상태'] == "성공"
+                                     else timing['상태'])
+                if timing['상태'] == "성공":
+                    self._store_listing(listing_key(name, search_query, sort_by, time_filter), posts, limits[name])
+                else:
+                    uncached_posts[name] = posts  # 실패한 서브레딧은 캐시하지 않고 이번 결과에만 포함
+        fetched_posts = concat_posts(fetched_posts)
+        listing_seconds = round(time.perf_counter() - started, 2)
+
+        result_posts = []
+        with self._lock:
+            for name in subreddits:
+                entry = self._listings.get(listing_key(name, search_query, sort_by, time_filter))
+                if entry and name not in uncached_posts:
+                    posts = entry["posts"].head(post_limit)
+                else:
+                    posts = uncached_posts.get(name, concat_posts([]))
+                result_posts.append(posts)
+                timings.setdefault(name, {'서브레딧': name, '게시물_수': len(posts), '기존_게시물_건너뜀': 0,
+                                          '소요_시간(초)': 0.0, '상태': "캐시"})
+                timings[name]['게시물_수'] = len(posts)
+        result_posts = concat_posts(result_posts)
+
+        # 2단계: 댓글 - 캐시된 댓글 수 제한이 모자란 게시물만 수집
+        stats = {'listing_seconds': listing_seconds}
+        fetched_comments = None
+        result_comments = []
+        if collect_comments and comment_limit > 0:
+            options_key = (replace_more_limit, max_comment_depth)
+            with self._lock:
+                cached_ids = {post_id for (post_id, key), cached in self._comments.items()
+                              if key == options_key and cached["limit"] >= comment_limit}
+            targets = result_posts[(result_posts['num_comments'] > 0) & ~result_posts['post_id'].isin(cached_ids)]
+            comment_stats = {'comment_posts': 0, 'truncated_posts': 0, 'budget_skipped_posts': 0,
+                             'failed_posts': 0, 'comment_requests': 0, 'comment_seconds': 0.0}
+            if not targets.empty:
+                fetched_comments, comment_stats = fetch_comments_parallel(
+                    client_factory, budget, targets, comment_limit, replace_more_limit, max_comment_depth,
+                    max_comment_requests, comment_workers
+                )
+                with self._lock:
+                    # 댓글을 하나도 못 받은 게시물(요청 한도로 건너뜀/오류 등)은 다음에 다시 시도하도록 캐시하지 않음
+                    for post_id, comments in fetched_comments.groupby('post_id', sort=False):
+                        self._comments[(post_id, options_key)] = {"limit": comment_limit, "comments": comments}
+            stats.update(comment_stats)
+
+            with self._lock:
+                for post_id in result_posts['post_id']:
+                    cached = self._comments.get((post_id, options_key))
+                    if cached:
+                        result_comments.append(cached["comments"].head(comment_limit))
+        result_comments = pd.concat(result_comments, ignore_index=True) if result_comments else None
+        if fetched_comments is not None and fetched_comments.empty:
+            fetched_comments = None
+
+        if on_fetch is not None and (not fetched_posts.empty or fetched_comments is not None):
+            on_fetch(fetched_posts, fetched_comments)
+
+        comment_counts = Counter()
+        if result_comments is not None:
+            by_subreddit = result_comments['subreddit'].str.lower().value_counts()
+            comment_counts.update({name: int(by_subreddit.get(name.lower(), 0)) for name in subreddits})
+        timing_df = pd.DataFrame([timings[name] for name in subreddits])
+        if not timing_df.empty:
+            timing_df = timing_df[['서브레딧', '게시물_수', '기존_게시물_건너뜀', '소요_시간(초)', '상태']]
+            timing_df.insert(2, '댓글_수', timing_df['서브레딧'].map(comment_counts).fillna(0).astype(int))
+
+        stats.update(budget_stats(budget))
+        stats.update({
+            'timing': timing_df,
+            'total_seconds': round(time.perf_counter() - started, 2),
+            'dropped_subreddits': sum(t['상태'] not in ("성공", "캐시", "캐시+추가 수집") for t in timings.values()),
+            'cached_posts': len(result_posts) - len(fetched_posts),
+            'cached_comments': (0 if result_comments is None else len(result_comments))
+                               - (0 if fetched_comments is None else len(fetched_comments)),
+        })
+        return result_posts, result_comments, stats
+
+
+class YouTubeCollectionCache:
+    """YouTube 수집 결과 캐시
+
+    - 검색: (정규화된 키워드, 정렬) → 영상 ID 목록과 다음 페이지 토큰
+      (더 적은 영상 수 요청은 앞부분만 사용, 더 많은 요청은 다음 페이지부터 이어서 검색)
+    - 영상 정보: video_id → 상세 정보 (검색 조건이 달라도 같은 영상이면 재사용)
+    - 댓글: video_id → 받은 댓글(영상 정보 없는 DataFrame)과 당시 댓글 수 제한, 답글 포함 여부
+      (최상위 댓글이 제한보다 적게 왔으면 전체를 받은 것으로 봄, 답글 포함 캐시는 답글 없는 요청에도 사용)
+    """
+
+    def __init__(self):
+        self._searches = {}
+        self._videos = {}
+        self._comments = {}
+        self._lock = threading.Lock()
+
+    def collect(self, api_key, keyword, max_videos, max_comments_per_video, order, on_fetch=None,
+                max_workers=youtube_collector.DEFAULT_COMMENT_WORKERS, include_replies=False):
+        """search_and_collect_data와 같은 (영상 df, 댓글 df, 통계)를 반환
+
+        on_fetch(videos_df, comments_df): 새로 API에서 받은 행만 넘겨받는 콜백 (저장소 반영용)
+        """
+        client_factory = None
+
+        def get_client_factory():
+            # 캐시로 모두 처리되면 클라이언트를 만들지 않음
+            nonlocal client_factory
+            if client_factory is None:
+                client_factory = make_youtube_client_factory(api_key)
+            return client_factory
+
+        def client():
+            return get_client_factory()()
+
+        max_videos = min(max_videos, MAX_SEARCH_RESULTS)
+        search_key = (normalize_query(keyword), order)
+        with self._lock:
+            entry = dict(self._searches.get(search_key) or {"video_ids": [], "next_page_token": None,
+                                                            "complete": False})
+        # 캐시된 검색 결과가 모자라면 마지막으로 받은 다음 페이지 토큰부터 이어서 검색
+        if len(entry["video_ids"]) < max_videos and not entry["complete"]:
+            video_ids, seen = list(entry["video_ids"]), set(entry["video_ids"])
+            entry["complete"] = True
+            for page_ids, next_page_token in iter_search_pages(client(), keyword, order, entry["next_page_token"]):
+                new_ids = [v for v in page_ids if v not in seen]
+                seen.update(new_ids)
+                video_ids.extend(new_ids)
+                entry["next_page_token"] = next_page_token
+                if not new_ids:
+                    break
+                if len(video_ids) >= max_videos:
+                    entry["complete"] = next_page_token is None
+                    break
+            entry["video_ids"] = video_ids
+            with self._lock:
+                self._searches[search_key] = entry
+        video_ids = entry["video_ids"][:max_videos]
+
+        with self._lock:
+            missing = [v for v in video_ids if v not in self._videos]
+        fetched_videos = fetch_video_details(client(), missing) if missing else []
+        with self._lock:
+            self._videos.update((v['video_id'], v) for v in fetched_videos)
+            videos = [self._videos[v] for v in video_ids if v in self._videos]
+
+        # 캐시된 댓글 수 제한이 모자라고 아직 끝까지 받지 않은 영상(답글이 필요하면 답글 없이 받은 영상 포함)만 동시에 수집
+        def covered(entry):
+            if include_replies and not entry["replies"]:
+                return False
+            top_level = int(entry["comments"]["parent_id"].isna().sum())
+            return entry["limit"] >= max_comments_per_video or top_level < entry["limit"]
+
+        with self._lock:
+            missing = [v for v in video_ids if not (v in self._comments and covered(self._comments[v]))]
+        by_video, stats = {}, {}
+        if missing:
+            by_video, stats = fetch_video_comments_parallel(get_client_factory(), missing, max_comments_per_video,
+                                                            max_workers, include_replies)
+            partial = set(stats.get('partial_videos', ()))
+            with self._lock:
+                # 할당량 소진으로 잘린 영상은 끝까지 받은 것으로 오인하지 않도록 캐시하지 않음
+                for video_id, comments in by_video.items():
+                    if not comments.empty and video_id not in partial:
+                        self._comments[video_id] = {"limit": max_comments_per_video, "comments": comments,
+                                                    "replies": include_replies}
+
+        result_frames = []
+        with self._lock:
+            for video_id in video_ids:
+                if video_id in by_video:
+                    result_frames.append(by_video[video_id])
+                elif video_id in self._comments:
+                    result_frames.append(slice_comments(self._comments[video_id]["comments"],
+                                                        max_comments_per_video, include_replies))
+        # 영상 정보는 댓글을 모두 모은 뒤 한 번만 붙임
+        videos_df = pd.DataFrame(videos)
+        result_comments = attach_video_info(concat_comments(result_frames), videos_df)
+        fetched_comments = attach_video_info(concat_comments(by_video.values()), videos_df)
+
+        if on_fetch is not None and (fetched_videos or not fetched_comments.empty):
+            on_fetch(pd.DataFrame(fetched_videos), fetched_comments)
+        stats['cached_comments'] = len(result_comments) - len(fetched_comments)
+        return videos_df, result_comments, stats
@@ -0,0 +1,55 @@
+import pandas as pd
+
+# ========================================
+# 열(column) 단위 수집 배치
+# - API 응답 페이지를 행마다 dict를 만들지 않고 열 이름 → 값 리스트로 바로 모음
+# - 스키마(열 이름: dtype, None이면 pandas가 추론)대로 한 번에 DataFrame으로 변환 → 빈 결과도 같은 열 유지
+# - 영상 제목 같은 부모 정보는 행마다 복사하지 않고 마지막에 merge로 한 번만 붙임
+# ========================================
+
+
+class ColumnBatch:
+    """스키마의 열마다 값 리스트를 모아 두는 배치"""
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.columns = {name: [] for name in schema}
+        self.rows = 0
+
+    def add(self, columns):
+        """열 dict(열 이름 → 같은 길이의 값 리스트) 하나를 이어 붙임"""
+        count = len(next(iter(columns.values()))) if columns else 0
+        for name in self.schema:
+            self.columns[name].extend(columns[name])
+        self.rows += count
+
+    def __len__(self):
+        return self.rows
+
+    def to_frame(self):
+        return typed_frame(self.columns, self.schema)
+
+
+def typed_frame(columns, schema):
+    """열 dict → 스키마 순서/타입의 DataFrame"""
+    return pd.DataFrame({name: pd.Series(columns[name], dtype=dtype) for name, dtype in schema.items()})
+
+
+def empty_frame(schema):
+    return typed_frame({name: [] for name in schema}, schema)
+
+
+def concat_frames(frames, schema):
+    """배치 DataFrame들을 하나로 (없으면 스키마만 있는 빈 DataFrame)"""
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+    if not frames:
+        return empty_frame(schema)
+    return pd.concat(frames, ignore_index=True)
+
+
+def join_parent(frame, parents, key, columns):
+    """부모 정보를 key로 한 번에 붙임 (columns: {부모 열: 붙일 열 이름}, 부모가 없는 행은 NaN)"""
+    if frame.empty or parents is None or parents.empty:
+        return frame
+    lookup = parents[[key] + list(columns)].drop_duplicates(key).rename(columns=columns)
+    return frame.merge(lookup, on=key, how="left", validate="many_to_one")
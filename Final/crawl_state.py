@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+
+import pandas as pd
+
+# ========================================
+# 증분 수집 상태(high-water mark) 저장 모듈
+# - 수집 키별로 지금까지 본 가장 최신 항목(생성 시각, ID)을 JSON 파일에 기록
+# - 다음 수집 때 이 지점에 도달하면 페이지 넘김을 멈춤
+# ========================================
+
+STATE_DIR = "crawl_state"
+
+
+def make_state_key(*parts):
+    """수집 키 구성요소를 하나의 문자열 키로 변환 (대소문자/공백 정규화)"""
+    return "|".join(str(p or "").strip().lower() for p in parts)
+
+
+class WatermarkStore:
+    """수집 키별 최신 항목 기록을 JSON 파일로 보관"""
+
+    def __init__(self, name, state_dir=STATE_DIR):
+        os.makedirs(state_dir, exist_ok=True)
+        self.path = os.path.join(state_dir, f"{name}_watermarks.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._marks = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._marks = {}
+
+    def get(self, key):
+        with self._lock:
+            return self._marks.get(key)
+
+    def update(self, key, created, item_id):
+        """기존 기록보다 새로운 항목일 때만 갱신"""
+        if created is None:
+            return
+        with self._lock:
+            current = self._marks.get(key)
+            if current is None or created > current["created"]:
+                self._marks[key] = {"created": created, "id": item_id}
+
+    def commit(self, updates):
+        """수집 결과를 저장한 뒤 호출 - 대기 중인 갱신({키: {"created", "id"}})을 반영하고 파일에 기록"""
+        for key, mark in (updates or {}).items():
+            self.update(key, mark["created"], mark["id"])
+        self.save()
+
+    def keys(self, prefix=""):
+        with self._lock:
+            return [key for key in self._marks if key.startswith(prefix)]
+
+    def reset(self, key=None):
+        with self._lock:
+            if key is None:
+                self._marks = {}
+            else:
+                self._marks.pop(key, None)
+
+    def save(self):
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._marks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def is_known(created, item_id, watermark):
+    """워터마크 시점 이전(또는 동일 항목)이면 이미 수집한 항목으로 판단"""
+    if watermark is None or created is None:
+        return False
+    if created < watermark["created"]:
+        return True
+    return created == watermark["created"] and item_id == watermark["id"]
+
+
+def merge_new_rows(existing_df, new_df, key_column):
+    """기존 데이터셋에 새 행을 합치고 자연 키 기준으로 중복 제거 (새 값 우선)"""
+    if new_df is None or new_df.empty:
+        return existing_df
+    if existing_df is None or existing_df.empty or key_column not in existing_df.columns:
+        return new_df.reset_index(drop=True)
+    merged = pd.concat([existing_df, new_df], ignore_index=True)
+    return merged.drop_duplicates(subset=[key_column], keep="last").reset_index(drop=True)
@@ -0,0 +1,205 @@
+import os
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from process_util import pid_alive
+
+# ========================================
+# 수집 원본 저장소 (압축 Parquet, 소스/날짜 파티션)
+# - 구조: data_store/{source}/{table}/date=YYYY-MM-DD/data.parquet
+# - 파티션 날짜는 항목 자체의 작성일 → 같은 자연 키는 항상 같은 파티션에 저장됨
+# - 자연 키(post_id, comment_id, video_id / 스냅샷은 video_id+ts) 기준 upsert (새 값 우선)
+# ========================================
+
+DATA_DIR = "data_store"
+COMPRESSION = "zstd"
+
+# (source, table) -> 자연 키 / 파티션 날짜 컬럼
+# sort_by: 파티션 안의 행 정렬 (같은 영상의 시계열이 붙어 있어 압축/필터가 잘 됨)
+# collected_at: False면 수집 시각 컬럼을 붙이지 않음 (시각이 키에 이미 있는 시계열)
+TABLES = {
+    ("reddit", "posts"): {"key": "post_id", "date_column": "created_utc"},
+    ("reddit", "comments"): {"key": "comment_id", "date_column": "created_utc"},
+    ("youtube", "videos"): {"key": "video_id", "date_column": "published_at"},
+    ("youtube", "comments"): {"key": "comment_id", "date_column": "published_at"},
+    ("youtube", "video_stats"): {"key": ["video_id", "ts"], "date_column": "ts", "sort_by": ["video_id", "ts"],
+                                 "collected_at": False},
+}
+
+# 저장 전에 맞춰 둘 컬럼 타입 (CSV와 달리 다시 파싱할 필요가 없도록)
+COLUMN_TYPES = {
+    "score": "int64",
+    "num_comments": "int64",
+    "upvote_ratio": "float64",
+    "created_utc": "float64",
+    "view_count": "int64",
+    "like_count": "int64",
+    "comment_count": "int64",
+    "reply_count": "int64",
+}
+
+LOCK_TIMEOUT = 30
+
+
+class StoreLock:
+    """테이블 단위 잠금 파일 (페이지와 배치 작업이 동시에 쓰는 경우 대비)
+
+    잠금 파일에 보유 프로세스의 pid를 기록하고, 그 프로세스가 종료된 경우에만 잠금을 끊는다.
+    (쓰기가 오래 걸려도 살아 있는 프로세스의 잠금은 끊지 않음)
+    """
+
+    def __init__(self, table_dir):
+        self.path = os.path.join(table_dir, ".lock")
+
+    def _holder(self):
+        """잠금을 가진 프로세스의 pid (아직 기록 전이거나 pid가 없는 예전 잠금 파일이면 0)"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _is_stale(self):
+        pid = self._holder()
+        if pid:
+            return not pid_alive(pid)
+        # pid가 없으면 예전처럼 수정 시각으로 판단 (생성 직후 pid를 쓰기 전인 잠금은 제외됨)
+        return time.time() - os.path.getmtime(self.path) > LOCK_TIMEOUT
+
+    def __enter__(self):
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                try:
+                    os.write(fd, str(os.getpid()).encode("ascii"))
+                finally:
+                    os.close(fd)
+                return self
+            except FileExistsError:
+                # 비정상 종료로 남은 잠금 파일(보유 프로세스가 없음)은 제거
+                try:
+                    if self._is_stale():
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"저장소 잠금 대기 시간 초과: {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def table_dir(source, table, data_dir=DATA_DIR):
+    return os.path.join(data_dir, source, table)
+
+
+def partition_dates(df, date_column):
+    """항목 작성일(UTC)을 'YYYY-MM-DD' 문자열로 변환"""
+    values = df[date_column]
+    if pd.api.types.is_numeric_dtype(values):
+        dates = pd.to_datetime(values, unit="s", utc=True, errors="coerce")
+    else:
+        dates = pd.to_datetime(values, utc=True, errors="coerce")
+    return dates.dt.strftime("%Y-%m-%d").fillna("unknown")
+
+
+def normalize_types(df):
+    df = df.copy()
+    for column, dtype in COLUMN_TYPES.items():
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0).astype(dtype)
+    if "published_at" in df.columns:
+        df["published_at"] = pd.to_datetime(df["published_at"], utc=True, errors="coerce")
+    return df
+
+
+def upsert(source, table, df, data_dir=DATA_DIR):
+    """수집 결과를 파티션별로 병합 저장하고 새로 추가/갱신된 행 수를 반환"""
+    if df is None or df.empty:
+        return 0
+    spec = TABLES[(source, table)]
+    keys = spec["key"] if isinstance(spec["key"], list) else [spec["key"]]
+
+    df = normalize_types(df)
+    if spec.get("collected_at", True):
+        df["collected_at"] = pd.Timestamp(datetime.now(timezone.utc))
+    df = df.drop_duplicates(subset=keys, keep="last")
+    dates = partition_dates(df, spec["date_column"])
+
+    base_dir = table_dir(source, table, data_dir)
+    os.makedirs(base_dir, exist_ok=True)
+
+    with StoreLock(base_dir):
+        for date, part in df.groupby(dates, sort=False):
+            part_dir = os.path.join(base_dir, f"date={date}")
+            os.makedirs(part_dir, exist_ok=True)
+            part_path = os.path.join(part_dir, "data.parquet")
+
+            if os.path.exists(part_path):
+                existing = pd.read_parquet(part_path)
+                part = pd.concat([existing, part], ignore_index=True)
+                part = part.drop_duplicates(subset=keys, keep="last")
+            if spec.get("sort_by"):
+                part = part.sort_values(spec["sort_by"])
+
+            tmp_path = part_path + ".tmp"
+            part.reset_index(drop=True).to_parquet(tmp_path, index=False, compression=COMPRESSION)
+            os.replace(tmp_path, part_path)
+
+    return len(df)
+
+
+def list_partitions(source, table, data_dir=DATA_DIR):
+    """저장된 날짜 파티션 목록 (오름차순)"""
+    base_dir = table_dir(source, table, data_dir)
+    if not os.path.isdir(base_dir):
+        return []
+    return sorted(name.split("=", 1)[1] for name in os.listdir(base_dir) if name.startswith("date="))
+
+
+def load(source, table, columns=None, start_date=None, end_date=None, filters=None, data_dir=DATA_DIR):
+    """저장소에서 필요한 컬럼/기간만 읽기
+
+    start_date, end_date: 'YYYY-MM-DD' (포함). 해당 범위 밖의 파티션 파일은 열지 않는다.
+    filters: pyarrow 필터 목록 (예: [("subreddit", "in", ["kbeauty"])]) - 행 그룹 단위로 건너뜀
+    """
+    base_dir = table_dir(source, table, data_dir)
+    dates = [d for d in list_partitions(source, table, data_dir)
+             if (start_date is None or d >= str(start_date)) and (end_date is None or d <= str(end_date))]
+    if not dates:
+        return pd.DataFrame(columns=columns or [])
+
+    paths = [os.path.join(base_dir, f"date={d}", "data.parquet") for d in dates]
+    paths = [p for p in paths if os.path.exists(p)]
+    if not paths:
+        return pd.DataFrame(columns=columns or [])
+
+    # 파티션 목록을 직접 지정하므로 범위 밖 파일은 열리지 않고, 컬럼은 필요한 것만 읽음
+    # (수집 시점에 따라 파티션마다 컬럼 구성이 다를 수 있어 파일별로 읽은 뒤 합침)
+    frames = []
+    for path in paths:
+        file_columns = pq.read_schema(path).names
+        read_columns = [c for c in columns if c in file_columns] if columns else None
+        frames.append(pq.read_table(path, columns=read_columns, filters=filters).to_pandas())
+    df = pd.concat(frames, ignore_index=True)
+    if columns:
+        df = df.reindex(columns=columns)
+    return df
+
+
+def available_columns(source, table, data_dir=DATA_DIR):
+    """가장 최근 파티션의 스키마에서 컬럼 목록 조회 (데이터는 읽지 않음)"""
+    dates = list_partitions(source, table, data_dir)
+    if not dates:
+        return []
+    path = os.path.join(table_dir(source, table, data_dir), f"date={dates[-1]}", "data.parquet")
+    return pq.read_schema(path).names
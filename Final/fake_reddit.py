@@ -0,0 +1,469 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from reddit_collector import BudgetedRequestor
+
+# ========================================
+# 오프라인용 가짜 Reddit API 서버 (녹화/재생)
+# - 녹화한(또는 생성한) 게시물/댓글 트리 픽스처를 Reddit OAuth API 형식으로 제공
+# - 응답 지연, x-ratelimit-* 헤더, 429 응답을 설정으로 재현
+# - 수집기는 secrets.toml의 [reddit] base_url 로 이 서버를 가리키면 됨
+#
+# 사용 예)
+#   python fake_reddit.py generate --out fixture.json --subreddits kbeauty,AsianBeauty --posts 500 --comments 20
+#   python fake_reddit.py serve --fixture fixture.json --port 8765 --latency 0.05
+#   python fake_reddit.py record --out fixture.json --subreddits kbeauty --posts 100 --comments 20
+# ========================================
+
+DEFAULT_PORT = 8765
+
+SAMPLE_WORDS = [
+    "serum", "toner", "cream", "sunscreen", "cushion", "essence", "ampoule", "moisturizer",
+    "dry", "oily", "sensitive", "skin", "routine", "texture", "price", "hydrating", "glow",
+    "good", "great", "love", "best", "bad", "worst", "not", "really", "dalba", "cosrx",
+    "세럼", "토너", "크림", "선크림", "좋다", "최고", "별로", "보습", "피부", "추천",
+]
+
+
+# ========================================
+# 픽스처 생성 / 녹화
+# ========================================
+
+def _sentence(rng, min_words=5, max_words=25):
+    return " ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def generate_fixture(subreddits, posts_per_subreddit=100, comments_per_post=20, seed=42):
+    """벤치마크용 합성 픽스처 생성 (게시물 + 댓글 트리)"""
+    rng = random.Random(seed)
+    now = int(time.time())
+    fixture = {"subreddits": {}, "comments": {}}
+    counter = 0
+
+    for name in subreddits:
+        posts = []
+        for _ in range(posts_per_subreddit):
+            counter += 1
+            post_id = f"p{counter:07x}"
+            num_comments = rng.randint(0, comments_per_post) if comments_per_post else 0
+            posts.append({
+                "id": post_id, "name": f"t3_{post_id}", "subreddit": name,
+                "title": _sentence(rng, 4, 12), "selftext": _sentence(rng),
+                "author": f"user{rng.randint(1, 5000)}", "score": rng.randint(0, 3000),
+                "upvote_ratio": round(rng.uniform(0.5, 1.0), 2), "num_comments": num_comments,
+                "created_utc": float(now - counter * 60), "url": f"https://reddit.com/r/{name}/comments/{post_id}/",
+                "permalink": f"/r/{name}/comments/{post_id}/",
+            })
+
+            # 최상위 댓글과 1단계 답글로 구성된 트리
+            tree = []
+            for c in range(num_comments):
+                comment = {
+                    "id": f"{post_id}c{c:04x}", "body": _sentence(rng, 3, 30),
+                    "author": f"user{rng.randint(1, 5000)}", "score": rng.randint(-5, 500),
+                    "created_utc": float(now - counter * 60 + c), "replies": [],
+                }
+                if tree and rng.random() < 0.3:
+                    tree[-1]["replies"].append(comment)
+                else:
+                    tree.append(comment)
+            fixture["comments"][post_id] = tree
+        fixture["subreddits"][name] = {"posts": posts}
+    return fixture
+
+
+class FixtureRecorder:
+    """실제 Reddit 응답을 가로채 픽스처 형식으로 모아 두는 녹화기 (RecordingRequestor와 함께 사용)"""
+
+    def __init__(self):
+        self.fixture = {"subreddits": {}, "comments": {}}
+        self._lock = threading.Lock()
+
+    def _add_post(self, data):
+        keep = ("id", "name", "subreddit", "title", "selftext", "author", "score", "upvote_ratio",
+                "num_comments", "created_utc", "url", "permalink")
+        post = {k: data.get(k) for k in keep}
+        posts = self.fixture["subreddits"].setdefault(post["subreddit"], {"posts": []})["posts"]
+        if all(p["id"] != post["id"] for p in posts):
+            posts.append(post)
+
+    @staticmethod
+    def _convert_tree(children):
+        tree = []
+        for child in children:
+            if child.get("kind") != "t1":
+                continue
+            data = child["data"]
+            replies = data.get("replies")
+            tree.append({
+                "id": data["id"], "body": data.get("body"), "author": data.get("author"),
+                "score": data.get("score", 0), "created_utc": data.get("created_utc"),
+                "replies": FixtureRecorder._convert_tree(replies["data"]["children"]) if replies else [],
+            })
+        return tree
+
+    def observe(self, payload):
+        with self._lock:
+            if isinstance(payload, dict) and payload.get("kind") == "Listing":
+                for child in payload["data"]["children"]:
+                    if child.get("kind") == "t3":
+                        self._add_post(child["data"])
+            elif isinstance(payload, list) and len(payload) == 2:
+                submission = payload[0]["data"]["children"][0]["data"]
+                self._add_post(submission)
+                self.fixture["comments"][submission["id"]] = self._convert_tree(payload[1]["data"]["children"])
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.fixture, f, ensure_ascii=False)
+
+
+class RecordingRequestor(BudgetedRequestor):
+    """응답 JSON을 FixtureRecorder에 넘기는 Requestor"""
+
+    def __init__(self, *, recorder=None, **kwargs):
+        super().__init__(**kwargs)
+        self.recorder = recorder
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        if self.recorder is not None and response.status_code == 200:
+            try:
+                self.recorder.observe(response.json())
+            except ValueError:
+                pass
+        return response
+
+
+# ========================================
+# 가짜 API 서버
+# ========================================
+
+class FakeRedditState:
+    """픽스처와 서버 설정(지연, 요청 한도)을 보관하고 요청 수를 집계"""
+
+    def __init__(self, fixture, latency=0.0, jitter=0.0, rate_limit=1000, rate_window=600):
+        self.fixture = fixture
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.window_started = time.time()
+        self.used = 0
+        self.total_requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._posts_by_id = {
+            post["id"]: post
+            for sub in fixture["subreddits"].values() for post in sub["posts"]
+        }
+        self._subreddits = {name.lower(): name for name in fixture["subreddits"]}
+
+    def take_request(self):
+        """요청 1회를 집계하고 (허용 여부, 레이트 리밋 헤더) 반환"""
+        with self._lock:
+            now = time.time()
+            if now - self.window_started >= self.rate_window:
+                self.window_started = now
+                self.used = 0
+            self.total_requests += 1
+            self.used += 1
+            allowed = self.used <= self.rate_limit
+            if not allowed:
+                self.throttled += 1
+            reset = max(0, int(self.window_started + self.rate_window - now))
+            headers = {
+                "x-ratelimit-remaining": str(float(max(0, self.rate_limit - self.used))),
+                "x-ratelimit-used": str(self.used),
+                "x-ratelimit-reset": str(reset),
+            }
+            return allowed, headers
+
+    def subreddit_posts(self, name):
+        real_name = self._subreddits.get(name.lower())
+        if real_name is None:
+            return None, None
+        return real_name, self.fixture["subreddits"][real_name]["posts"]
+
+    def post(self, post_id):
+        return self._posts_by_id.get(post_id)
+
+
+def _t3(post):
+    return {"kind": "t3", "data": dict(post)}
+
+
+def _t1(comment, post_id, parent_fullname, depth):
+    data = {k: v for k, v in comment.items() if k != "replies"}
+    data.update({
+        "name": f"t1_{comment['id']}", "link_id": f"t3_{post_id}", "parent_id": parent_fullname,
+        "depth": depth, "replies": "",
+    })
+    if comment.get("replies"):
+        data["replies"] = {"kind": "Listing", "data": {"after": None, "before": None, "children": [
+            _t1(reply, post_id, data["name"], depth + 1) for reply in comment["replies"]
+        ]}}
+    return {"kind": "t1", "data": data}
+
+
+def _count_tree(comments):
+    return sum(1 + _count_tree(c.get("replies", [])) for c in comments)
+
+
+def _listing(children, after=None):
+    return {"kind": "Listing", "data": {"after": after, "before": None, "dist": len(children), "children": children}}
+
+
+class FakeRedditHandler(BaseHTTPRequestHandler):
+    server_version = "FakeReddit/1.0"
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문이 나뉘어 전송될 때 생기는 지연(약 40ms) 방지
+
+    def log_message(self, format, *args):
+        pass  # 벤치마크 출력이 섞이지 않도록 접근 로그 생략
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _params(self):
+        parsed = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        if self.command == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode("utf-8") if length else ""
+            params.update({k: v[-1] for k, v in parse_qs(body).items()})
+        return parsed.path.rstrip("/"), params
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        path, params = self._params()
+
+        if path == "/api/v1/access_token":
+            self._send(200, {"access_token": "fake-token", "token_type": "bearer", "expires_in": 86400, "scope": "*"})
+            return
+
+        delay = self.state.latency + (random.uniform(0, self.state.jitter) if self.state.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        allowed, headers = self.state.take_request()
+        if not allowed:
+            self._send(429, {"message": "Too Many Requests", "error": 429}, headers)
+            return
+
+        for pattern, handler in ROUTES:
+            match = pattern.fullmatch(path)
+            if match:
+                status, payload = handler(self.state, params, *match.groups())
+                self._send(status, payload, headers)
+                return
+        self._send(404, {"message": "Not Found", "error": 404}, headers)
+
+
+def handle_about(state, params, name):
+    real_name, _ = state.subreddit_posts(name)
+    if real_name is None:
+        return 404, {"message": "Not Found", "error": 404}
+    return 200, {"kind": "t5", "data": {"display_name": real_name, "title": f"r/{real_name}", "name": f"t5_{real_name.lower()}"}}
+
+
+def handle_listing(state, params, name, sort):
+    real_name, posts = state.subreddit_posts(name)
+    if real_name is None:
+        return 404, {"message": "Not Found", "error": 404}
+
+    sort = params.get("sort", sort) if sort == "search" else sort
+    if sort == "search" or "q" in params:
+        terms = params.get("q", "").lower().split()
+        posts = [p for p in posts if any(t in (p["title"] + " " + p["selftext"]).lower() for t in terms)]
+        sort = params.get("sort", "relevance")
+    if sort == "new":
+        posts = sorted(posts, key=lambda p: p["created_utc"], reverse=True)
+    elif sort == "top":
+        posts = sorted(posts, key=lambda p: p["score"], reverse=True)
+
+    limit = min(int(params.get("limit", 25)), 100)
+    start = 0
+    after = params.get("after")
+    if after:
+        names = [p["name"] for p in posts]
+        start = names.index(after) + 1 if after in names else len(posts)
+    page = posts[start:start + limit]
+    next_after = page[-1]["name"] if page and start + limit < len(posts) else None
+    return 200, _listing([_t3(p) for p in page], next_after)
+
+
+def handle_comments(state, params, post_id):
+    post = state.post(post_id)
+    if post is None:
+        return 404, {"message": "Not Found", "error": 404}
+    tree = state.fixture["comments"].get(post_id, [])
+    limit = int(params.get("limit", 200))
+
+    # limit 개수만큼만 내려주고 나머지 최상위 댓글은 'more' 객체로 대체
+    children, used = [], 0
+    for index, comment in enumerate(tree):
+        size = 1 + _count_tree(comment.get("replies", []))
+        if used + size > limit and children:
+            rest = tree[index:]
+            children.append({"kind": "more", "data": {
+                "count": _count_tree(rest), "name": f"t1_{rest[0]['id']}", "id": rest[0]["id"],
+                "parent_id": f"t3_{post_id}", "depth": 0, "children": [c["id"] for c in rest],
+            }})
+            break
+        children.append(_t1(comment, post_id, f"t3_{post_id}", 0))
+        used += size
+    return 200, [_listing([_t3(post)]), _listing(children)]
+
+
+def handle_morechildren(state, params):
+    post_id = params.get("link_id", "").split("_", 1)[-1]
+    wanted = set(filter(None, params.get("children", "").split(",")))
+    things = []
+
+    def walk(comments, parent_fullname, depth, include):
+        for comment in comments:
+            hit = include or comment["id"] in wanted
+            if hit:
+                item = _t1(comment, post_id, parent_fullname, depth)
+                item["data"]["replies"] = ""
+                things.append(item)
+            walk(comment.get("replies", []), f"t1_{comment['id']}", depth + 1, hit)
+
+    walk(state.fixture["comments"].get(post_id, []), f"t3_{post_id}", 0, False)
+    return 200, {"json": {"errors": [], "data": {"things": things}}}
+
+
+ROUTES = [
+    (re.compile(r"/r/([^/]+)/about"), handle_about),
+    (re.compile(r"/r/([^/]+)/(hot|new|top|rising|search)"), handle_listing),
+    (re.compile(r"/comments/([^/]+)"), handle_comments),
+    (re.compile(r"/api/morechildren"), handle_morechildren),
+]
+
+
+class FakeRedditServer:
+    """백그라운드 스레드에서 가짜 Reddit API를 띄우는 도우미"""
+
+    def __init__(self, fixture, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, rate_limit=1000, rate_window=600):
+        self.httpd = ThreadingHTTPServer((host, port), FakeRedditHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = FakeRedditState(fixture, latency, jitter, rate_limit, rate_window)
+        self._thread = None
+
+    @property
+    def state(self):
+        return self.httpd.state
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def load_fixture(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 Reddit API 서버 (녹화/재생)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="픽스처를 Reddit API 형식으로 제공")
+    serve.add_argument("--fixture", required=True)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--latency", type=float, default=0.0, help="요청당 고정 지연(초)")
+    serve.add_argument("--jitter", type=float, default=0.0, help="요청당 추가 무작위 지연 최대값(초)")
+    serve.add_argument("--rate-limit", type=int, default=1000, help="윈도우당 허용 요청 수")
+    serve.add_argument("--rate-window", type=int, default=600, help="레이트 리밋 윈도우(초)")
+
+    gen = sub.add_parser("generate", help="합성 픽스처 생성")
+    gen.add_argument("--out", required=True)
+    gen.add_argument("--subreddits", default="kbeauty,AsianBeauty,SkincareAddiction")
+    gen.add_argument("--posts", type=int, default=100)
+    gen.add_argument("--comments", type=int, default=20)
+    gen.add_argument("--seed", type=int, default=42)
+
+    rec = sub.add_parser("record", help="실제 Reddit에서 수집하며 픽스처로 녹화 (.streamlit/secrets.toml 사용)")
+    rec.add_argument("--out", required=True)
+    rec.add_argument("--subreddits", default="kbeauty,AsianBeauty")
+    rec.add_argument("--query", default="")
+    rec.add_argument("--sort", default="hot")
+    rec.add_argument("--posts", type=int, default=100)
+    rec.add_argument("--comments", type=int, default=20)
+    rec.add_argument("--secrets", default=".streamlit/secrets.toml")
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        fixture = generate_fixture(args.subreddits.split(","), args.posts, args.comments, args.seed)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        print(f"픽스처 저장: {args.out}")
+
+    elif args.command == "serve":
+        server = FakeRedditServer(load_fixture(args.fixture), args.host, args.port, args.latency,
+                                  args.jitter, args.rate_limit, args.rate_window)
+        print(f"가짜 Reddit API 실행 중: {server.base_url} (Ctrl+C로 종료)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
+
+    elif args.command == "record":
+        import tomllib
+        from reddit_collector import collect_subreddits_parallel, parse_subreddit_list
+
+        with open(args.secrets, "rb") as f:
+            credentials = tomllib.load(f)["reddit"]
+        recorder = FixtureRecorder()
+        collect_subreddits_parallel(
+            credentials, parse_subreddit_list(args.subreddits), args.query, args.posts, args.sort, "all",
+            args.comments > 0, args.comments,
+            requestor_class=RecordingRequestor, requestor_kwargs={"recorder": recorder}
+        )
+        recorder.save(args.out)
+        print(f"녹화된 픽스처 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
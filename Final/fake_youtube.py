@@ -0,0 +1,428 @@
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from youtube_quota import COSTS, DEFAULT_COST, DEFAULT_DAILY_QUOTA
+
+# ========================================
+# 오프라인용 가짜 YouTube Data API v3 서버
+# - 생성한 영상/댓글/답글 픽스처를 search, videos, commentThreads, comments 응답 형식으로 제공
+# - pageToken 페이지 나누기, ETag(304), 응답 지연을 재현
+# - 오류 재현: 일일 할당량 소진(403 quotaExceeded), 속도 제한(403 rateLimitExceeded),
+#   댓글 사용 중지 영상(403 commentsDisabled), 없는 영상(404 videoNotFound)
+# - 수집기는 secrets.toml의 [youtube] api_root(또는 환경변수 YOUTUBE_API_ROOT)로 이 서버를 가리키면 됨
+#   (API 키는 아무 값이나 사용 가능)
+#
+# 사용 예)
+#   python fake_youtube.py generate --out yt_fixture.json --videos 300 --comments 200
+#   python fake_youtube.py serve --fixture yt_fixture.json --port 8766 --latency 0.05 --quota 10000
+# ========================================
+
+DEFAULT_PORT = 8766
+INLINE_REPLIES = 5           # commentThreads의 replies에 포함되는 최대 답글 수 (실제 API와 같음)
+MAX_SEARCH_RESULTS = 500     # 검색 1건으로 넘길 수 있는 최대 결과 수
+
+SAMPLE_WORDS = [
+    "kbeauty", "skincare", "routine", "serum", "toner", "cream", "sunscreen", "cushion", "essence",
+    "review", "haul", "olive young", "cosrx", "anua", "torriden", "dry", "oily", "sensitive",
+    "good", "love", "best", "bad", "not", "really", "glow", "texture", "price",
+    "스킨케어", "세럼", "토너", "선크림", "쿠션", "리뷰", "추천", "좋아요", "별로", "보습", "피부",
+]
+ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+
+
+# ========================================
+# 픽스처 생성
+# ========================================
+
+def _sentence(rng, min_words=5, max_words=25):
+    return " ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def _random_id(rng, length):
+    return "".join(rng.choice(ID_CHARS) for _ in range(length))
+
+
+def _timestamp(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def generate_fixture(videos=100, comments_per_video=50, max_replies=12, disabled_ratio=0.05, seed=42):
+    """벤치마크용 합성 픽스처 생성 (영상 + 영상별 최상위 댓글/답글)
+
+    댓글의 약 20%에 답글이 1~max_replies개 달린다 (5개가 넘으면 comments().list 추가 요청이 필요).
+    disabled_ratio 비율의 영상은 댓글 사용 중지(commentsDisabled)로 표시한다.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    fixture = {"videos": [], "comments": {}}
+
+    for v in range(videos):
+        video_id = _random_id(rng, 11)
+        published = now - timedelta(hours=v * 6 + rng.randint(0, 5))
+        threads = []
+        if rng.random() >= disabled_ratio:
+            for c in range(rng.randint(comments_per_video // 2, comments_per_video) if comments_per_video else 0):
+                comment_id = "Ugz" + _random_id(rng, 20)
+                comment_time = now - timedelta(minutes=c * 7 + 1)  # 앞쪽일수록 최신
+                replies = []
+                if max_replies and rng.random() < 0.2:
+                    for r in range(rng.randint(1, max_replies)):
+                        replies.append({
+                            "id": f"{comment_id}.{_random_id(rng, 22)}", "author": f"@user{rng.randint(1, 5000)}",
+                            "text": _sentence(rng, 2, 15), "like_count": rng.randint(0, 50),
+                            "published_at": _timestamp(comment_time + timedelta(seconds=r + 1)),
+                        })
+                threads.append({
+                    "id": comment_id, "author": f"@user{rng.randint(1, 5000)}", "text": _sentence(rng, 3, 30),
+                    "like_count": rng.randint(0, 2000), "published_at": _timestamp(comment_time),
+                    "replies": replies,
+                })
+            fixture["comments"][video_id] = threads
+        else:
+            fixture["comments"][video_id] = None  # 댓글 사용 중지
+
+        fixture["videos"].append({
+            "id": video_id, "title": _sentence(rng, 3, 10), "description": _sentence(rng, 10, 40),
+            "channel": f"channel{rng.randint(1, 200)}", "published_at": _timestamp(published),
+            "tags": rng.sample(SAMPLE_WORDS, rng.randint(0, 5)), "view_count": rng.randint(100, 5_000_000),
+            "like_count": rng.randint(0, 200_000), "duration": f"PT{rng.randint(1, 30)}M{rng.randint(0, 59)}S",
+            "comment_count": sum(1 + len(t["replies"]) for t in threads),
+        })
+    return fixture
+
+
+def load_fixture(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ========================================
+# 가짜 API 서버
+# ========================================
+
+class FakeYouTubeState:
+    """픽스처와 서버 설정(지연, 할당량, 속도 제한)을 보관하고 요청/할당량 사용량을 집계"""
+
+    def __init__(self, fixture, latency=0.0, jitter=0.0, quota=DEFAULT_DAILY_QUOTA, rate_limit=10**7, rate_window=1):
+        self.fixture = fixture
+        self.latency = latency
+        self.jitter = jitter
+        self.quota = quota
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.window_started = time.time()
+        self.window_used = 0
+        self.quota_used = 0
+        self.total_requests = 0
+        self.requests = {}
+        self.quota_errors = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._videos = {video["id"]: video for video in fixture["videos"]}
+        self._threads = {
+            thread["id"]: (video_id, thread)
+            for video_id, threads in fixture["comments"].items() for thread in threads or []
+        }
+
+    def take_request(self, endpoint):
+        """요청 1회를 집계하고 거절 사유(None이면 허용) 반환 - 거절된 요청은 할당량을 쓰지 않음"""
+        cost = COSTS.get(f"youtube.{endpoint}.list", DEFAULT_COST)
+        with self._lock:
+            now = time.time()
+            if now - self.window_started >= self.rate_window:
+                self.window_started = now
+                self.window_used = 0
+            self.total_requests += 1
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            self.window_used += 1
+            if self.window_used > self.rate_limit:
+                self.throttled += 1
+                return "rateLimitExceeded"
+            if self.quota_used + cost > self.quota:
+                self.quota_errors += 1
+                return "quotaExceeded"
+            self.quota_used += cost
+            return None
+
+    def video(self, video_id):
+        return self._videos.get(video_id)
+
+    def thread(self, comment_id):
+        return self._threads.get(comment_id, (None, None))
+
+
+def _error(status, reason, message):
+    return status, {"error": {"code": status, "message": message,
+                              "errors": [{"message": message, "domain": "youtube", "reason": reason}]}}
+
+
+def _page(items, params, default_size, max_size, limit=None):
+    """pageToken(시작 위치)/maxResults로 자른 (페이지 항목, 다음 페이지 토큰 또는 None) - 잘못된 토큰이면 None"""
+    size = min(int(params.get("maxResults", default_size)), max_size)
+    token = params.get("pageToken", "")
+    if token and not (token.startswith("CA") and token[2:].isdigit()):
+        return None
+    start = int(token[2:]) if token else 0
+    total = min(len(items), limit or len(items))
+    end = min(start + size, total)
+    return items[start:end], f"CA{end}" if end < total else None
+
+
+def _list_response(kind, items, next_token=None, total=None):
+    response = {"kind": kind, "pageInfo": {"totalResults": len(items) if total is None else total,
+                                           "resultsPerPage": len(items)}, "items": items}
+    if next_token:
+        response["nextPageToken"] = next_token
+    return response
+
+
+def _video_resource(video, parts):
+    item = {"kind": "youtube#video", "id": video["id"]}
+    if "snippet" in parts:
+        item["snippet"] = {
+            "publishedAt": video["published_at"], "channelId": f"UC{video['channel']}",
+            "title": video["title"], "description": video["description"],
+            "channelTitle": video["channel"], "tags": video["tags"],
+        }
+        if not video["tags"]:
+            del item["snippet"]["tags"]  # 실제 API도 태그가 없으면 필드를 생략
+    if "statistics" in parts:
+        item["statistics"] = {"viewCount": str(video["view_count"]), "likeCount": str(video["like_count"]),
+                              "commentCount": str(video["comment_count"])}
+    if "contentDetails" in parts:
+        item["contentDetails"] = {"duration": video["duration"]}
+    return item
+
+
+def _comment_resource(comment, video_id, parent_id=None):
+    snippet = {
+        "videoId": video_id, "textDisplay": comment["text"], "textOriginal": comment["text"],
+        "authorDisplayName": comment["author"], "likeCount": comment["like_count"],
+        "publishedAt": comment["published_at"], "updatedAt": comment["published_at"],
+    }
+    if parent_id:
+        snippet["parentId"] = parent_id
+    return {"kind": "youtube#comment", "id": comment["id"], "snippet": snippet}
+
+
+def handle_search(state, params):
+    videos = state.fixture["videos"]
+    terms = params.get("q", "").lower().split()
+    if terms:
+        videos = [v for v in videos if any(
+            t in " ".join([v["title"], v["description"]] + v["tags"]).lower() for t in terms
+        )]
+    order = params.get("order", "relevance")
+    if order == "date":
+        videos = sorted(videos, key=lambda v: v["published_at"], reverse=True)
+    elif order == "viewCount":
+        videos = sorted(videos, key=lambda v: v["view_count"], reverse=True)
+    elif order == "rating":
+        videos = sorted(videos, key=lambda v: v["like_count"], reverse=True)
+
+    page = _page(videos, params, 5, 50, MAX_SEARCH_RESULTS)
+    if page is None:
+        return _error(400, "invalidPageToken", "The request specifies an invalid page token.")
+    items, next_token = page
+    return 200, _list_response("youtube#searchListResponse", [
+        {"kind": "youtube#searchResult", "id": {"kind": "youtube#video", "videoId": v["id"]}} for v in items
+    ], next_token, len(videos))
+
+
+def handle_videos(state, params):
+    parts = set(params.get("part", "snippet").split(","))
+    video_ids = [v for v in params.get("id", "").split(",") if v][:50]
+    items = [_video_resource(state.video(v), parts) for v in video_ids if state.video(v)]
+    return 200, _list_response("youtube#videoListResponse", items)
+
+
+def handle_comment_threads(state, params):
+    video_id = params.get("videoId", "")
+    if state.video(video_id) is None:
+        return _error(404, "videoNotFound", "The video identified by the videoId parameter could not be found.")
+    threads = state.fixture["comments"].get(video_id)
+    if threads is None:
+        return _error(403, "commentsDisabled", "The video has disabled comments.")
+    if params.get("order") == "time":
+        threads = sorted(threads, key=lambda t: t["published_at"], reverse=True)
+
+    page = _page(threads, params, 20, 100)
+    if page is None:
+        return _error(400, "invalidPageToken", "The request specifies an invalid page token.")
+    items, next_token = page
+    with_replies = "replies" in params.get("part", "snippet").split(",")
+    resources = []
+    for thread in items:
+        resource = {"kind": "youtube#commentThread", "id": thread["id"], "snippet": {
+            "videoId": video_id, "topLevelComment": _comment_resource(thread, video_id),
+            "canReply": True, "totalReplyCount": len(thread["replies"]), "isPublic": True,
+        }}
+        if with_replies and thread["replies"]:
+            resource["replies"] = {"comments": [
+                _comment_resource(reply, video_id, thread["id"]) for reply in thread["replies"][:INLINE_REPLIES]
+            ]}
+        resources.append(resource)
+    return 200, _list_response("youtube#commentThreadListResponse", resources, next_token)
+
+
+def handle_comments(state, params):
+    video_id, thread = state.thread(params.get("parentId", ""))
+    replies = thread["replies"] if thread else []
+    page = _page(replies, params, 20, 100)
+    if page is None:
+        return _error(400, "invalidPageToken", "The request specifies an invalid page token.")
+    items, next_token = page
+    return 200, _list_response("youtube#commentListResponse", [
+        _comment_resource(reply, video_id, thread["id"]) for reply in items
+    ], next_token)
+
+
+ROUTES = [
+    (re.compile(r"(?:/youtube/v3)?/(search)"), handle_search),
+    (re.compile(r"(?:/youtube/v3)?/(videos)"), handle_videos),
+    (re.compile(r"(?:/youtube/v3)?/(commentThreads)"), handle_comment_threads),
+    (re.compile(r"(?:/youtube/v3)?/(comments)"), handle_comments),
+]
+
+
+class FakeYouTubeHandler(BaseHTTPRequestHandler):
+    server_version = "FakeYouTube/1.0"
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문이 나뉘어 전송될 때 생기는 지연(약 40ms) 방지
+
+    def log_message(self, format, *args):
+        pass  # 벤치마크 출력이 섞이지 않도록 접근 로그 생략
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/")
+        params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+
+        for pattern, handler in ROUTES:
+            match = pattern.fullmatch(path)
+            if match:
+                break
+        else:
+            self._send(*_error(404, "notFound", "Not Found"))
+            return
+
+        delay = self.state.latency + (random.uniform(0, self.state.jitter) if self.state.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        reason = self.state.take_request(match.group(1))
+        if reason == "rateLimitExceeded":
+            self._send(*_error(403, reason, "Rate Limit Exceeded"))
+        elif reason == "quotaExceeded":
+            self._send(*_error(403, reason, "The request cannot be completed because you have exceeded your quota."))
+        else:
+            self._send(*handler(self.state, params))
+
+
+class FakeYouTubeServer:
+    """백그라운드 스레드에서 가짜 YouTube Data API를 띄우는 도우미"""
+
+    def __init__(self, fixture, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, quota=DEFAULT_DAILY_QUOTA,
+                 rate_limit=10**7, rate_window=1):
+        self.httpd = ThreadingHTTPServer((host, port), FakeYouTubeHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = FakeYouTubeState(fixture, latency, jitter, quota, rate_limit, rate_window)
+        self._thread = None
+
+    @property
+    def state(self):
+        return self.httpd.state
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 YouTube Data API 서버")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="픽스처를 YouTube Data API 형식으로 제공")
+    serve.add_argument("--fixture", required=True)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--latency", type=float, default=0.0, help="요청당 고정 지연(초)")
+    serve.add_argument("--jitter", type=float, default=0.0, help="요청당 추가 무작위 지연 최대값(초)")
+    serve.add_argument("--quota", type=int, default=DEFAULT_DAILY_QUOTA, help="서버 실행 동안의 할당량(unit)")
+    serve.add_argument("--rate-limit", type=int, default=10**7, help="윈도우당 허용 요청 수")
+    serve.add_argument("--rate-window", type=float, default=1, help="속도 제한 윈도우(초)")
+
+    gen = sub.add_parser("generate", help="합성 픽스처 생성")
+    gen.add_argument("--out", required=True)
+    gen.add_argument("--videos", type=int, default=100)
+    gen.add_argument("--comments", type=int, default=50, help="영상당 최대 최상위 댓글 수")
+    gen.add_argument("--replies", type=int, default=12, help="댓글당 최대 답글 수")
+    gen.add_argument("--disabled-ratio", type=float, default=0.05, help="댓글 사용 중지 영상 비율")
+    gen.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        fixture = generate_fixture(args.videos, args.comments, args.replies, args.disabled_ratio, args.seed)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        print(f"픽스처 저장: {args.out}")
+
+    elif args.command == "serve":
+        server = FakeYouTubeServer(load_fixture(args.fixture), args.host, args.port, args.latency,
+                                   args.jitter, args.quota, args.rate_limit, args.rate_window)
+        print(f"가짜 YouTube API 실행 중: {server.base_url} (Ctrl+C로 종료)")
+        print(f"  secrets.toml [youtube]에 api_root = \"{server.base_url}\" 추가")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
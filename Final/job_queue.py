@@ -0,0 +1,211 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+from data_store import StoreLock
+from process_util import pid_alive
+
+# ========================================
+# 백그라운드 수집 작업 큐 (디스크 기반)
+# - 작업 1개 = jobs/{job_id}.json (상태, 진행률, 취소 요청 여부)
+# - 결과는 jobs/{job_id}/ 아래 Parquet 파일로 저장 (수집 원본은 data_store에도 반영)
+# - 페이지는 작업을 등록/조회/취소만 하고, 실제 수집은 별도 워커 프로세스(job_worker.py)가 수행
+#   → 페이지를 새로고침하거나 탭을 닫아도 작업은 계속 진행됨
+# ========================================
+
+JOBS_DIR = "jobs"
+
+ACTIVE_STATUSES = ("queued", "running")
+STATUS_LABELS = {
+    "queued": "대기 중",
+    "running": "수집 중",
+    "done": "완료",
+    "failed": "실패",
+    "canceled": "취소됨",
+}
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def job_path(job_id, jobs_dir=JOBS_DIR):
+    return os.path.join(jobs_dir, f"{job_id}.json")
+
+
+def result_dir(job_id, jobs_dir=JOBS_DIR):
+    return os.path.join(jobs_dir, job_id)
+
+
+def _write_job(job, jobs_dir=JOBS_DIR):
+    path = job_path(job["id"], jobs_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(job, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def get_job(job_id, jobs_dir=JOBS_DIR):
+    try:
+        with open(job_path(job_id, jobs_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def list_jobs(source=None, jobs_dir=JOBS_DIR):
+    """작업 목록 (최근 등록 순)"""
+    if not os.path.isdir(jobs_dir):
+        return []
+    jobs = []
+    for name in os.listdir(jobs_dir):
+        if name.endswith(".json"):
+            job = get_job(name[:-5], jobs_dir)
+            if job and (source is None or job["source"] == source):
+                jobs.append(job)
+    return sorted(jobs, key=lambda j: j["submitted_ts"], reverse=True)
+
+
+def submit_job(source, params, label="", jobs_dir=JOBS_DIR):
+    """수집 작업 등록 후 job_id 반환 (source: 'reddit' 또는 'youtube')"""
+    os.makedirs(jobs_dir, exist_ok=True)
+    job = {
+        "id": datetime.now().strftime("%Y%m%d_%H%M%S_") + uuid.uuid4().hex[:6],
+        "source": source,
+        "label": label,
+        "params": params,
+        "status": "queued",
+        "progress": {},
+        "message": "",
+        "error": None,
+        "cancel_requested": False,
+        "submitted_at": _now(),
+        "submitted_ts": time.time(),
+        "started_at": None,
+        "finished_at": None,
+        "heartbeat": None,
+        "worker_pid": None,
+    }
+    with StoreLock(jobs_dir):
+        _write_job(job, jobs_dir)
+    return job["id"]
+
+
+def update_job(job_id, jobs_dir=JOBS_DIR, **fields):
+    """작업 상태 일부 갱신 (갱신된 작업 dict 반환)"""
+    with StoreLock(jobs_dir):
+        job = get_job(job_id, jobs_dir)
+        if job is None:
+            return None
+        job.update(fields)
+        if job["status"] == "running":
+            job["heartbeat"] = time.time()
+        _write_job(job, jobs_dir)
+        return job
+
+
+def request_cancel(job_id, jobs_dir=JOBS_DIR):
+    """대기 중인 작업은 바로 취소, 실행 중인 작업은 워커가 다음 배치 사이에 멈추도록 표시"""
+    with StoreLock(jobs_dir):
+        job = get_job(job_id, jobs_dir)
+        if job is None or job["status"] not in ACTIVE_STATUSES:
+            return job
+        if job["status"] == "queued":
+            job.update(status="canceled", finished_at=_now(), message="실행 전 취소")
+        job["cancel_requested"] = True
+        _write_job(job, jobs_dir)
+        return job
+
+
+def claim_next_job(jobs_dir=JOBS_DIR):
+    """가장 먼저 등록된 대기 작업(또는 워커가 죽어 멈춘 작업)을 실행 중으로 바꾸고 반환"""
+    if not os.path.isdir(jobs_dir):
+        return None
+    with StoreLock(jobs_dir):
+        now = time.time()
+        for job in reversed(list_jobs(jobs_dir=jobs_dir)):
+            # 실행 중이던 워커 프로세스가 죽은 작업은 처음부터 다시 실행
+            stale = job["status"] == "running" and not pid_alive(job.get("worker_pid"))
+            if job["status"] == "queued" or stale:
+                job.update(status="running", started_at=_now(), heartbeat=now, worker_pid=os.getpid(),
+                           message="다시 시작" if stale else "")
+                _write_job(job, jobs_dir)
+                return job
+    return None
+
+
+# ========================================
+# 결과 저장 / 불러오기
+# ========================================
+
+def save_result(job_id, frames, stats=None, jobs_dir=JOBS_DIR):
+    """frames: {이름: DataFrame 또는 None} / stats: JSON으로 저장할 통계 dict"""
+    out_dir = result_dir(job_id, jobs_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    for name, df in frames.items():
+        if df is not None and not df.empty:
+            df.to_parquet(os.path.join(out_dir, f"{name}.parquet"), index=False)
+    if stats is not None:
+        with open(os.path.join(out_dir, "stats.json"), "w", encoding="utf-8") as f:
+            json.dump(stats, f, ensure_ascii=False, default=str)
+
+
+def load_result(job_id, names, jobs_dir=JOBS_DIR):
+    """저장된 결과를 (DataFrame 또는 None 리스트, 통계 dict)로 반환"""
+    out_dir = result_dir(job_id, jobs_dir)
+    frames = []
+    for name in names:
+        path = os.path.join(out_dir, f"{name}.parquet")
+        frames.append(pd.read_parquet(path) if os.path.exists(path) else None)
+    stats = {}
+    stats_path = os.path.join(out_dir, "stats.json")
+    if os.path.exists(stats_path):
+        with open(stats_path, encoding="utf-8") as f:
+            stats = json.load(f)
+    return frames, stats
+
+
+# ========================================
+# 워커 프로세스 관리
+# ========================================
+
+def worker_pids(jobs_dir=JOBS_DIR):
+    """살아 있는 워커 프로세스 PID 목록 (워커는 jobs/workers/{pid} 파일로 자신을 등록)"""
+    workers_dir = os.path.join(jobs_dir, "workers")
+    if not os.path.isdir(workers_dir):
+        return []
+    alive = []
+    for name in os.listdir(workers_dir):
+        if name.isdigit() and pid_alive(int(name)):
+            alive.append(int(name))
+        else:
+            try:
+                os.remove(os.path.join(workers_dir, name))
+            except FileNotFoundError:
+                pass
+    return alive
+
+
+def ensure_worker(jobs_dir=JOBS_DIR):
+    """살아 있는 워커가 없으면 백그라운드 워커 프로세스를 새로 띄움 (Streamlit 프로세스와 분리)"""
+    if worker_pids(jobs_dir):
+        return False
+    worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_worker.py")
+    os.makedirs(jobs_dir, exist_ok=True)
+    log = open(os.path.join(jobs_dir, "worker.log"), "a", encoding="utf-8")
+    process = subprocess.Popen(
+        [sys.executable, worker_script, "--jobs-dir", jobs_dir],
+        cwd=os.getcwd(), stdout=log, stderr=subprocess.STDOUT, start_new_session=True
+    )
+    log.close()
+    # 워커가 스스로 등록하기 전에 다시 호출돼도 중복 실행되지 않도록 바로 등록
+    workers_dir = os.path.join(jobs_dir, "workers")
+    os.makedirs(workers_dir, exist_ok=True)
+    open(os.path.join(workers_dir, str(process.pid)), "w").close()
+    return True
@@ -0,0 +1,68 @@
+import streamlit as st
+
+import job_queue
+
+# ========================================
+# 백그라운드 수집 작업 화면 모듈
+# - 작업 목록(상태/진행률)을 보여 주고 취소 및 완료 결과 불러오기를 제공
+# - 작업 정보는 디스크(jobs/)에 있으므로 페이지를 새로고침해도 그대로 보임
+# ========================================
+
+POLL_SECONDS = 3
+MAX_JOBS_SHOWN = 10
+
+
+def submit_collection_job(source, params, label):
+    """작업을 대기열에 넣고 워커 프로세스가 없으면 띄움"""
+    job_id = job_queue.submit_job(source, params, label)
+    job_queue.ensure_worker()
+    return job_id
+
+
+def _format_progress(job):
+    parts = [f"{key} {value:,}" if isinstance(value, int) else f"{key} {value}"
+             for key, value in job.get("progress", {}).items()]
+    if job.get("message"):
+        parts.append(job["message"])
+    if job.get("error"):
+        parts.append(f"오류: {job['error']}")
+    return " · ".join(parts)
+
+
+def _job_list(source, result_names, on_load):
+    jobs = job_queue.list_jobs(source)[:MAX_JOBS_SHOWN]
+    if not jobs:
+        st.caption("등록된 작업이 없습니다.")
+        return
+    for job in jobs:
+        col_info, col_status, col_action = st.columns([6, 2, 2])
+        col_info.markdown(f"**{job['label'] or job['id']}** · {job['submitted_at'].replace('T', ' ')}")
+        col_info.caption(_format_progress(job))
+        col_status.write(job_queue.STATUS_LABELS.get(job["status"], job["status"]))
+
+        if job["status"] in job_queue.ACTIVE_STATUSES:
+            if col_action.button("⏹️ 취소", key=f"{source}_job_cancel_{job['id']}", disabled=job.get("cancel_requested")):
+                job_queue.request_cancel(job["id"])
+                st.rerun()
+        elif job["status"] in ("done", "canceled"):
+            if col_action.button("📥 불러오기", key=f"{source}_job_load_{job['id']}"):
+                frames, stats = job_queue.load_result(job["id"], result_names)
+                on_load(job, frames, stats)
+                st.rerun()
+
+
+# 지원하는 Streamlit 버전이면 작업 목록만 주기적으로 다시 그림 (전체 페이지는 다시 실행하지 않음)
+if hasattr(st, "fragment"):
+    _job_list = st.fragment(run_every=POLL_SECONDS)(_job_list)
+
+
+def render_job_panel(source, result_names, on_load):
+    """source: 'reddit'/'youtube' / result_names: 결과 파일 이름 목록 / on_load(job, frames, stats)"""
+    jobs = job_queue.list_jobs(source)
+    if not jobs:
+        return
+    active = sum(j["status"] in job_queue.ACTIVE_STATUSES for j in jobs)
+    with st.expander(f"🗂️ 백그라운드 수집 작업 (진행 중 {active}개)", expanded=active > 0):
+        if st.button("🔄 상태 새로고침", key=f"{source}_jobs_refresh"):
+            st.rerun()
+        _job_list(source, result_names, on_load)
@@ -0,0 +1,238 @@
+import argparse
+import os
+import time
+import traceback
+from datetime import datetime
+
+import pandas as pd
+
+import data_store
+import job_queue
+import youtube_quota
+from crawl_state import WatermarkStore
+from reddit_collector import iter_collect_subreddits, merge_collected, options_from_secrets, parse_subreddit_list
+from secrets_util import load_secrets
+from youtube_collector import (
+    attach_video_info, concat_comments, iter_tracked_video_batches, iter_youtube_batches, set_api_root
+)
+
+# ========================================
+# 백그라운드 수집 워커
+# - jobs/ 대기열에서 작업을 하나씩 꺼내 실행하고 진행률/결과를 디스크에 기록
+# - Streamlit 밖에서 실행되므로 API 키는 .streamlit/secrets.toml을 직접 읽음
+#
+# 사용 예) Final 폴더에서
+#   python job_worker.py              # 대기열이 비면 IDLE_EXIT_SECONDS 후 종료
+#   python job_worker.py --idle-exit 0  # 계속 대기 (여러 개 띄워 동시에 처리 가능)
+# ========================================
+
+POLL_SECONDS = 2
+IDLE_EXIT_SECONDS = 300
+PROGRESS_INTERVAL = 1.0
+
+
+class JobCanceled(Exception):
+    pass
+
+
+class JobProgress:
+    """진행률 기록(일정 간격) + 취소 요청 확인"""
+
+    def __init__(self, job_id, jobs_dir):
+        self.job_id = job_id
+        self.jobs_dir = jobs_dir
+        self._last = 0.0
+
+    def update(self, message, force=False, **progress):
+        job = job_queue.get_job(self.job_id, self.jobs_dir)
+        if job is not None and job.get("cancel_requested"):
+            raise JobCanceled()
+        now = time.monotonic()
+        if force or now - self._last >= PROGRESS_INTERVAL:
+            self._last = now
+            job_queue.update_job(self.job_id, self.jobs_dir, progress=progress, message=message)
+
+
+def run_reddit_job(job, secrets, progress):
+    params = job["params"]
+    try:
+        credentials = dict(secrets["reddit"])
+    except KeyError:
+        raise RuntimeError("secrets.toml에 'reddit' 섹션이 없습니다.")
+    subreddit_list = parse_subreddit_list(params["subreddit_names"])
+    watermarks = WatermarkStore("reddit") if params.get("incremental") else None
+
+    posts_by_subreddit, comments_by_post = {}, {}
+    collect_stats = {}
+    events = iter_collect_subreddits(
+        credentials, subreddit_list, params.get("search_query", ""), params["post_limit"], params["sort_by"],
+        params["time_filter"], params["collect_comments"], params["comment_limit"], watermarks=watermarks,
+        **options_from_secrets(credentials, params.get("comment_options"))
+    )
+    canceled = False
+    try:
+        for event in events:
+            if event[0] == "posts":
+                posts_by_subreddit[event[1]] = event[2]
+                message = f"r/{event[1]} 게시물 {len(event[2]):,}개 ({event[3]['상태']})"
+            elif event[0] == "comments":
+                comments_by_post[event[1]] = event[2]
+                message = "댓글 수집 중"
+            else:
+                collect_stats = event[1]
+                message = "저장 중"
+            progress.update(
+                message, force=event[0] != "comments",
+                subreddits=f"{len(posts_by_subreddit)}/{len(subreddit_list)}",
+                posts=sum(len(p) for p in posts_by_subreddit.values()),
+                comments=sum(len(c) for c in comments_by_post.values()),
+            )
+    except JobCanceled:
+        canceled = True
+    finally:
+        events.close()
+
+    posts_df, comments_df = merge_collected(subreddit_list, posts_by_subreddit, comments_by_post)
+
+    # 취소된 작업도 그때까지 모은 데이터는 저장
+    if not posts_df.empty:
+        data_store.upsert("reddit", "posts", posts_df)
+        if comments_df is not None:
+            data_store.upsert("reddit", "comments", comments_df)
+    if watermarks is not None:
+        # 저장소에 반영한 뒤에 워터마크 확정 (취소되어 통계가 없으면 그대로 둠 → 다음 실행 때 다시 받음)
+        watermarks.commit(collect_stats.get('watermark_updates'))
+    if 'timing' in collect_stats:
+        collect_stats['timing'] = collect_stats['timing'].to_dict("records")
+    job_queue.save_result(job["id"], {"posts": posts_df, "comments": comments_df}, collect_stats, progress.jobs_dir)
+    return canceled, f"게시물 {len(posts_df):,}개, 댓글 {0 if comments_df is None else len(comments_df):,}개"
+
+
+def run_youtube_job(job, secrets, progress):
+    params = job["params"]
+    try:
+        api_key = secrets["youtube"]["YOUTUBE_API_KEY"]
+    except KeyError:
+        raise RuntimeError("YouTube API 키가 설정되지 않았습니다. secrets.toml의 [youtube] 섹션을 확인하세요.")
+    set_api_root(secrets["youtube"].get("api_root"))  # 가짜 서버(fake_youtube.py) 등으로 요청할 때
+
+    daily_quota = int(secrets["youtube"].get("daily_quota", youtube_quota.DEFAULT_DAILY_QUOTA))
+    remaining = youtube_quota.get_ledger().remaining(daily_quota)
+    include_replies = params.get("include_replies", False)
+    watermarks = None
+    if params.get("video_ids"):
+        # 추적 영상 증분 동기화 (검색 없이 워터마크 이후의 새 댓글만)
+        quota_message = None
+        if youtube_quota.estimate_sync_cost(len(params["video_ids"]))["total"] > remaining:
+            raise RuntimeError(f"남은 할당량({remaining:,})이 추적 영상 {len(params['video_ids']):,}개를 확인하기에 부족합니다.")
+        watermarks = WatermarkStore("youtube")
+        events = iter_tracked_video_batches(api_key, params["video_ids"], params["max_comments_per_video"],
+                                            watermarks, include_replies=include_replies)
+    else:
+        # 실행 시점의 남은 할당량에 맞게 수집 규모 조정
+        max_videos, max_comments, include_replies, quota_message = youtube_quota.plan_collection(
+            params["max_videos"], params["max_comments_per_video"], remaining, include_replies
+        )
+        if max_videos == 0:
+            raise RuntimeError(quota_message)
+        if quota_message:
+            progress.update(quota_message, force=True)
+        events = iter_youtube_batches(api_key, params["keyword"], max_videos, max_comments, params["order"],
+                                      include_replies=include_replies)
+
+    videos_df, comment_frames, collect_stats = pd.DataFrame(), [], None
+    done_videos = 0
+    comment_count = 0
+    canceled = False
+    try:
+        for event in events:
+            if event[0] == "videos":
+                videos_df = event[1]
+            elif event[0] == "done":
+                collect_stats = event[1]
+            else:
+                comment_frames.append(event[2])
+                comment_count += len(event[2])
+                done_videos += 1
+            progress.update(f"영상 {done_videos}/{len(videos_df)}", force=event[0] == "videos",
+                            videos=f"{done_videos}/{len(videos_df)}", comments=comment_count)
+    except JobCanceled:
+        canceled = True
+    finally:
+        events.close()
+
+    comments_df = attach_video_info(concat_comments(comment_frames), videos_df)
+    if not videos_df.empty:
+        data_store.upsert("youtube", "videos", videos_df)
+        if not comments_df.empty:
+            data_store.upsert("youtube", "comments", comments_df)
+    if watermarks is not None and collect_stats is not None:
+        # 저장소에 반영한 뒤에 워터마크 확정 (취소되어 통계가 없으면 그대로 둠 → 다음 실행 때 다시 받음)
+        watermarks.commit(collect_stats.get('watermark_updates'))
+    job_queue.save_result(job["id"], {"videos": videos_df, "comments": comments_df}, collect_stats, progress.jobs_dir)
+    summary = f"영상 {len(videos_df):,}개, 댓글 {len(comments_df):,}개"
+    return canceled, f"{summary} ({quota_message})" if quota_message else summary
+
+
+RUNNERS = {
+    "reddit": run_reddit_job,
+    "youtube": run_youtube_job,
+}
+
+
+def run_job(job, secrets, jobs_dir):
+    progress = JobProgress(job["id"], jobs_dir)
+    started = time.perf_counter()
+    try:
+        canceled, summary = RUNNERS[job["source"]](job, secrets, progress)
+        status = "canceled" if canceled else "done"
+        job_queue.update_job(job["id"], jobs_dir, status=status, message=summary,
+                             finished_at=datetime.now().isoformat(timespec="seconds"))
+        print(f"[{job['id']}] {status}: {summary} ({time.perf_counter() - started:.1f}초)", flush=True)
+    except Exception as e:
+        traceback.print_exc()
+        job_queue.update_job(job["id"], jobs_dir, status="failed", error=str(e),
+                             finished_at=datetime.now().isoformat(timespec="seconds"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백그라운드 수집 작업 워커")
+    parser.add_argument("--jobs-dir", default=job_queue.JOBS_DIR)
+    parser.add_argument("--secrets", default=None, help="secrets.toml 경로 (기본: .streamlit/secrets.toml)")
+    parser.add_argument("--poll", type=float, default=POLL_SECONDS)
+    parser.add_argument("--idle-exit", type=float, default=IDLE_EXIT_SECONDS,
+                        help="대기열이 이 시간(초) 동안 비어 있으면 종료 (0 = 종료하지 않음)")
+    parser.add_argument("--once", action="store_true", help="대기 중인 작업만 처리하고 종료")
+    args = parser.parse_args()
+
+    workers_dir = os.path.join(args.jobs_dir, "workers")
+    os.makedirs(workers_dir, exist_ok=True)
+    pid_path = os.path.join(workers_dir, str(os.getpid()))
+    open(pid_path, "w").close()
+
+    idle_since = time.monotonic()
+    try:
+        while True:
+            job = job_queue.claim_next_job(args.jobs_dir)
+            if job is None:
+                if args.once or (args.idle_exit and time.monotonic() - idle_since > args.idle_exit):
+                    break
+                time.sleep(args.poll)
+                continue
+            # 작업마다 secrets를 다시 읽어 키 변경을 바로 반영
+            try:
+                secrets = load_secrets(args.secrets)
+            except Exception as e:
+                job_queue.update_job(job["id"], args.jobs_dir, status="failed", error=str(e))
+                continue
+            run_job(job, secrets, args.jobs_dir)
+            idle_since = time.monotonic()
+    finally:
+        try:
+            os.remove(pid_path)
+        except FileNotFoundError:
+            pass
+
+
+if __name__ == "__main__":
+    main()
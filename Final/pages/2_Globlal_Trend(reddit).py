@@ -2,17 +2,25 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
 from datetime import datetime
 import re
 from wordcloud import WordCloud
-import praw
 # [삭제] dotenv, os, requests, io 의존성 제거
 import os
 import requests 
 import io 
-from prawcore.exceptions import ResponseException, RequestException
 import openai 
+from reddit_collector import (
+    collect_subreddits_parallel, concat_posts, iter_collect_subreddits, merge_collected, options_from_secrets,
+    parse_subreddit_list
+)
+from crawl_state import WatermarkStore, merge_new_rows
+from collection_cache import RedditCollectionCache, canonical_subreddits, reddit_request_key
+import data_store
+import text_analysis
+import sentiment_view
+from stream_view import StreamingPanel, get_cached_result, set_cached_result
+from job_view import render_job_panel, submit_collection_job
 
 # ========================================
 # Streamlit 기본 설정 및 공통 연결 함수
@@ -199,38 +207,24 @@ class RedditAnalyzer:
     
     def preprocess_text(self, text):
         """텍스트 전처리"""
-        if pd.isna(text) or text is None:
-            return ""
-        
-        text = str(text).lower()
-        text = re.sub(r'http\S+|www\S+', '', text)
-        text = re.sub(r'[^가-힣a-z0-9\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return text_analysis.preprocess_text(text)
     
     
-    def extract_keywords(self, text_series, top_n=50):
-        """키워드 추출"""
-        all_text = ' '.join(text_series.fillna('').apply(self.preprocess_text))
-        words = all_text.split()
-        words = [w for w in words if len(w) >= 2]
-        
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                     'of', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
-                     'i', 'me', 'my', 'you', 'your', 'it', 'its', 'not', 'no', 'yes', 'we',
-                     '그', '이', '저', '것', '수', '등', '들', '및', '또한', '하다', '있다', '되다',
-                     '이것', '그것', '저것', '그런', '이런', '저런', 'removed', 'deleted'}
-        
-        words = [w for w in words if w not in stopwords]
-        word_freq = Counter(words)
-        
-        return word_freq.most_common(top_n)
+    STOPWORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+                 'of', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
+                 'i', 'me', 'my', 'you', 'your', 'it', 'its', 'not', 'no', 'yes', 'we',
+                 '그', '이', '저', '것', '수', '등', '들', '및', '또한', '하다', '있다', '되다',
+                 '이것', '그것', '저것', '그런', '이런', '저런', 'removed', 'deleted'}
+    
+    def extract_keywords(self, text_series, top_n=50, use_cache=True):
+        """키워드 추출 (🟢 [수정] 토큰은 text_analysis 공유 캐시에서 - 같은 텍스트는 한 번만 전처리,
+        use_cache=False: 스트리밍 배치처럼 한 번만 쓰는 텍스트는 캐시에 넣지 않음)"""
+        return text_analysis.top_keywords(text_analysis.get_corpus(text_series, use_cache), top_n, 2, self.STOPWORDS)
     
     
     def wordcloud(self, text_series, width=1200, height=800):
         """워드클라우드 생성"""
-        all_text = ' '.join(text_series.fillna('').apply(self.preprocess_text))
+        all_text = text_analysis.get_corpus(text_series).text
         
         try:
             font_path = 'C:/Windows/Fonts/malgun.ttf' 
@@ -279,35 +273,25 @@ class RedditAnalyzer:
         return fig, freq_df
     
     
-    def sentiment_analysis(self, text_series, data_df):
-        """감성 분석"""
-        positive_words = {
-            'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
-            'best', 'love', 'awesome', 'perfect', 'nice', 'happy', 'thank',
-            '좋다', '최고', '대박', '예쁘다', '멋지다', '완벽', '감사', '행복', '좋아요'
-        }
-        
-        negative_words = {
-            'bad', 'worst', 'terrible', 'awful', 'horrible', 'hate',
-            'poor', 'disappointing', 'useless', 'waste', 'crap',
-            '싫다', '별로', '나쁘다', '최악', '형편없다', '실망', '별로네'
-        }
-        
-        def calculate_sentiment(text):
-            text = self.preprocess_text(text)
-            words = text.split()
-            
-            pos_count = sum(1 for w in words if w in positive_words)
-            neg_count = sum(1 for w in words if w in negative_words)
-            
-            if pos_count > neg_count:
-                return '긍정'
-            elif pos_count < neg_count:
-                return '부정'
-            else:
-                return '중립'
+    POSITIVE_WORDS = {
+        'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+        'best', 'love', 'awesome', 'perfect', 'nice', 'happy', 'thank',
+        '좋다', '최고', '대박', '예쁘다', '멋지다', '완벽', '감사', '행복', '좋아요'
+    }
+    
+    NEGATIVE_WORDS = {
+        'bad', 'worst', 'terrible', 'awful', 'horrible', 'hate',
+        'poor', 'disappointing', 'useless', 'waste', 'crap',
+        '싫다', '별로', '나쁘다', '최악', '형편없다', '실망', '별로네'
+    }
+    
+    def sentiment_analysis(self, text_series, data_df, lexicon=None):
+        """감성 분석 (🟢 [수정] lexicon: text_analysis.SentimentLexicon - 없으면 기본 사전, 부정어 처리 없음)"""
+        if lexicon is None:
+            lexicon = text_analysis.SentimentLexicon(self.POSITIVE_WORDS, self.NEGATIVE_WORDS)
         
-        sentiments = text_series.fillna('').apply(calculate_sentiment)
+        _, _, labels = lexicon.classify(text_analysis.get_corpus(text_series))
+        sentiments = pd.Series(labels, index=text_series.index, name=text_series.name)
         
         df_copy = data_df.copy().reset_index(drop=True)
         df_copy['Sentiment'] = sentiments
@@ -426,6 +410,18 @@ class RedditAnalyzer:
         subreddit_stats.index.name = '서브레딧'
         subreddit_stats = subreddit_stats.sort_values('총_점수', ascending=False)
         
+        # 🟢 [추가] 서브레딧별 주요 키워드 (제목+본문 문서-단어 행렬의 서브레딧별 행 부분합)
+        text_cols = [col for col in ('title', 'selftext') if col in self.posts_df.columns]
+        if text_cols:
+            post_texts = self.posts_df[text_cols[0]].fillna('').astype(str)
+            for col in text_cols[1:]:
+                post_texts = post_texts + ' ' + self.posts_df[col].fillna('').astype(str)
+            top_words = text_analysis.group_top_words(
+                text_analysis.get_corpus(post_texts), self.posts_df['subreddit'], subreddit_stats.index,
+                top_n=5, stopwords=self.STOPWORDS
+            )
+            subreddit_stats['주요_키워드'] = [', '.join(top_words[name]) for name in subreddit_stats.index]
+        
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         
         axes[0, 0].bar(subreddit_stats.index, subreddit_stats['게시물_수'], color='orangered')
@@ -460,122 +456,180 @@ class RedditAnalyzer:
 class ConnectionError(Exception):
     pass
 
-@st.cache_data(show_spinner="Reddit 데이터를 수집 및 캐싱 중입니다. (최초 1회 실행)")
-def get_and_cache_reddit_data(subreddit_names, search_query, post_limit, sort_by, time_filter, collect_comments, comment_limit):
-    """Reddit API를 통해 데이터를 수집하고 캐시합니다. 인자가 바뀌지 않는 한 재실행되지 않습니다."""
-    
-    # [통합] secrets.toml에서 Reddit API 자격증명 로드
+def load_reddit_secrets():
+    """secrets.toml의 [reddit] 섹션을 dict로 로드"""
     try:
-        reddit_secrets = st.secrets["reddit"]
-        client_id = reddit_secrets.get("client_id")
-        client_secret = reddit_secrets.get("client_secret")
-        user_agent = reddit_secrets.get("user_agent", "RedditAnalyzer_Streamlit_v1.0 (by Python)") 
-        username = reddit_secrets.get("username")
-        password = reddit_secrets.get("password")
+        reddit_secrets = dict(st.secrets["reddit"])
     except KeyError:
         raise ConnectionError("secrets.toml에 'reddit' 섹션이 없습니다.")
     
-    if not client_id or not client_secret:
+    if not reddit_secrets.get("client_id") or not reddit_secrets.get("client_secret"):
         raise ConnectionError("Reddit API 자격증명이 설정되지 않았습니다.")
-    
-    try:
-        # 2. PRAW 객체 생성
-        if username and password:
-            reddit = praw.Reddit(
-                client_id=client_id, client_secret=client_secret, user_agent=user_agent,
-                username=username, password=password
-            )
-        else:
-            reddit = praw.Reddit(client_id=client_id, client_secret=client_secret, user_agent=user_agent)
+    return reddit_secrets
 
+
+def collect_reddit_data(subreddit_list, search_query, post_limit, sort_by, time_filter, collect_comments, comment_limit,
+                        comment_options=None, watermarks=None):
+    """병렬 수집기 호출 (watermarks가 있으면 증분 수집)
+
+    comment_options: 댓글 단계 설정 (replace_more_limit, max_comment_depth, max_comment_requests)
+    """
+    reddit_secrets = load_reddit_secrets()
+    try:
+        return collect_subreddits_parallel(
+            reddit_secrets, subreddit_list, search_query, post_limit, sort_by, time_filter,
+            collect_comments, comment_limit, watermarks=watermarks,
+            **options_from_secrets(reddit_secrets, comment_options)
+        )
     except Exception as e:
         raise ConnectionError(f"Reddit API 연결 오류: {e}")
-    
-    all_posts = []
-    all_comments = []
-    
-    # 3. 수집 로직 시작 (위젯 제거)
-    subreddit_list = [s.strip() for s in subreddit_names.split(',') if s.strip()]
+
+
+def save_raw_reddit_data(posts_df, comments_df):
+    """수집 원본을 저장소(data_store)에 upsert (타임스탬프 CSV 대신 post_id/comment_id 기준 병합)"""
+    data_store.upsert("reddit", "posts", posts_df)
+    if comments_df is not None and not comments_df.empty:
+        data_store.upsert("reddit", "comments", comments_df)
+
+
+# 저장소에서 불러올 때 본문 제외 옵션에 사용할 컬럼 구성
+REDDIT_POST_COLUMNS = ['post_id', 'subreddit', 'title', 'author', 'score', 'upvote_ratio', 'num_comments', 'created_utc', 'url', 'permalink']
+REDDIT_COMMENT_COLUMNS = ['comment_id', 'post_id', 'subreddit', 'author', 'body', 'score', 'created_utc', 'post_title']
+
+
+@st.cache_data(ttl=60, show_spinner="저장소에서 Reddit 데이터를 불러오는 중입니다.")
+def load_reddit_from_store(start_date, end_date, subreddits, include_selftext, include_comments):
+    """저장소에서 기간(파티션)/서브레딧/컬럼을 골라 읽기"""
+    filters = [("subreddit", "in", list(subreddits))] if subreddits else None
+    post_columns = REDDIT_POST_COLUMNS + (['selftext'] if include_selftext else [])
+    posts_df = data_store.load("reddit", "posts", columns=post_columns,
+                               start_date=start_date, end_date=end_date, filters=filters)
+    comments_df = None
+    if include_comments:
+        comments_df = data_store.load("reddit", "comments", columns=REDDIT_COMMENT_COLUMNS,
+                                      start_date=start_date, end_date=end_date, filters=filters)
+        if comments_df.empty:
+            comments_df = None
+    return posts_df, comments_df
+
+
+@st.cache_resource
+def reddit_collection_cache():
+    """세션 간 공유되는 수집 결과 캐시 (서브레딧 순서/대소문자가 달라도 같은 요청으로 취급)"""
+    return RedditCollectionCache()
+
+
+def get_and_cache_reddit_data(subreddit_names, search_query, post_limit, sort_by, time_filter, collect_comments, comment_limit, comment_options=None):
+    """Reddit API를 통해 데이터를 수집하고 캐시합니다.
+
+    🟢 [수정] 인자 그대로가 아닌 정규화된 조건으로 캐시 → 캐시된 결과보다 작은 요청은 잘라서 반환하고,
+    새 서브레딧이나 더 많은 게시물/댓글처럼 부족한 부분만 API로 추가 수집
+    """
+    subreddit_list = canonical_subreddits(subreddit_names)
     
     if not subreddit_list:
-        return pd.DataFrame(), None
+        return pd.DataFrame(), None, {}
 
-    for idx, subreddit_name in enumerate(subreddit_list):
+    reddit_secrets = load_reddit_secrets()
+    with st.spinner("Reddit 데이터를 수집 중입니다. (캐시에 없는 부분만 수집)"):
         try:
-            subreddit = reddit.subreddit(subreddit_name)
-            _ = subreddit.title 
-
-            if search_query:
-                posts = subreddit.search(search_query, sort=sort_by, time_filter=time_filter, limit=post_limit)
-            else:
-                if sort_by == 'hot':
-                    posts = subreddit.hot(limit=post_limit)
-                elif sort_by == 'new':
-                    posts = subreddit.new(limit=post_limit)
-                elif sort_by == 'top':
-                    posts = subreddit.top(time_filter=time_filter, limit=post_limit)
-                else:
-                    posts = subreddit.hot(limit=post_limit) 
-
-            for post in posts:
-                post_data = {
-                    'post_id': post.id,
-                    'subreddit': post.subreddit.display_name if hasattr(post.subreddit, 'display_name') else subreddit_name,
-                    'title': post.title,
-                    'selftext': post.selftext,
-                    'author': str(post.author) if post.author else '[deleted]',
-                    'score': post.score,
-                    'upvote_ratio': post.upvote_ratio,
-                    'num_comments': post.num_comments,
-                    'created_utc': post.created_utc,
-                    'url': post.url,
-                    'permalink': f"https://reddit.com{post.permalink}"
-                }
-                all_posts.append(post_data)
-                
-                if collect_comments and post.num_comments > 0:
-                    try:
-                        post.comments.replace_more(limit=0)
-                        comments = post.comments.list()[:comment_limit]
-                        
-                        for comment in comments:
-                            if hasattr(comment, 'body') and comment.body is not None:
-                                comment_data = {
-                                    'comment_id': comment.id,
-                                    'post_id': post.id,
-                                    'subreddit': post.subreddit.display_name if hasattr(post.subreddit, 'display_name') else subreddit_name,
-                                    'author': str(comment.author) if comment.author else '[deleted]',
-                                    'body': comment.body,
-                                    'score': comment.score,
-                                    'created_utc': comment.created_utc,
-                                    'post_title': post.title
-                                }
-                                all_comments.append(comment_data)
-                    except Exception as e:
-                        pass # 댓글 수집 오류는 무시
-
-        except ResponseException as e:
-            pass # 서브레딧 접근 불가 무시
+            # 새로 수집한 행만 저장소에 반영 (캐시에서 꺼낸 행은 이미 저장됨)
+            return reddit_collection_cache().collect(
+                reddit_secrets, subreddit_list, search_query, post_limit, sort_by, time_filter,
+                collect_comments, comment_limit, on_fetch=save_raw_reddit_data,
+                **options_from_secrets(reddit_secrets, comment_options)
+            )
         except Exception as e:
-            pass # 기타 수집 오류 무시
-    
-    posts_df = pd.DataFrame(all_posts)
-    comments_df = pd.DataFrame(all_comments) if all_comments else None
-    
-    # 4. 🔴 [핵심 수정] 파일 저장 로직: 캐싱 시점에 파일 저장 (딱 1회만 실행됨)
+            raise ConnectionError(f"Reddit API 연결 오류: {e}")
+
+
+def collect_reddit_incremental(subreddit_names, search_query, post_limit, sort_by, time_filter, collect_comments, comment_limit, comment_options=None):
+    """증분 수집: 워터마크 이후의 새 게시물만 수집 (캐시하지 않음 - 매번 새 데이터 확인)"""
+    subreddit_list = parse_subreddit_list(subreddit_names)
+    if not subreddit_list:
+        return pd.DataFrame(), None, {}
+
+    watermarks = WatermarkStore("reddit")
+    posts_df, comments_df, collect_stats = collect_reddit_data(
+        subreddit_list, search_query, post_limit, sort_by, time_filter, collect_comments, comment_limit,
+        comment_options, watermarks=watermarks
+    )
     if not posts_df.empty:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        posts_file_name = f"reddit_posts_data_{timestamp}.csv"
-        posts_file_path = os.path.join(SAVE_DIR, posts_file_name)
-        posts_df.to_csv(posts_file_path, index=False, encoding='utf-8-sig')
+        save_raw_reddit_data(posts_df, comments_df)
+    # 🟢 [수정] 저장소에 반영한 뒤에 워터마크 확정 (저장 전에 실패하면 다음 수집 때 다시 받음)
+    watermarks.commit(collect_stats.get('watermark_updates'))
+    return posts_df, comments_df, collect_stats
 
-        if comments_df is not None and not comments_df.empty:
-            comments_file_name = f"reddit_comments_data_{timestamp}.csv"
-            comments_file_path = os.path.join(SAVE_DIR, comments_file_name)
-            comments_df.to_csv(comments_file_path, index=False, encoding='utf-8-sig')
 
-    return posts_df, comments_df
+def stream_reddit_data(subreddit_names, search_query, post_limit, sort_by, time_filter, collect_comments, comment_limit,
+                       comment_options=None, watermarks=None):
+    """배치가 도착하는 대로 기본 통계/키워드/원본 데이터를 갱신하며 수집 (완료 후 저장소 반영)"""
+    subreddit_list = parse_subreddit_list(subreddit_names)
+    if not subreddit_list:
+        return pd.DataFrame(), None, {}
+    reddit_secrets = load_reddit_secrets()
+
+    panel = StreamingPanel("📡 실시간 수집 현황")
+    keyword_analyzer = RedditAnalyzer(pd.DataFrame())
+    posts_by_subreddit, comments_by_post, collect_stats = {}, {}, {}
+    posts_df = concat_posts([])
+    comment_count = 0
+
+    try:
+        for event in iter_collect_subreddits(
+            reddit_secrets, subreddit_list, search_query, post_limit, sort_by, time_filter,
+            collect_comments, comment_limit, watermarks=watermarks,
+            **options_from_secrets(reddit_secrets, comment_options)
+        ):
+            if event[0] == "posts":
+                _, subreddit_name, batch, timing = event
+                posts_by_subreddit[subreddit_name] = batch
+                posts_df = concat_posts(list(posts_by_subreddit.values()))
+                if not batch.empty:
+                    panel.add_keywords(keyword_analyzer.extract_keywords(batch['title'], top_n=None, use_cache=False))
+                message = f"r/{subreddit_name} 게시물 {len(batch):,}개 ({timing['상태']})"
+            elif event[0] == "comments":
+                _, post_id, batch = event
+                comments_by_post[post_id] = batch
+                comment_count += len(batch)
+                if not batch.empty:
+                    panel.add_keywords(keyword_analyzer.extract_keywords(batch['body'], top_n=None, use_cache=False))
+                message = f"댓글 수집 중: 게시물 {len(comments_by_post):,}개 완료"
+            else:
+                collect_stats = event[1]
+                message = "수집 완료"
+
+            panel.render({
+                "수집 서브레딧": f"{len(posts_by_subreddit)}/{len(subreddit_list)}",
+                "게시물 수": f"{len(posts_df):,}",
+                "댓글 수": f"{comment_count:,}",
+                "평균 점수": f"{posts_df['score'].mean():.1f}" if not posts_df.empty else "-",
+            }, posts_df, message, force=event[0] == "done")
+    except Exception as e:
+        raise ConnectionError(f"Reddit API 연결 오류: {e}")
+
+    posts_df, comments_df = merge_collected(subreddit_list, posts_by_subreddit, comments_by_post)
+    if not posts_df.empty:
+        save_raw_reddit_data(posts_df, comments_df)
+    if watermarks is not None:
+        watermarks.commit(collect_stats.get('watermark_updates'))  # 저장소에 반영한 뒤에 확정
+    return posts_df, comments_df, collect_stats
+
+
+def load_reddit_job_result(job, frames, stats):
+    """완료(또는 취소)된 백그라운드 작업 결과를 세션에 반영 (증분 작업은 현재 데이터에 합침)"""
+    posts_df_job, comments_df_job = frames
+    if job['params'].get('incremental'):
+        posts_df_job = merge_new_rows(st.session_state['posts_df'], posts_df_job, 'post_id')
+        comments_df_job = merge_new_rows(st.session_state['comments_df'], comments_df_job, 'comment_id')
+    if posts_df_job is None or posts_df_job.empty:
+        st.warning("작업 결과에 수집된 게시물이 없습니다.")
+        return
+    if 'timing' in stats:
+        stats['timing'] = pd.DataFrame(stats['timing'])
+    st.session_state['posts_df'] = posts_df_job
+    st.session_state['comments_df'] = comments_df_job
+    st.session_state['reddit_collect_stats'] = stats or None
 
 
 # ========================================
@@ -594,7 +648,7 @@ def main():
     # key 인수를 명시적으로 추가하여 중복 ID 오류 방지
     data_source = st.sidebar.radio(
         "데이터 입력 방식 선택",
-        ["API로 실시간 수집", "CSV 파일 업로드"],
+        ["API로 실시간 수집", "저장소에서 불러오기", "CSV 파일 업로드"],
         key="reddit_data_source_radio"
     )
     
@@ -652,14 +706,81 @@ def main():
         
         collect_comments = st.sidebar.checkbox("댓글도 수집", value=True, key="reddit_collect_comments_checkbox")
         comment_limit = st.sidebar.slider("게시물당 댓글 수", 10, 200, 50, key="reddit_comment_limit_slider") if collect_comments else 0
+        comment_options = None
+        if collect_comments:
+            with st.sidebar.expander("⚙️ 댓글 수집 고급 설정"):
+                replace_more_limit = st.number_input(
+                    "'더 보기' 펼침 횟수 (게시물당)", 0, 32, 0, key="reddit_replace_more_input",
+                    help="펼칠 때마다 API 요청이 1회 추가됩니다. 0이면 처음 받은 댓글만 사용"
+                )
+                max_comment_depth = st.number_input(
+                    "최대 댓글 깊이 (-1 = 제한 없음)", -1, 10, -1, key="reddit_comment_depth_input",
+                    help="0이면 최상위 댓글만 수집"
+                )
+                max_comment_requests = st.number_input(
+                    "댓글 단계 최대 요청 수 (0 = 제한 없음)", 0, 5000, 0, step=50, key="reddit_comment_requests_input"
+                )
+            comment_options = {
+                "replace_more_limit": int(replace_more_limit),
+                "max_comment_depth": None if max_comment_depth < 0 else int(max_comment_depth),
+                "max_comment_requests": int(max_comment_requests) or None,
+            }
+        incremental = st.sidebar.checkbox(
+            "증분 수집 (새 게시물만)", value=False, key="reddit_incremental_checkbox",
+            help="서브레딧/정렬/검색어별로 마지막에 수집한 게시물 이후의 새 게시물만 가져와 현재 데이터에 합칩니다. "
+                 "최신순(new)일 때만 이전 수집 지점에서 멈추고, 인기순/추천순은 받은 게시물 중 기존에 없던 것만 합칩니다."
+        )
+        streaming = st.sidebar.checkbox(
+            "스트리밍 수집 (도착하는 대로 표시)", value=False, key="reddit_streaming_checkbox",
+            help="수집이 끝나기를 기다리지 않고 서브레딧/댓글 배치가 도착할 때마다 통계와 키워드를 갱신합니다."
+        )
         
-        if st.sidebar.button("🚀 데이터 수집 시작", key="reddit_start_collection_button"):
-            # 1. 캐싱 함수 호출 시도
+        background = st.sidebar.checkbox(
+            "백그라운드 작업으로 실행", value=False, key="reddit_background_checkbox",
+            help="별도 워커 프로세스에서 수집합니다. 페이지를 새로고침하거나 닫아도 계속 진행되며, 완료 후 아래 작업 목록에서 불러옵니다."
+        )
+        
+        start_clicked = st.sidebar.button("🚀 데이터 수집 시작", key="reddit_start_collection_button")
+        if start_clicked and background:
+            submit_collection_job("reddit", {
+                "subreddit_names": subreddit_names, "search_query": search_query, "post_limit": post_limit,
+                "sort_by": sort_by, "time_filter": time_filter, "collect_comments": collect_comments,
+                "comment_limit": comment_limit, "comment_options": comment_options, "incremental": incremental,
+            }, label=f"r/{subreddit_names}" + (f" '{search_query}'" if search_query else "") + f" ({sort_by}, {post_limit}개)")
+            st.sidebar.success("✅ 수집 작업을 등록했습니다. 진행 상황은 '백그라운드 수집 작업'에서 확인하세요.")
+        elif start_clicked:
+            # 1. 캐싱 함수 호출 시도 (증분 수집은 캐시 없이 새 게시물만 수집)
+            collect_args = (subreddit_names, search_query, post_limit, sort_by, time_filter,
+                            collect_comments, comment_limit, comment_options)
+            stream_key = reddit_request_key(*collect_args)
             try:
-                posts_df_new, comments_df_new = get_and_cache_reddit_data(
-                    subreddit_names, search_query, post_limit, 
-                    sort_by, time_filter, collect_comments, comment_limit
-                )
+                if streaming and incremental:
+                    posts_df_new, comments_df_new, collect_stats = stream_reddit_data(
+                        *collect_args, watermarks=WatermarkStore("reddit")
+                    )
+                    posts_df_new = merge_new_rows(posts_df, posts_df_new, 'post_id')
+                    comments_df_new = merge_new_rows(comments_df, comments_df_new, 'comment_id')
+                elif streaming:
+                    # 같은 조건의 스트리밍 결과가 있으면 재사용, 없으면 수집 후 캐시
+                    cached = get_cached_result(stream_key)
+                    if cached is None:
+                        cached = stream_reddit_data(*collect_args)
+                        if not cached[0].empty:
+                            set_cached_result(stream_key, cached)
+                    posts_df_new, comments_df_new, collect_stats = cached
+                elif incremental:
+                    with st.spinner("새 게시물을 증분 수집 중입니다..."):
+                        posts_df_new, comments_df_new, collect_stats = collect_reddit_incremental(
+                            subreddit_names, search_query, post_limit,
+                            sort_by, time_filter, collect_comments, comment_limit, comment_options
+                        )
+                    posts_df_new = merge_new_rows(posts_df, posts_df_new, 'post_id')
+                    comments_df_new = merge_new_rows(comments_df, comments_df_new, 'comment_id')
+                else:
+                    posts_df_new, comments_df_new, collect_stats = get_and_cache_reddit_data(
+                        subreddit_names, search_query, post_limit, 
+                        sort_by, time_filter, collect_comments, comment_limit, comment_options
+                    )
             except ConnectionError as e:
                 st.error(f"데이터 수집 실패: {e}")
                 return
@@ -669,13 +790,46 @@ def main():
             
             # 2. 캐시된 데이터로 세션 업데이트 (저장은 이미 캐싱 함수 내부에서 완료됨)
             if posts_df_new is not None and not posts_df_new.empty:
-                st.success(f"✅ 게시물 **{len(posts_df_new):,}**개 수집/로드 완료! (파일 저장 완료)")
+                st.success(f"✅ 게시물 **{len(posts_df_new):,}**개 수집/로드 완료! (저장소 반영 완료)")
                 
                 st.session_state['posts_df'] = posts_df_new
                 st.session_state['comments_df'] = comments_df_new
+                st.session_state['reddit_collect_stats'] = collect_stats
                 st.rerun()
             else:
                 st.warning("수집된 데이터가 없습니다. (검색 조건 확인)")
+
+    elif data_source == "저장소에서 불러오기":
+        st.sidebar.subheader("🗄️ 저장소 조회")
+        partitions = data_store.list_partitions("reddit", "posts")
+        if not partitions:
+            st.sidebar.warning("저장소에 수집된 Reddit 데이터가 없습니다. 먼저 API로 수집하세요.")
+        else:
+            dated = [d for d in partitions if d != "unknown"]
+            default_range = (datetime.strptime(dated[0], "%Y-%m-%d").date(), datetime.strptime(dated[-1], "%Y-%m-%d").date()) if dated else ()
+            date_range = st.sidebar.date_input("게시일 범위", value=default_range, key="reddit_store_date_range")
+            store_subreddits = st.sidebar.text_input(
+                "서브레딧 필터 (쉼표로 구분, 비우면 전체)", value="", key="reddit_store_subreddits_input",
+                help="저장된 서브레딧 이름과 대소문자까지 같아야 합니다. (예: AsianBeauty)"
+            )
+            include_selftext = st.sidebar.checkbox("게시물 본문 포함", value=True, key="reddit_store_selftext_checkbox")
+            include_comments = st.sidebar.checkbox("댓글 포함", value=True, key="reddit_store_comments_checkbox")
+
+            if st.sidebar.button("📥 불러오기", key="reddit_store_load_button"):
+                start_date = date_range[0].isoformat() if len(date_range) > 0 else None
+                end_date = date_range[1].isoformat() if len(date_range) > 1 else None
+                posts_df_loaded, comments_df_loaded = load_reddit_from_store(
+                    start_date, end_date,
+                    tuple(parse_subreddit_list(store_subreddits)),
+                    include_selftext, include_comments
+                )
+                if posts_df_loaded.empty:
+                    st.sidebar.warning("조건에 맞는 데이터가 없습니다.")
+                else:
+                    st.session_state['posts_df'] = posts_df_loaded
+                    st.session_state['comments_df'] = comments_df_loaded
+                    st.session_state.pop('reddit_collect_stats', None)
+                    st.rerun()
     
     else: 
         st.sidebar.subheader("📤 파일 업로드")
@@ -695,11 +849,37 @@ def main():
         if posts_file or comments_file:
             st.rerun()
 
+    # 🟢 [추가] 백그라운드 수집 작업 목록 (새로고침해도 유지)
+    render_job_panel("reddit", ["posts", "comments"], load_reddit_job_result)
+
     # 데이터가 없으면 안내 메시지
     if posts_df.empty:
         st.info("👆 왼쪽 사이드바에서 데이터를 수집하거나 업로드해주세요.")
         return 
 
+    # 🟢 [추가] 마지막 API 수집의 서브레딧별 소요 시간
+    collect_stats = st.session_state.get('reddit_collect_stats')
+    if collect_stats and 'timing' in collect_stats:
+        with st.expander(f"⏱️ 서브레딧별 수집 시간 (전체 {collect_stats['total_seconds']}초, 요청 {collect_stats['request_count']:,}회)"):
+            st.dataframe(collect_stats['timing'], use_container_width=True)
+            if 'comment_posts' in collect_stats:
+                st.caption(
+                    f"리스팅 {collect_stats['listing_seconds']}초 · 댓글 {collect_stats['comment_seconds']}초 "
+                    f"(요청 {collect_stats['comment_requests']:,}회) · 댓글 대상 게시물 {collect_stats['comment_posts']:,}개 중 "
+                    f"{collect_stats['truncated_posts']:,}개 잘림 (요청 한도로 건너뜀 {collect_stats['budget_skipped_posts']:,}개, "
+                    f"오류 {collect_stats['failed_posts']:,}개)"
+                )
+            if 'retries' in collect_stats:
+                st.caption(
+                    f"요청 속도 조절 대기 {collect_stats['rate_wait_seconds']}초 · 재시도 {collect_stats['retries']:,}회 "
+                    f"(백오프 {collect_stats['retry_wait_seconds']}초, 한도 초과 응답 {collect_stats['throttled_responses']:,}회) · "
+                    f"재시도 후 누락된 서브레딧 {collect_stats['dropped_subreddits']:,}개"
+                )
+            if 'cached_posts' in collect_stats:
+                st.caption(
+                    f"캐시 재사용: 게시물 {collect_stats['cached_posts']:,}개 · 댓글 {collect_stats['cached_comments']:,}개"
+                )
+
     # 기본 통계
     st.header("📈 기본 통계")
     col1, col2, col3, col4 = st.columns(4)
@@ -798,12 +978,13 @@ def main():
         if not text_sources_available: st.warning("텍스트 데이터(제목, 본문, 댓글)가 없어 분석을 수행할 수 없습니다.")
         else:
             text_source = st.radio("텍스트 소스", text_sources_available, horizontal=True, key="reddit_sentiment_source_radio")
+            lexicon = sentiment_view.lexicon_controls("reddit", RedditAnalyzer.POSITIVE_WORDS, RedditAnalyzer.NEGATIVE_WORDS)
 
             if st.button("🔍 감성 분석 실행", key="reddit_btn_sentiment"):
                 with st.spinner(f"{text_source} 감성 분석 중..."):
-                    if text_source == "게시물 제목": fig, sentiment_counts, sentiment_df = analyzer.sentiment_analysis(posts_df['title'], posts_df)
-                    elif text_source == "게시물 본문": fig, sentiment_counts, sentiment_df = analyzer.sentiment_analysis(posts_df['selftext'], posts_df)
-                    else: fig, sentiment_counts, sentiment_df = analyzer.sentiment_analysis(comments_df['body'], comments_df)
+                    if text_source == "게시물 제목": fig, sentiment_counts, sentiment_df = analyzer.sentiment_analysis(posts_df['title'], posts_df, lexicon)
+                    elif text_source == "게시물 본문": fig, sentiment_counts, sentiment_df = analyzer.sentiment_analysis(posts_df['selftext'], posts_df, lexicon)
+                    else: fig, sentiment_counts, sentiment_df = analyzer.sentiment_analysis(comments_df['body'], comments_df, lexicon)
                     
                     if fig:
                         st.pyplot(fig)
@@ -907,9 +1088,8 @@ def main():
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             csv_file_name = f"reddit_posts_data_{timestamp}.csv"
-            # 🔴 [수정] 원본 데이터 저장 로직 제거 (이미 수집 시 저장됨). 다운로드용 파일 이름만 생성
-            # posts_df.to_csv(os.path.join(SAVE_DIR, csv_file_name), index=False, encoding='utf-8-sig')
-            st.success(f"원본 데이터 파일은 수집 시점에 **{csv_file_name}**로 서버에 저장되었습니다.")
+            # 🔴 [수정] 원본 데이터는 수집 시점에 저장소(data_store)에 반영됨. 다운로드용 파일 이름만 생성
+            st.success(f"원본 데이터는 수집 시점에 저장소 `{data_store.DATA_DIR}/reddit`에 저장되었습니다.")
             csv_data = posts_df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
             st.download_button("💾 게시물 데이터 CSV 다운로드", csv_data, csv_file_name, "text/csv", key='reddit_download-posts-raw')
         else:
@@ -923,9 +1103,8 @@ def main():
                 
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 csv_file_name = f"reddit_comments_data_{timestamp}.csv"
-                # 🔴 [수정] 원본 데이터 저장 로직 제거 (이미 수집 시 저장됨). 다운로드용 파일 이름만 생성
-                # comments_df.to_csv(os.path.join(SAVE_DIR, csv_file_name), index=False, encoding='utf-8-sig')
-                st.success(f"원본 데이터 파일은 수집 시점에 **{csv_file_name}**로 서버에 저장되었습니다.")
+                # 🔴 [수정] 원본 데이터는 수집 시점에 저장소(data_store)에 반영됨. 다운로드용 파일 이름만 생성
+                st.success(f"원본 데이터는 수집 시점에 저장소 `{data_store.DATA_DIR}/reddit`에 저장되었습니다.")
                 csv_data = comments_df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
                 st.download_button("💾 댓글 데이터 CSV 다운로드", csv_data, csv_file_name, "text/csv", key='reddit_download-comments-raw')
             else: st.warning("댓글 데이터가 없습니다.")
@@ -2,16 +2,24 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
 from datetime import datetime
 import re
 from wordcloud import WordCloud
 import io
-from googleapiclient.discovery import build
+import youtube_collector
 import os
-import time
 import requests 
 import openai # OpenAI 임포트 추가
+import data_store
+import youtube_quota
+import youtube_http_cache
+import youtube_snapshots
+import text_analysis
+import sentiment_view
+from collection_cache import YouTubeCollectionCache, youtube_request_key
+from crawl_state import WatermarkStore, merge_new_rows
+from stream_view import StreamingPanel, get_cached_result, set_cached_result
+from job_view import render_job_panel, submit_collection_job
 
 # ========================================
 # Streamlit 기본 설정 및 공통 연결 함수
@@ -195,32 +203,26 @@ class YouTubeCommentAnalyzer:
         if 'published_at' in self.comments_df.columns:
             self.comments_df['published_at'] = pd.to_datetime(self.comments_df['published_at'])
     
-    # ... (이하 preprocess_text, extract_keywords, wordcloud, 
-    #      keyword_frequency, sentiment_keywords, time_trend, 
-    #      cooccurrence, topic_comparison 함수들은 원본과 동일하게 유지) ...
+    # 🟢 [수정] 전처리/토큰화는 text_analysis의 공유 캐시에서 데이터셋(댓글 내용)마다 한 번만 수행하고
+    #      각 분석 함수는 캐시된 토큰을 읽음 (탭을 바꿀 때마다 전체 댓글에 정규식을 다시 돌리지 않음)
+    @property
+    def corpus(self):
+        return text_analysis.get_corpus(self.comments_df['text'])
+
     def preprocess_text(self, text):
-        if pd.isna(text):
-            return ""
-        text = str(text).lower()
-        text = re.sub(r'http\S+|www\S+', '', text)
-        text = re.sub(r'[^가-힣a-z0-9\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
-
-    def extract_keywords(self, min_length=2, top_n=50):
-        all_text = ' '.join(self.comments_df['text'].apply(self.preprocess_text))
-        words = all_text.split()
-        words = [w for w in words if len(w) >= min_length]
+        return text_analysis.preprocess_text(text)
+
+    def extract_keywords(self, min_length=2, top_n=50, use_cache=True):
+        """use_cache=False: 스트리밍 배치처럼 한 번만 쓰는 댓글은 공유 캐시에 넣지 않고 토큰화"""
         stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
                      'of', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has', 'had',
                      '그', '이', '저', '것', '수', '등', '들', '및', '또한', '하다', '있다', '되다',
                      '이것', '그것', '저것', '그런', '이런', '저런'}
-        words = [w for w in words if w not in stopwords]
-        word_freq = Counter(words)
-        return word_freq.most_common(top_n)
+        corpus = self.corpus if use_cache else text_analysis.get_corpus(self.comments_df['text'], use_cache=False)
+        return text_analysis.top_keywords(corpus, top_n, min_length, stopwords)
 
     def wordcloud(self, width=1200, height=800):
-        all_text = ' '.join(self.comments_df['text'].apply(self.preprocess_text))
+        all_text = self.corpus.text
         try:
             font_path = 'C:/Windows/Fonts/malgun.ttf'
         except:
@@ -251,35 +253,27 @@ class YouTubeCommentAnalyzer:
         freq_df = pd.DataFrame(keywords, columns=['Keyword', 'Frequency'])
         return fig, freq_df
 
-    def sentiment_keywords(self):
-        positive_words = {
-            '좋다', '최고', '대박', '예쁘다', '이쁘다', '멋지다', '훌륭하다', 
-            '완벽', '좋아', '감사', '사랑', '행복', '추천', '굿', 'good', 
-            'best', 'love', 'amazing', 'perfect', 'great', 'excellent',
-            '좋아요', '좋네요', '멋있다', '아름답다', '최고다', '짱'
-        }
-        negative_words = {
-            '싫다', '별로', '안좋다', '나쁘다', '최악', '형편없다',
-            '싫어', '실망', '별로네', '아쉽다', 'bad', 'worst', 'hate',
-            '싫어요', '별로예요', '그저그렇다', '지루하다'
-        }
-        
-        def calculate_sentiment(text):
-            text = self.preprocess_text(text)
-            words = text.split()
-            pos_count = sum(1 for w in words if w in positive_words)
-            neg_count = sum(1 for w in words if w in negative_words)
-            return pos_count, neg_count
-        
-        self.comments_df[['PositiveCount', 'NegativeCount']] = \
-            self.comments_df['text'].apply(lambda x: pd.Series(calculate_sentiment(x)))
-        
-        def classify_sentiment(row):
-            if row['PositiveCount'] > row['NegativeCount']: return '긍정'
-            elif row['PositiveCount'] < row['NegativeCount']: return '부정'
-            else: return '중립'
+    POSITIVE_WORDS = {
+        '좋다', '최고', '대박', '예쁘다', '이쁘다', '멋지다', '훌륭하다', 
+        '완벽', '좋아', '감사', '사랑', '행복', '추천', '굿', 'good', 
+        'best', 'love', 'amazing', 'perfect', 'great', 'excellent',
+        '좋아요', '좋네요', '멋있다', '아름답다', '최고다', '짱'
+    }
+    NEGATIVE_WORDS = {
+        '싫다', '별로', '안좋다', '나쁘다', '최악', '형편없다',
+        '싫어', '실망', '별로네', '아쉽다', 'bad', 'worst', 'hate',
+        '싫어요', '별로예요', '그저그렇다', '지루하다'
+    }
+
+    # 🟢 [수정] lexicon: text_analysis.SentimentLexicon (없으면 기본 사전, 부정어 처리 없음)
+    def sentiment_keywords(self, lexicon=None):
+        if lexicon is None:
+            lexicon = text_analysis.SentimentLexicon(self.POSITIVE_WORDS, self.NEGATIVE_WORDS)
         
-        self.comments_df['sentiment'] = self.comments_df.apply(classify_sentiment, axis=1)
+        pos_counts, neg_counts, labels = lexicon.classify(self.corpus)
+        self.comments_df['PositiveCount'] = pos_counts
+        self.comments_df['NegativeCount'] = neg_counts
+        self.comments_df['sentiment'] = labels
         sentiment_counts = self.comments_df['sentiment'].value_counts()
         
         fig, axes = plt.subplots(1, 2, figsize=(15, 6))
@@ -345,24 +339,23 @@ class YouTubeCommentAnalyzer:
         })
         return fig, trend_df
 
-    def cooccurrence(self, top_n=15):
+    # 🟢 [수정] 동시출현은 text_analysis의 희소 행렬 곱(B.T @ B)으로 계산 → 키워드 수백 개까지 가능
+    #      window: None이면 댓글 단위, 숫자면 연속 토큰 window개 창 단위 / measure: 'count', 'lift', 'pmi'
+    COOC_ANNOTATE_MAX = 20   # 이보다 키워드가 많으면 칸 안 숫자 표시 생략
+    COOC_LABELS = {'count': '동시출현 빈도', 'lift': 'Lift', 'pmi': 'PMI'}
+
+    def cooccurrence(self, top_n=15, window=None, measure='count'):
         top_keywords = [word for word, _ in self.extract_keywords(top_n=top_n)]
-        cooc_matrix = pd.DataFrame(0, index=top_keywords, columns=top_keywords)
-        
-        for text in self.comments_df['text']:
-            text = self.preprocess_text(text)
-            words = set(text.split())
-            
-            for word1 in top_keywords:
-                if word1 in words:
-                    for word2 in top_keywords:
-                        if word2 in words:
-                            cooc_matrix.loc[word1, word2] += 1
+        cooc_matrix = text_analysis.cooccurrence_matrix(self.corpus, top_keywords, window=window, measure=measure)
         
-        fig, ax = plt.subplots(figsize=(14, 12))
-        sns.heatmap(cooc_matrix, annot=True, fmt='d', cmap='YlOrRd', 
-                    cbar_kws={'label': '동시출현 빈도'}, ax=ax)
-        ax.set_title(f'상위 {top_n}개 키워드 동시출현 분석', fontsize=16, pad=20)
+        size = max(14, min(len(top_keywords) * 0.25, 40))
+        fig, ax = plt.subplots(figsize=(size, size * 12 / 14))
+        sns.heatmap(cooc_matrix, annot=len(top_keywords) <= self.COOC_ANNOTATE_MAX,
+                    fmt='d' if measure == 'count' else '.2f', cmap='YlOrRd',
+                    cbar_kws={'label': self.COOC_LABELS[measure]}, ax=ax)
+        unit = f'{window}단어 창' if window else '댓글'
+        ax.set_title(f'상위 {len(top_keywords)}개 키워드 동시출현 분석 ({unit} 단위, {self.COOC_LABELS[measure]})',
+                     fontsize=16, pad=20)
         ax.set_xlabel('Keyword2', fontsize=12) 
         ax.set_ylabel('Keyword1', fontsize=12) 
         plt.tight_layout()
@@ -376,21 +369,9 @@ class YouTubeCommentAnalyzer:
         if 'video_title' not in self.comments_df.columns:
             return None, None
         
-        video_keywords = {}
-        
-        for video_title in self.comments_df['video_title'].unique()[:10]:
-            video_comments = self.comments_df[
-                self.comments_df['video_title'] == video_title
-            ]['text']
-            
-            all_text = ' '.join(video_comments.apply(self.preprocess_text))
-            words = all_text.split()
-            words = [w for w in words if len(w) >= 2]
-            
-            word_freq = Counter(words)
-            top_words = [word for word, _ in word_freq.most_common(5)]
-            
-            video_keywords[video_title[:30] + '...'] = top_words
+        video_titles = self.comments_df['video_title'].unique()[:10]
+        top_words = text_analysis.group_top_words(self.corpus, self.comments_df['video_title'], video_titles)
+        video_keywords = {video_title[:30] + '...': top_words[video_title] for video_title in video_titles}
         
         comparison_df = pd.DataFrame(video_keywords).T
         comparison_df.columns = [f'Keyword{i+1}' for i in range(comparison_df.shape[1])]
@@ -430,10 +411,8 @@ class YouTubeCommentAnalyzer:
 # YouTube 데이터 수집 함수 (API Key 로드 수정)
 # =========================================================================================
 
-def search_and_collect_data(keyword, max_videos, max_comments_per_video, order):
-    """YouTube API를 통한 데이터 수집 (st.secrets 사용)"""
-    
-    # [통합] secrets.toml에서 YouTube API 키 로드
+def load_youtube_api_key():
+    """secrets.toml의 [youtube] 섹션에서 API 키 로드"""
     try:
         # [youtube] 섹션의 YOUTUBE_API_KEY (대문자)
         api_key = st.secrets["youtube"]["YOUTUBE_API_KEY"]
@@ -442,150 +421,229 @@ def search_and_collect_data(keyword, max_videos, max_comments_per_video, order):
     
     if not api_key:
         raise ConnectionError("YouTube API 키가 secrets.toml에 비어있습니다.")
-        
-    youtube = build("youtube", "v3", developerKey=api_key)
-    
-    # ... (이하 영상 검색, 상세 정보, 댓글 수집 로직은 원본과 동일) ...
-    try:
-        search_response = youtube.search().list(
-            q=keyword,
-            part="snippet",
-            maxResults=min(max_videos, 50),
-            type="video",
-            order=order,
-            regionCode="KR"
-        ).execute()
-        video_ids = [item["id"]["videoId"] for item in search_response["items"]]
-    except Exception as e:
-        raise ConnectionError(f"검색 오류: {e}")
-    
-    videos_data = []
+    # 🟢 [추가] api_root가 있으면 실제 API 대신 해당 서버(예: fake_youtube.py)로 요청
+    youtube_collector.set_api_root(st.secrets["youtube"].get("api_root"))
+    return api_key
+
+
+def load_youtube_daily_quota():
+    """secrets.toml [youtube]의 daily_quota (없으면 기본 일일 할당량)"""
     try:
-        for i in range(0, len(video_ids), 50):
-            batch_ids = video_ids[i:i+50]
-            video_response = youtube.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=",".join(batch_ids)
-            ).execute()
-            
-            for item in video_response["items"]:
-                video_info = {
-                    "video_id": item["id"],
-                    "title": item["snippet"]["title"],
-                    "channel": item["snippet"]["channelTitle"],
-                    "published_at": item["snippet"]["publishedAt"],
-                    "description": item["snippet"]["description"],
-                    "view_count": int(item["statistics"].get("viewCount", 0)),
-                    "like_count": int(item["statistics"].get("likeCount", 0)),
-                    "comment_count": int(item["statistics"].get("commentCount", 0)),
-                    "duration": item["contentDetails"]["duration"],
-                    "tags": ", ".join(item["snippet"].get("tags", [])),
-                    "url": f"https://www.youtube.com/watch?v={item['id']}"
-                }
-                videos_data.append(video_info)
-    except Exception as e:
-        raise ConnectionError(f"영상 정보 수집 오류: {e}")
-    
-    videos_df = pd.DataFrame(videos_data)
-    
-    all_comments = []
-    video_info_dict = {}
-    for _, row in videos_df.iterrows():
-        video_info_dict[row['video_id']] = {
-            'title': row['title'],
-            'channel': row['channel'],
-            'url': row['url']
-        }
-    
-    for idx, video_id in enumerate(video_ids):
-        try:
-            comments = []
-            next_page_token = None
-            
-            while len(comments) < max_comments_per_video:
-                request = youtube.commentThreads().list(
-                    part="snippet,replies",
-                    videoId=video_id,
-                    maxResults=min(100, max_comments_per_video - len(comments)),
-                    pageToken=next_page_token,
-                    textFormat="plainText",
-                    order="relevance"
-                )
-                response = request.execute()
-                
-                for item in response["items"]:
-                    top_comment = item["snippet"]["topLevelComment"]["snippet"]
-                    
-                    comment_info = {
-                        "comment_id": item["snippet"]["topLevelComment"]["id"],
-                        "video_id": video_id,
-                        "author": top_comment["authorDisplayName"],
-                        "text": top_comment["textDisplay"],
-                        "like_count": top_comment["likeCount"],
-                        "published_at": top_comment["publishedAt"],
-                        "reply_count": item["snippet"]["totalReplyCount"]
-                    }
-                    
-                    if video_id in video_info_dict:
-                        comment_info['video_title'] = video_info_dict[video_id]['title']
-                        comment_info['video_channel'] = video_info_dict[video_id]['channel']
-                        comment_info['video_url'] = video_info_dict[video_id]['url']
-                    
-                    comments.append(comment_info)
-                
-                next_page_token = response.get("nextPageToken")
-                if not next_page_token:
-                    break
-                
-                time.sleep(0.5)
-            
-            all_comments.extend(comments)
-        
-        except Exception as e:
-            if "commentsDisabled" not in str(e):
-                pass
-        
-        time.sleep(1)
-    
-    comments_df = pd.DataFrame(all_comments)
-    
-    return videos_df, comments_df
+        return int(st.secrets["youtube"].get("daily_quota", youtube_quota.DEFAULT_DAILY_QUOTA))
+    except KeyError:
+        return youtube_quota.DEFAULT_DAILY_QUOTA
+
+
+def render_quota_status(max_videos, max_comments_per_video, estimate=None, include_replies=False):
+    """사이드바에 오늘 남은 할당량과 현재 설정의 예상 사용량 표시 후 (남은 할당량) 반환
+
+    estimate: 예상 사용량을 직접 넘길 때 (증분 동기화 등, 없으면 검색 수집 기준으로 계산)
+    include_replies: 답글 수집 시 답글 추가 요청의 상한까지 포함
+    """
+    daily_quota = load_youtube_daily_quota()
+    usage = youtube_quota.get_ledger().usage()
+    remaining = max(0, daily_quota - usage["used"])
+    estimate = estimate or youtube_quota.estimate_cost(max_videos, max_comments_per_video, include_replies)
+
+    st.sidebar.subheader("📊 API 할당량")
+    st.sidebar.metric("오늘 남은 할당량", f"{remaining:,} / {daily_quota:,}",
+                      delta=f"예상 사용 최대 {estimate['total']:,}", delta_color="off")
+    st.sidebar.progress(min(1.0, usage["used"] / daily_quota) if daily_quota else 1.0)
+    st.sidebar.caption(
+        f"검색 {estimate['search']:,} · 영상 정보 {estimate['videos']:,} · 댓글 {estimate['comments']:,} "
+        + (f"· 답글 최대 {estimate['replies']:,} " if estimate['replies'] else "")
+        + f"(캐시에 있는 부분은 사용하지 않음, 태평양 시간 자정에 초기화)"
+    )
+    # 🟢 [추가] 응답 디스크 캐시 사용 현황 (이 프로세스 기준)
+    cache_stats = youtube_http_cache.get_response_cache().stats()
+    if any(cache_stats.values()):
+        st.sidebar.caption(
+            f"응답 캐시: 적중 {cache_stats['hits']:,} · ETag 재검증 {cache_stats['revalidated']:,} · "
+            f"API 호출 {cache_stats['misses']:,}"
+        )
+    return remaining
+
+
+def iter_youtube_batches(keyword, max_videos, max_comments_per_video, order, include_replies=False):
+    """YouTube API를 통한 데이터 수집 (st.secrets 사용) - 도착하는 대로 yield"""
+    return youtube_collector.iter_youtube_batches(
+        load_youtube_api_key(), keyword, max_videos, max_comments_per_video, order,
+        include_replies=include_replies
+    )
+
+
+def search_and_collect_data(keyword, max_videos, max_comments_per_video, order, include_replies=False):
+    """iter_youtube_batches 결과를 모두 모아 (영상 df, 댓글 df, 통계) 반환"""
+    videos_df, comment_frames, collect_stats = pd.DataFrame(), [], {}
+    for event in iter_youtube_batches(keyword, max_videos, max_comments_per_video, order, include_replies):
+        if event[0] == "videos":
+            videos_df = event[1]
+        elif event[0] == "comments":
+            comment_frames.append(event[2])
+        else:
+            collect_stats = event[1]
+    # 🟢 [수정] 영상 정보는 댓글을 모두 모은 뒤 한 번만 붙임
+    comments_df = youtube_collector.attach_video_info(youtube_collector.concat_comments(comment_frames), videos_df)
+    return videos_df, comments_df, collect_stats
 
 
 # =========================================================================================
-# 캐싱 적용 함수: 데이터 수집 및 1회 파일 저장 (수정 없음)
+# 캐싱 적용 함수: 데이터 수집 및 1회 저장소 반영
 # =========================================================================================
 
 # ConnectionError를 Streamlit 위젯 오류 없이 처리하기 위해 커스텀 예외 클래스 정의
 class ConnectionError(Exception):
     pass
 
-@st.cache_data(show_spinner="YouTube 데이터를 수집 및 캐싱 중입니다. (최초 1회 실행)")
-def get_and_cache_youtube_data(keyword, max_videos, max_comments_per_video, order):
-    """YouTube API를 통해 데이터를 수집하고 캐시합니다. 인자가 바뀌지 않는 한 재실행되지 않습니다."""
-    
+def save_raw_youtube_data(videos_df, comments_df):
+    """수집 원본을 저장소(data_store)에 video_id/comment_id 기준 upsert"""
+    if videos_df is not None and not videos_df.empty:
+        data_store.upsert("youtube", "videos", videos_df)
+    if comments_df is not None and not comments_df.empty:
+        data_store.upsert("youtube", "comments", comments_df)
+
+
+@st.cache_resource
+def youtube_collection_cache():
+    """세션 간 공유되는 수집 결과 캐시 (키워드 대소문자/공백이 달라도 같은 요청으로 취급)"""
+    return YouTubeCollectionCache()
+
+
+def get_and_cache_youtube_data(keyword, max_videos, max_comments_per_video, order, include_replies=False):
+    """YouTube API를 통해 데이터를 수집하고 캐시합니다.
+
+    🟢 [수정] 영상/댓글 단위로 캐시 → 더 적은 영상/댓글 요청은 캐시된 결과를 잘라서 반환하고,
+    캐시에 없는 영상 정보와 모자란 댓글만 API로 추가 수집
+    """
+    api_key = load_youtube_api_key()
+    with st.spinner("YouTube 데이터를 수집 중입니다. (캐시에 없는 부분만 수집)"):
+        try:
+            # 새로 수집한 행만 저장소에 반영 (캐시에서 꺼낸 행은 이미 저장됨)
+            return youtube_collection_cache().collect(
+                api_key, keyword, max_videos, max_comments_per_video, order, on_fetch=save_raw_youtube_data,
+                include_replies=include_replies
+            )
+        except youtube_collector.YouTubeAPIError as e:
+            raise ConnectionError(f"데이터 수집 중 API 오류 발생: {e}")
+        except Exception as e:
+            raise ConnectionError(f"데이터 수집 중 예기치 않은 오류 발생: {e}")
+
+
+PREVIEW_VIDEOS = 5  # 원본 미리보기는 마지막 몇 행만 보여 주므로 최근 영상의 댓글만 합쳐서 넘김
+
+
+def stream_youtube_data(keyword, max_videos, max_comments_per_video, order, include_replies=False):
+    """영상별 댓글이 도착하는 대로 기본 통계/키워드/원본 데이터를 갱신하며 수집 (완료 후 저장소 반영)"""
+    panel = StreamingPanel("📡 실시간 수집 현황")
+    videos_df, comment_frames, collect_stats = pd.DataFrame(), [], {}
+    done_videos = 0
+    comment_count, total_likes = 0, 0
+
     try:
-        videos_df, comments_df = search_and_collect_data(keyword, max_videos, max_comments_per_video, order)
+        for event in iter_youtube_batches(keyword, max_videos, max_comments_per_video, order, include_replies):
+            if event[0] == "videos":
+                videos_df = event[1]
+                message = f"영상 {len(videos_df):,}개 정보 수집 완료"
+            elif event[0] == "done":
+                collect_stats = event[1]
+                message = f"수집 완료 (영상 {collect_stats['videos_per_second']}개/초, 댓글 {collect_stats['comments_per_second']}개/초)"
+            else:
+                _, video_id, batch = event
+                comment_frames.append(batch)
+                comment_count += len(batch)
+                total_likes += int(batch['like_count'].sum())
+                done_videos += 1
+                if not batch.empty:
+                    panel.add_keywords(YouTubeCommentAnalyzer(batch).extract_keywords(top_n=None, use_cache=False))
+                message = f"{video_id} 댓글 {len(batch):,}개"
+
+            panel.render({
+                "수집 영상": f"{done_videos}/{len(videos_df)}",
+                "총 댓글 수": f"{comment_count:,}",
+                "평균 좋아요": f"{total_likes / comment_count:.1f}" if comment_count else "-",
+                "총 좋아요": f"{total_likes:,}",
+            }, youtube_collector.concat_comments(comment_frames[-PREVIEW_VIDEOS:]), message, force=event[0] == "done")
     except ConnectionError as e:
         raise ConnectionError(f"데이터 수집 중 API 오류 발생: {e}")
     except Exception as e:
         raise ConnectionError(f"데이터 수집 중 예기치 않은 오류 발생: {e}")
 
-    if videos_df is not None and not videos_df.empty:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        videos_file_name = f"youtube_videos_raw_{timestamp}.csv"
-        videos_file_path = os.path.join(SAVE_DIR, videos_file_name)
-        videos_df.to_csv(videos_file_path, index=False, encoding='utf-8-sig')
-
-        if comments_df is not None and not comments_df.empty:
-            comments_file_name = f"youtube_comments_raw_{timestamp}.csv"
-            comments_file_path = os.path.join(SAVE_DIR, comments_file_name)
-            comments_df.to_csv(comments_file_path, index=False, encoding='utf-8-sig')
-    
+    comments_df = youtube_collector.attach_video_info(youtube_collector.concat_comments(comment_frames), videos_df)
+    if not videos_df.empty:
+        save_raw_youtube_data(videos_df, comments_df)
+    return videos_df, comments_df, collect_stats
+
+
+def sync_tracked_youtube_data(video_ids, max_new_comments, include_replies=False):
+    """추적 영상 증분 동기화: 영상별 워터마크 이후의 새 댓글만 수집해 저장소에 추가 (캐시하지 않음)"""
+    api_key = load_youtube_api_key()
+    ledger = youtube_quota.get_ledger()
+    used_before = ledger.usage()["used"]
+    watermarks = WatermarkStore("youtube")
+    videos_df, comment_frames, collect_stats = pd.DataFrame(), [], {}
+    with st.spinner(f"추적 영상 {len(video_ids):,}개의 새 댓글을 확인 중입니다..."):
+        try:
+            for event in youtube_collector.iter_tracked_video_batches(
+                api_key, video_ids, max_new_comments, watermarks, include_replies=include_replies
+            ):
+                if event[0] == "videos":
+                    videos_df = event[1]
+                elif event[0] == "comments":
+                    comment_frames.append(event[2])
+                else:
+                    collect_stats = event[1]
+        except youtube_collector.YouTubeAPIError as e:
+            raise ConnectionError(f"데이터 수집 중 API 오류 발생: {e}")
+        except Exception as e:
+            raise ConnectionError(f"데이터 수집 중 예기치 않은 오류 발생: {e}")
+
+    comments_df = youtube_collector.attach_video_info(youtube_collector.concat_comments(comment_frames), videos_df)
+    save_raw_youtube_data(videos_df, comments_df)
+    # 🟢 [수정] 저장소에 반영한 뒤에 워터마크 확정 (저장 중 오류가 나면 다음 동기화 때 다시 받음)
+    watermarks.commit(collect_stats.get('watermark_updates'))
+    collect_stats['quota_used'] = ledger.usage()["used"] - used_before
+    return videos_df, comments_df, collect_stats
+
+
+YOUTUBE_VIDEO_COLUMNS = ['video_id', 'title', 'channel', 'published_at', 'view_count', 'like_count', 'comment_count', 'duration', 'tags', 'url']
+YOUTUBE_COMMENT_COLUMNS = ['comment_id', 'parent_id', 'video_id', 'author', 'text', 'like_count', 'published_at', 'reply_count', 'video_title', 'video_channel', 'video_url']
+
+
+@st.cache_data(ttl=60, show_spinner="저장소에서 YouTube 데이터를 불러오는 중입니다.")
+def load_youtube_from_store(start_date, end_date, include_description):
+    """저장소에서 댓글 작성일 기준 기간(파티션)/컬럼을 골라 읽고, 해당 댓글의 영상만 함께 읽기"""
+    comments_df = data_store.load("youtube", "comments", columns=YOUTUBE_COMMENT_COLUMNS,
+                                  start_date=start_date, end_date=end_date)
+    if comments_df.empty:
+        return None, comments_df
+    video_columns = YOUTUBE_VIDEO_COLUMNS + (['description'] if include_description else [])
+    video_ids = comments_df['video_id'].dropna().unique().tolist()
+    videos_df = data_store.load("youtube", "videos", columns=video_columns,
+                                filters=[("video_id", "in", video_ids)])
     return videos_df, comments_df
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def load_video_snapshots(video_ids):
+    """저장소의 영상 통계 스냅샷 (video_ids: 해시 가능한 튜플)"""
+    return youtube_snapshots.load_snapshots(list(video_ids))
+
+
+def load_youtube_job_result(job, frames, stats):
+    """완료(또는 취소)된 백그라운드 작업 결과를 세션에 반영"""
+    videos_df_job, comments_df_job = frames
+    if job['params'].get('video_ids'):
+        # 증분 동기화 작업은 새 댓글만 들어 있으므로 현재 데이터에 합침
+        videos_df_job = merge_new_rows(st.session_state['videos_df'], videos_df_job, 'video_id')
+        comments_df_job = merge_new_rows(st.session_state['comments_df'], comments_df_job, 'comment_id')
+    if comments_df_job is None or comments_df_job.empty:
+        st.warning("작업 결과에 수집된 댓글이 없습니다.")
+        return
+    st.session_state['videos_df'] = videos_df_job
+    st.session_state['comments_df'] = comments_df_job
+    st.session_state['youtube_collect_stats'] = stats or None
+
+
 # ========================================
 # Streamlit 메인 앱 (페이지 로직) (API Key 로드 수정)
 # ========================================
@@ -602,7 +660,7 @@ def main():
     st.sidebar.header("📂 데이터 소스")
     data_source = st.sidebar.radio(
         "데이터 입력 방식 선택",
-        ["API로 실시간 수집", "CSV 파일 업로드"],
+        ["API로 실시간 수집", "저장소에서 불러오기", "CSV 파일 업로드"],
         key="youtube_data_source_radio"
     )
     
@@ -617,23 +675,117 @@ def main():
     
     if data_source == "API로 실시간 수집":
         st.sidebar.subheader("🔍 검색 설정")
-        keyword = st.sidebar.text_input("검색 키워드", value="K-beauty", key="youtube_keyword_input")
-        max_videos = st.sidebar.slider("영상 개수", 1, 50, 10, key="youtube_max_videos_slider")
-        max_comments = st.sidebar.slider("영상당 댓글 수", 10, 200, 50, key="youtube_max_comments_slider")
-        order = st.sidebar.selectbox(
-            "정렬 방식",
-            ["relevance", "date", "viewCount"],
-            format_func=lambda x: {"relevance": "관련성순", "date": "최신순", "viewCount": "조회수순"}[x],
-            key="youtube_order_select"
+        # 🟢 [추가] 추적 영상 증분 동기화: 검색 없이 지정한 영상의 새 댓글만 (영상별 워터마크 이후)
+        incremental = st.sidebar.checkbox(
+            "추적 영상 증분 동기화 (새 댓글만)", value=False, key="youtube_incremental_checkbox",
+            help="지정한 영상마다 마지막으로 받은 가장 최신 댓글 이후의 새 댓글만 최신순으로 받아 현재 데이터에 합칩니다. "
+                 "새 댓글이 없는 영상은 요청 1회로 끝납니다."
         )
+        if incremental:
+            tracked = youtube_collector.tracked_video_ids(WatermarkStore("youtube"))
+            if not tracked and videos_df is not None and 'video_id' in videos_df.columns:
+                tracked = videos_df['video_id'].dropna().astype(str).tolist()
+            video_ids = youtube_collector.parse_video_ids(st.sidebar.text_area(
+                "추적할 영상 (ID 또는 URL, 줄바꿈/쉼표 구분)", value="\n".join(tracked), key="youtube_tracked_videos_input",
+                help="한 번 동기화한 영상은 다음에 자동으로 목록에 포함됩니다."
+            ))
+            keyword, order = None, "time"
+            max_videos = len(video_ids)
+            max_comments = st.sidebar.slider("영상당 새 댓글 상한", 10, 1000, 200, key="youtube_max_new_comments_slider",
+                                             help="처음 동기화하는 영상은 최신 댓글부터 이만큼만 받습니다.")
+        else:
+            keyword = st.sidebar.text_input("검색 키워드", value="K-beauty", key="youtube_keyword_input")
+            # 🟢 [수정] 검색 결과 페이지를 이어 받아 50개 이상도 수집 (검색 1건당 최대 500개)
+            max_videos = st.sidebar.slider(
+                "영상 개수", 1, youtube_collector.MAX_SEARCH_RESULTS, 10, key="youtube_max_videos_slider",
+                help="50개를 넘으면 검색 결과 다음 페이지를 이어서 받습니다. (검색 페이지마다 API 할당량 100 사용)"
+            )
+            max_comments = st.sidebar.slider("영상당 댓글 수", 10, 200, 50, key="youtube_max_comments_slider")
+        # 🟢 [추가] 답글 수집 (parent_id로 원댓글과 연결해 저장)
+        include_replies = st.sidebar.checkbox(
+            "답글 포함 수집", value=False, key="youtube_include_replies_checkbox",
+            help=f"댓글마다 답글을 최대 {youtube_collector.DEFAULT_MAX_REPLIES}개까지 함께 수집합니다. "
+                 "답글이 응답에 모두 포함되지 않은 댓글은 추가 요청(요청당 할당량 1)으로 받습니다."
+        )
+        if not incremental:
+            order = st.sidebar.selectbox(
+                "정렬 방식",
+                ["relevance", "date", "viewCount"],
+                format_func=lambda x: {"relevance": "관련성순", "date": "최신순", "viewCount": "조회수순"}[x],
+                key="youtube_order_select"
+            )
         
-        if st.sidebar.button("🚀 데이터 수집 시작", key="youtube_start_collection_button"):
+        streaming = not incremental and st.sidebar.checkbox(
+            "스트리밍 수집 (도착하는 대로 표시)", value=False, key="youtube_streaming_checkbox",
+            help="수집이 끝나기를 기다리지 않고 영상별 댓글이 도착할 때마다 통계와 키워드를 갱신합니다."
+        )
+        
+        background = st.sidebar.checkbox(
+            "백그라운드 작업으로 실행", value=False, key="youtube_background_checkbox",
+            help="별도 워커 프로세스에서 수집합니다. 페이지를 새로고침하거나 닫아도 계속 진행되며, 완료 후 아래 작업 목록에서 불러옵니다."
+        )
+        
+        # 🟢 [추가] 남은 할당량 / 예상 사용량 표시
+        remaining_quota = render_quota_status(
+            max_videos, max_comments, youtube_quota.estimate_sync_cost(len(video_ids)) if incremental else None,
+            include_replies=include_replies
+        )
+        
+        start_clicked = st.sidebar.button("🚀 데이터 수집 시작", key="youtube_start_collection_button")
+        if start_clicked and incremental and not video_ids:
+            st.sidebar.warning("추적할 영상 ID 또는 URL을 입력하세요.")
+            start_clicked = False
+        elif start_clicked and incremental and not background:
+            sync_cost = youtube_quota.estimate_sync_cost(len(video_ids))["total"]
+            if sync_cost > remaining_quota:
+                st.error(f"남은 할당량({remaining_quota:,})이 추적 영상 {len(video_ids):,}개를 확인하기에 부족합니다. (최소 {sync_cost:,})")
+                start_clicked = False
+        elif start_clicked and not background:
+            # 남은 할당량에 맞게 답글 수집 → 영상당 댓글 수 → 영상 수 순서로 줄임 (백그라운드 작업은 실행 시점에 워커가 조정)
+            max_videos, max_comments, include_replies, quota_message = youtube_quota.plan_collection(
+                max_videos, max_comments, remaining_quota, include_replies
+            )
+            if max_videos == 0:
+                st.error(quota_message)
+                start_clicked = False
+            elif quota_message:
+                st.info(quota_message)
+        if start_clicked and background and incremental:
+            submit_collection_job("youtube", {
+                "video_ids": video_ids, "max_comments_per_video": max_comments, "include_replies": include_replies,
+            }, label=f"추적 영상 {len(video_ids)}개 증분 동기화{' (답글 포함)' if include_replies else ''}")
+            st.sidebar.success("✅ 동기화 작업을 등록했습니다. 진행 상황은 '백그라운드 수집 작업'에서 확인하세요.")
+        elif start_clicked and background:
+            submit_collection_job("youtube", {
+                "keyword": keyword, "max_videos": max_videos,
+                "max_comments_per_video": max_comments, "order": order, "include_replies": include_replies,
+            }, label=f"'{keyword}' (영상 {max_videos}개, 영상당 댓글 {max_comments}개, {order}"
+                     f"{', 답글 포함' if include_replies else ''})")
+            st.sidebar.success("✅ 수집 작업을 등록했습니다. 진행 상황은 '백그라운드 수집 작업'에서 확인하세요.")
+        elif start_clicked:
             
             try:
-                # 🔴 캐싱 함수 호출
-                videos_df_new, comments_df_new = get_and_cache_youtube_data(
-                    keyword, max_videos, max_comments, order
-                )
+                if incremental:
+                    videos_df_new, comments_df_new, collect_stats = sync_tracked_youtube_data(
+                        video_ids, max_comments, include_replies
+                    )
+                    collect_stats['new_comments'] = len(comments_df_new)
+                    videos_df_new = merge_new_rows(videos_df, videos_df_new, 'video_id')
+                    comments_df_new = merge_new_rows(comments_df, comments_df_new, 'comment_id')
+                elif streaming:
+                    # 같은 조건의 스트리밍 결과가 있으면 재사용, 없으면 수집 후 캐시
+                    stream_key = youtube_request_key(keyword, max_videos, max_comments, order, include_replies)
+                    cached = get_cached_result(stream_key)
+                    if cached is None:
+                        cached = stream_youtube_data(keyword, max_videos, max_comments, order, include_replies)
+                        if not cached[1].empty:
+                            set_cached_result(stream_key, cached)
+                    videos_df_new, comments_df_new, collect_stats = cached
+                else:
+                    # 🔴 캐싱 함수 호출
+                    videos_df_new, comments_df_new, collect_stats = get_and_cache_youtube_data(
+                        keyword, max_videos, max_comments, order, include_replies
+                    )
             except ConnectionError as e:
                 st.error(f"데이터 수집 실패: {e}")
                 return
@@ -643,14 +795,37 @@ def main():
 
             
             if videos_df_new is not None and comments_df_new is not None and not comments_df_new.empty:
-                st.success(f"✅ 영상 {len(videos_df_new)}개, 댓글 {len(comments_df_new)}개 수집/로드 완료! (파일 저장 완료)")
+                st.success(f"✅ 영상 {len(videos_df_new)}개, 댓글 {len(comments_df_new)}개 수집/로드 완료! (저장소 반영 완료)")
                 
                 # 세션 스테이트에 저장 (UI 업데이트를 위해 재할당)
                 st.session_state['videos_df'] = videos_df_new
                 st.session_state['comments_df'] = comments_df_new
+                st.session_state['youtube_collect_stats'] = collect_stats
                 st.rerun() # 데이터 수집 후 앱을 재실행하여 UI 업데이트
             elif comments_df_new is not None and comments_df_new.empty:
                 st.warning("수집된 댓글이 없습니다. 검색 조건이나 API 상태를 확인하세요.")
+
+    elif data_source == "저장소에서 불러오기":
+        st.sidebar.subheader("🗄️ 저장소 조회")
+        partitions = data_store.list_partitions("youtube", "comments")
+        if not partitions:
+            st.sidebar.warning("저장소에 수집된 YouTube 데이터가 없습니다. 먼저 API로 수집하세요.")
+        else:
+            dated = [d for d in partitions if d != "unknown"]
+            default_range = (datetime.strptime(dated[0], "%Y-%m-%d").date(), datetime.strptime(dated[-1], "%Y-%m-%d").date()) if dated else ()
+            date_range = st.sidebar.date_input("댓글 작성일 범위", value=default_range, key="youtube_store_date_range")
+            include_description = st.sidebar.checkbox("영상 설명 포함", value=False, key="youtube_store_description_checkbox")
+
+            if st.sidebar.button("📥 불러오기", key="youtube_store_load_button"):
+                start_date = date_range[0].isoformat() if len(date_range) > 0 else None
+                end_date = date_range[1].isoformat() if len(date_range) > 1 else None
+                videos_df_loaded, comments_df_loaded = load_youtube_from_store(start_date, end_date, include_description)
+                if comments_df_loaded.empty:
+                    st.sidebar.warning("조건에 맞는 댓글이 없습니다.")
+                else:
+                    st.session_state['videos_df'] = videos_df_loaded
+                    st.session_state['comments_df'] = comments_df_loaded
+                    st.rerun()
     
     else:  # CSV 파일 업로드
         st.sidebar.subheader("📤 파일 업로드")
@@ -670,6 +845,9 @@ def main():
         if comments_file or videos_file:
             st.rerun()
 
+    # 🟢 [추가] 백그라운드 수집 작업 목록 (새로고침해도 유지)
+    render_job_panel("youtube", ["videos", "comments"], load_youtube_job_result)
+
     # 데이터가 없으면 안내 메시지
     if comments_df is None or comments_df.empty:
         st.info("👆 왼쪽 사이드바에서 데이터를 수집하거나 업로드해주세요.")
@@ -693,6 +871,40 @@ def main():
     # 전처리된 DataFrame을 세션 상태에 다시 저장
     st.session_state['comments_df'] = comments_df
     # ==================================================================
+
+    # 🟢 [추가] 마지막 API 수집의 댓글 수집 처리량
+    collect_stats = st.session_state.get('youtube_collect_stats')
+    if collect_stats and 'comments_per_second' in collect_stats:
+        st.caption(
+            f"⏱️ 댓글 수집 {collect_stats['comment_seconds']}초 · 영상 {collect_stats['comment_videos']:,}개 "
+            f"({collect_stats['videos_per_second']}개/초) · 댓글 {collect_stats['comments']:,}개 "
+            f"({collect_stats['comments_per_second']}개/초) · 속도 제한 응답 {collect_stats['rate_limited']:,}회 "
+            f"· 서버 오류 재시도 {collect_stats.get('server_errors', 0):,}회 (백오프 {collect_stats['backoff_seconds']}초)"
+        )
+        if collect_stats.get('quota_exhausted'):
+            st.warning("YouTube API 일일 할당량이 소진되어 일부 영상의 댓글을 수집하지 못했습니다.")
+        if 'quota_used' in collect_stats:
+            st.caption(
+                f"🔁 증분 동기화: 새 댓글 {collect_stats.get('new_comments', collect_stats['comments']):,}개 · "
+                f"사용한 할당량 {collect_stats['quota_used']:,}"
+            )
+            if collect_stats.get('partial_videos') and not collect_stats.get('quota_exhausted'):
+                st.warning(
+                    f"영상 {len(collect_stats['partial_videos']):,}개는 새 댓글이 상한보다 많거나 수집 중 오류가 나서 "
+                    "이전 동기화 지점까지 받지 못했습니다. 이 영상들은 동기화 지점을 옮기지 않았으니 "
+                    "'영상당 새 댓글 상한'을 올려 다시 동기화하세요."
+                )
+
+    # 🟢 [추가] 답글이 함께 수집된 경우 분석에 포함할지 선택 (parent_id가 있으면 답글, 다시 수집할 필요 없음)
+    if 'parent_id' in comments_df.columns:
+        is_reply = comments_df['parent_id'].notna() & (comments_df['parent_id'].astype(str) != "")
+        if is_reply.any():
+            include_replies_in_analysis = st.checkbox(
+                f"답글 포함 분석 (댓글 {(~is_reply).sum():,}개 · 답글 {is_reply.sum():,}개)",
+                value=True, key="youtube_analysis_include_replies_checkbox"
+            )
+            if not include_replies_in_analysis:
+                comments_df = comments_df[~is_reply].reset_index(drop=True)
     
     # 기본 통계
     st.header("📈 기본 통계")
@@ -710,7 +922,7 @@ def main():
     
     st.markdown("---")
     
-    # 탭으로 분석 모드 구분 (총 9개 탭으로 재구성)
+    # 탭으로 분석 모드 구분 (총 10개 탭으로 재구성)
     tabs = st.tabs([
         "☁️ 워드클라우드",
         "📊 키워드 빈도",
@@ -718,6 +930,7 @@ def main():
         "📈 시간 트렌드",
         "🔗 동시출현",
         "🎬 토픽 비교",
+        "🚀 성장 추이",
         "📋 원본 데이터",
         "📄 일반 보고서", 
         "💼 임원진 보고서" 
@@ -764,10 +977,13 @@ def main():
     
     with tabs[2]:
         st.header("😊😢 감성 분석")
+        lexicon = sentiment_view.lexicon_controls(
+            "youtube", YouTubeCommentAnalyzer.POSITIVE_WORDS, YouTubeCommentAnalyzer.NEGATIVE_WORDS
+        )
         
         if st.button("🔍 감성 분석 실행", key="youtube_btn_sentiment"):
             with st.spinner("감성 분석 중..."):
-                fig, sentiment_counts, sentiment_df = analyzer.sentiment_keywords()
+                fig, sentiment_counts, sentiment_df = analyzer.sentiment_keywords(lexicon)
                 st.pyplot(fig)
                 st.session_state['sentiment_df'] = sentiment_df 
                 
@@ -827,11 +1043,22 @@ def main():
     
     with tabs[4]:
         st.header("🔗 키워드 동시출현 분석")
-        cooc_n = st.slider("분석할 키워드 개수", 5, 20, 15, key="youtube_cooc_n_slider")
+        cooc_n = st.slider("분석할 키워드 개수", 5, 300, 15, key="youtube_cooc_n_slider")
+        # 🟢 [추가] 동시출현 단위(댓글 전체 / 슬라이딩 창)와 지표(빈도 / Lift / PMI) 선택
+        cooc_col1, cooc_col2 = st.columns(2)
+        with cooc_col1:
+            cooc_unit = st.radio("동시출현 단위", ["댓글 전체", "단어 창"], horizontal=True, key="youtube_cooc_unit_radio")
+            cooc_window = None
+            if cooc_unit == "단어 창":
+                cooc_window = st.slider("창 크기 (연속 단어 수)", 2, 20, 5, key="youtube_cooc_window_slider")
+        with cooc_col2:
+            cooc_measure = st.radio("지표", list(YouTubeCommentAnalyzer.COOC_LABELS),
+                                    format_func=YouTubeCommentAnalyzer.COOC_LABELS.get, horizontal=True,
+                                    key="youtube_cooc_measure_radio")
         
         if st.button("🔍 동시출현 분석", key="youtube_btn_cooc"):
             with st.spinner("동시출현 분석 중..."):
-                fig, cooc_matrix = analyzer.cooccurrence(top_n=cooc_n)
+                fig, cooc_matrix = analyzer.cooccurrence(top_n=cooc_n, window=cooc_window, measure=cooc_measure)
                 st.pyplot(fig)
                 st.session_state['cooc_df'] = cooc_matrix 
                 
@@ -881,7 +1108,51 @@ def main():
             else:
                 st.info("👆 버튼을 클릭하여 토픽 비교를 분석하세요.")
 
+    # 🟢 [추가] 영상 통계 스냅샷(youtube_snapshots.py) 시계열로 조회수/좋아요/댓글 수 성장 곡선
     with tabs[6]:
+        st.header("🚀 영상 성장 추이")
+        video_ids = videos_df['video_id'].dropna().astype(str).tolist() if videos_df is not None and 'video_id' in videos_df.columns else []
+        tracked = youtube_snapshots.load_tracked()
+        st.caption(
+            f"추적 영상 {len(tracked):,}개 · `python youtube_snapshots.py`가 주기마다 통계를 기록합니다. "
+            f"(50개당 할당량 1)"
+        )
+        col_track, col_now = st.columns(2)
+        with col_track:
+            if st.button("➕ 현재 영상을 추적 목록에 추가", key="youtube_snapshot_track_button", disabled=not video_ids):
+                added = youtube_snapshots.add_tracked(video_ids)
+                st.success(f"{added:,}개 추가 (총 {len(tracked) + added:,}개)")
+        with col_now:
+            if st.button("📸 지금 스냅샷 기록", key="youtube_snapshot_now_button", disabled=not video_ids):
+                try:
+                    with st.spinner("영상 통계를 기록 중입니다..."):
+                        snapshot = youtube_snapshots.take_snapshot(load_youtube_api_key(), video_ids)
+                    load_video_snapshots.clear()
+                    st.success(f"영상 {len(snapshot):,}개 통계 기록 완료")
+                except Exception as e:
+                    st.error(f"스냅샷 기록 실패: {e}")
+
+        snapshots = load_video_snapshots(tuple(video_ids)) if video_ids else pd.DataFrame()
+        if snapshots.empty:
+            st.info("현재 영상의 스냅샷이 없습니다. 추적 목록에 추가하거나 지금 스냅샷을 기록하세요.")
+        else:
+            metric = st.radio("지표", ["view_count", "like_count", "comment_count"], horizontal=True,
+                              format_func=lambda x: {"view_count": "조회수", "like_count": "좋아요", "comment_count": "댓글 수"}[x],
+                              key="youtube_growth_metric_radio")
+            mode = st.radio("표시 방식", ["value", "since_first", "delta"], horizontal=True,
+                            format_func=lambda x: {"value": "누적 값", "since_first": "첫 기록 대비 증가", "delta": "구간 증가량"}[x],
+                            key="youtube_growth_mode_radio")
+            labels = {}
+            if videos_df is not None and 'title' in videos_df.columns:
+                for video_id, title in zip(videos_df['video_id'], videos_df['title'].astype(str)):
+                    labels[video_id] = f"{title[:30]} ({video_id})"
+            growth_df = youtube_snapshots.growth_frame(snapshots, metric, mode, labels)
+            st.line_chart(growth_df)
+            st.caption(f"스냅샷 {snapshots['ts'].nunique():,}회 · 영상 {snapshots['video_id'].nunique():,}개")
+            with st.expander("📋 스냅샷 데이터"):
+                st.dataframe(snapshots, use_container_width=True)
+
+    with tabs[7]:
         st.header("📋 원본 데이터")
         data_type = st.radio("데이터 유형 선택", ["댓글 데이터", "영상 데이터"], horizontal=True, key="youtube_raw_data_type_radio")
         
@@ -916,7 +1187,7 @@ def main():
             else:
                 st.warning("영상 데이터가 없습니다.")
 
-    with tabs[7]:
+    with tabs[8]:
         st.header("📄 Market Insight Report Generator (OpenAI API 기반)")
         st.write("분석 CSV 파일에 포함된 핵심 키워드와 통계를 기반으로 **사용자 지정 프롬프트**에 맞춘 요약 보고서를 자동 생성합니다.")
         # [수정] .env 경고를 secrets.toml 경고로 변경
@@ -1027,7 +1298,7 @@ def main():
                 else:
                     st.error("보고서 생성 실패. 파일 선택 및 구조를 확인하세요.")
 
-    with tabs[8]:
+    with tabs[9]:
         st.header("💼 임원진 보고서 (Executive Summary)")
         st.write("핵심 데이터를 기반으로 **국문 및 영문**으로 분리된, 임원진 제출용으로 적합한 요약 보고서를 생성합니다.")
         st.warning("⚠️ 이 보고서 생성을 위해서는 **OpenAI API Key**가 필수이며, 분석 탭에서 CSV 파일을 **`analysis_results`** 폴더에 저장해야 합니다.")
@@ -0,0 +1,45 @@
+import ctypes
+import os
+
+# ========================================
+# 프로세스 생존 확인 (작업 큐 워커, 저장소 잠금 보유자 확인용)
+# - Windows: os.kill(pid, 0)은 검사가 아니라 CTRL_C_EVENT 전송이므로 사용하면 안 됨
+#   → OpenProcess + GetExitCodeProcess로 확인
+# - 그 외: 신호 0 전송 (프로세스에 영향 없음)
+# ========================================
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+ERROR_ACCESS_DENIED = 5
+
+
+def _pid_alive_windows(pid):
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # 권한이 없어 열 수 없는 프로세스는 살아 있는 것으로 봄
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = ctypes.c_ulong()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return False
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def pid_alive(pid):
+    """pid 프로세스가 살아 있는지 (pid가 없으면 False)"""
+    if not pid:
+        return False
+    if os.name == "nt":
+        return _pid_alive_windows(int(pid))
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,631 @@
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import praw
+from prawcore import Requestor
+from prawcore.exceptions import RequestException, ResponseException
+
+from columnar import ColumnBatch, concat_frames, empty_frame, join_parent
+from crawl_state import is_known, make_state_key
+
+# ========================================
+# Reddit 병렬 수집 모듈
+# - 여러 서브레딧을 동시에 수집하되, 하나의 요청 예산(rate limit)을 공유
+# - 페이지(2_Globlal_Trend(reddit).py)와 배치 스크립트에서 공통으로 사용
+# ========================================
+
+DEFAULT_USER_AGENT = "RedditAnalyzer_Streamlit_v1.0 (by Python)"
+
+# Reddit OAuth 클라이언트당 허용량(분당 100회). 실제 속도는 응답 헤더(x-ratelimit-*)를 보고 조절하며,
+# 이 값은 헤더를 받기 전의 시작 속도이자 상한으로 쓰임
+DEFAULT_REQUESTS_PER_MINUTE = 100
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_COMMENT_WORKERS = 8
+
+# 429(요청 과다)/5xx 응답이나 연결 오류 시 재시도 횟수와 지수 백오프 기본 대기(초)
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# PRAW가 리스팅을 요청하는 단위 (리스팅 1페이지의 최대 게시물 수)
+LISTING_PAGE_SIZE = 100
+
+
+class RateLimitBudget:
+    """여러 스레드가 공유하는 요청 스케줄러 (토큰 버킷 + 응답 헤더 기반 속도 조절)
+
+    같은 OAuth 앱의 모든 클라이언트는 Reddit 쪽 한도를 함께 쓰므로, 어느 스레드든
+    응답 헤더(남은 요청 수, 초기화까지 남은 시간)를 받으면 공유 속도를 다시 계산한다.
+    남은 요청이 없거나 429를 받으면 초기화 시점까지 모든 스레드를 멈춘다.
+    """
+
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=None):
+        self.max_rate = requests_per_minute / 60.0
+        self.rate = self.max_rate
+        self.capacity = burst or max(1, requests_per_minute // 6)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.remaining = None
+        self.request_count = 0
+        self.wait_seconds = 0.0
+        self.retries = 0
+        self.retry_wait_seconds = 0.0
+        self.throttled_responses = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 확보할 때까지 대기 (대기 시간은 통계로 누적)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    sleep_for = self.blocked_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        self.request_count += 1
+                        return
+                    sleep_for = (1 - self.tokens) / self.rate
+                self.wait_seconds += sleep_for
+            time.sleep(sleep_for)
+
+    def observe(self, headers):
+        """응답의 x-ratelimit-* 헤더로 공유 속도 갱신
+
+        남은 요청 수를 초기화까지 남은 시간에 고르게 나눈 속도(상한: requests_per_minute)로 맞춘다.
+        """
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = float(remaining), max(1.0, float(reset))
+        except ValueError:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self.remaining = remaining
+            if remaining < 1:
+                self.blocked_until = max(self.blocked_until, now + reset)
+                self.tokens = 0.0
+            else:
+                self.rate = max(0.01, min(self.max_rate, remaining / reset))
+                # 남은 요청보다 많이 몰아서 보내지 않도록 버킷도 함께 줄임
+                self.tokens = min(self.tokens, remaining)
+
+    def pause(self, seconds):
+        """429 등으로 한도 초과가 확인되면 모든 스레드의 요청을 잠시 중단"""
+        with self._lock:
+            self.throttled_responses += 1
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+    def record_retry(self, wait_seconds):
+        with self._lock:
+            self.retries += 1
+            self.retry_wait_seconds += wait_seconds
+
+
+def budget_stats(budget):
+    """요청 예산의 누적 통계 (요청 수, 속도 조절 대기, 재시도)"""
+    return {
+        'request_count': budget.request_count,
+        'rate_wait_seconds': round(budget.wait_seconds, 2),
+        'retries': budget.retries,
+        'retry_wait_seconds': round(budget.retry_wait_seconds, 2),
+        'throttled_responses': budget.throttled_responses,
+    }
+
+
+def retry_delay(response, attempt):
+    """재시도 전 대기 시간: Retry-After / x-ratelimit-reset 헤더 우선, 없으면 지수 백오프 + 지터"""
+    if response is not None:
+        for header in ("retry-after", "x-ratelimit-reset"):
+            value = response.headers.get(header)
+            if value:
+                try:
+                    return min(BACKOFF_MAX_SECONDS, max(1.0, float(value)))
+                except ValueError:
+                    pass
+    backoff = BACKOFF_BASE_SECONDS * (2 ** attempt)
+    return min(BACKOFF_MAX_SECONDS, backoff + random.uniform(0, backoff / 2))
+
+
+class BudgetedRequestor(Requestor):
+    """모든 HTTP 요청을 공유 스케줄러에 맞춰 보내고, 한도 초과/일시 오류는 백오프 후 재시도하는 PRAW Requestor"""
+
+    def __init__(self, *, budget=None, max_retries=DEFAULT_MAX_RETRIES, **kwargs):
+        super().__init__(**kwargs)
+        self.budget = budget
+        self.max_retries = max_retries
+
+    def request(self, *args, **kwargs):
+        attempt = 0
+        while True:
+            if self.budget is not None:
+                self.budget.acquire()
+            try:
+                response = super().request(*args, **kwargs)
+            except RequestException:
+                # 연결 끊김/타임아웃
+                if attempt >= self.max_retries:
+                    raise
+                response = None
+            else:
+                if self.budget is not None:
+                    self.budget.observe(response.headers)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+
+            wait = retry_delay(response, attempt)
+            if self.budget is not None:
+                self.budget.record_retry(wait)
+                if response is not None and response.status_code == 429:
+                    # 한도 초과는 모든 스레드에 해당하므로 공유 스케줄러를 멈춤
+                    self.budget.pause(wait)
+                    attempt += 1
+                    continue
+            time.sleep(wait)
+            attempt += 1
+
+
+def create_reddit_client(credentials, budget=None, requestor_class=None, requestor_kwargs=None):
+    """자격증명 dict(secrets.toml의 [reddit] 섹션)로 PRAW 객체 생성
+
+    credentials에 base_url이 있으면 실제 Reddit 대신 해당 주소(예: fake_reddit.py 서버)로 요청한다.
+    requestor_class/requestor_kwargs: BudgetedRequestor 하위 클래스로 요청을 가로챌 때 사용 (녹화 등)
+    """
+    kwargs = {
+        "client_id": credentials.get("client_id"),
+        "client_secret": credentials.get("client_secret"),
+        "user_agent": credentials.get("user_agent", DEFAULT_USER_AGENT),
+        "requestor_class": requestor_class or BudgetedRequestor,
+        "requestor_kwargs": {"budget": budget, **(requestor_kwargs or {})},
+    }
+    if credentials.get("base_url"):
+        base_url = credentials.get("base_url").rstrip("/")
+        kwargs.update(oauth_url=base_url, reddit_url=base_url, short_url=base_url)
+    if credentials.get("username") and credentials.get("password"):
+        kwargs["username"] = credentials.get("username")
+        kwargs["password"] = credentials.get("password")
+    return praw.Reddit(**kwargs)
+
+
+def make_client_factory(credentials, budget, requestor_class=None, requestor_kwargs=None):
+    """스레드마다 PRAW 객체를 하나씩 만들어 돌려주는 함수 반환 (PRAW 객체는 스레드 간 공유가 안전하지 않음)"""
+    local = threading.local()
+
+    def client_factory():
+        if not hasattr(local, 'reddit'):
+            local.reddit = create_reddit_client(credentials, budget, requestor_class, requestor_kwargs)
+        return local.reddit
+    return client_factory
+
+
+def options_from_secrets(credentials, comment_options=None):
+    """secrets.toml의 [reddit] 설정과 댓글 고급 설정을 수집기 키워드 인자로 변환
+
+    comment_options: 댓글 단계 설정 (replace_more_limit, max_comment_depth, max_comment_requests)
+    """
+    comment_options = comment_options or {}
+    return dict(
+        replace_more_limit=comment_options.get("replace_more_limit", 0),
+        max_comment_depth=comment_options.get("max_comment_depth"),
+        max_comment_requests=comment_options.get("max_comment_requests"),
+        comment_workers=int(credentials.get("comment_workers", DEFAULT_COMMENT_WORKERS)),
+        max_workers=int(credentials.get("max_workers", DEFAULT_MAX_WORKERS)),
+        requests_per_minute=int(credentials.get("requests_per_minute", DEFAULT_REQUESTS_PER_MINUTE)),
+    )
+
+
+def parse_subreddit_list(subreddit_names):
+    """쉼표로 구분된 서브레딧 문자열을 리스트로 변환"""
+    return [s.strip() for s in subreddit_names.split(',') if s.strip()]
+
+
+def get_listing(subreddit, search_query, post_limit, sort_by, time_filter, after=None):
+    """검색어/정렬 방식에 맞는 게시물 리스팅 반환 (after: 이 게시물(fullname) 다음부터 이어서)"""
+    # search()는 params=None을 넘기면 오류가 나므로 이어서 수집할 때만 params 전달
+    extra = {"params": {"after": after}} if after else {}
+    if search_query:
+        return subreddit.search(search_query, sort=sort_by, time_filter=time_filter, limit=post_limit, **extra)
+    if sort_by == 'new':
+        return subreddit.new(limit=post_limit, **extra)
+    if sort_by == 'top':
+        return subreddit.top(time_filter=time_filter, limit=post_limit, **extra)
+    return subreddit.hot(limit=post_limit, **extra)
+
+
+# 게시물/댓글 열 스키마 (None: 문자열 열 - pandas 기본 문자열 타입으로 추론)
+# 댓글의 서브레딧/게시물 제목은 수집이 끝난 뒤 attach_post_info로 한 번만 붙임
+POST_SCHEMA = {
+    'post_id': None,
+    'subreddit': None,
+    'title': None,
+    'selftext': None,
+    'author': None,
+    'score': "int64",
+    'upvote_ratio': "float64",
+    'num_comments': "int64",
+    'created_utc': "float64",
+    'url': None,
+    'permalink': None,
+}
+COMMENT_SCHEMA = {
+    'comment_id': None,
+    'post_id': None,
+    'author': None,
+    'body': None,
+    'score': "int64",
+    'created_utc': "float64",
+}
+POST_INFO_COLUMNS = {'subreddit': 'subreddit', 'title': 'post_title'}
+# 저장/화면에서 쓰는 댓글 열 순서
+COMMENT_COLUMNS = ['comment_id', 'post_id', 'subreddit', 'author', 'body', 'score', 'created_utc', 'post_title']
+
+
+def author_name(author):
+    return str(author) if author else '[deleted]'
+
+
+def post_columns(posts, subreddit_name):
+    """리스팅 페이지의 게시물 목록 → 게시물 열 dict (게시물마다 dict를 만들지 않음)"""
+    return {
+        'post_id': [post.id for post in posts],
+        'subreddit': [post.subreddit.display_name if hasattr(post.subreddit, 'display_name') else subreddit_name
+                      for post in posts],
+        'title': [post.title for post in posts],
+        'selftext': [post.selftext for post in posts],
+        'author': [author_name(post.author) for post in posts],
+        'score': [post.score for post in posts],
+        'upvote_ratio': [post.upvote_ratio for post in posts],
+        'num_comments': [post.num_comments for post in posts],
+        'created_utc': [post.created_utc for post in posts],
+        'url': [post.url for post in posts],
+        'permalink': [f"https://reddit.com{post.permalink}" for post in posts],
+    }
+
+
+def comment_columns(comments, post_id):
+    """댓글 트리에서 고른 댓글 목록 → 댓글 열 dict"""
+    return {
+        'comment_id': [comment.id for comment in comments],
+        'post_id': [post_id] * len(comments),
+        'author': [author_name(comment.author) for comment in comments],
+        'body': [comment.body for comment in comments],
+        'score': [comment.score for comment in comments],
+        'created_utc': [comment.created_utc for comment in comments],
+    }
+
+
+def concat_posts(frames):
+    """서브레딧별 게시물 DataFrame들을 하나로 (없으면 열만 있는 빈 DataFrame)"""
+    return concat_frames(frames, POST_SCHEMA)
+
+
+def concat_comments(frames):
+    """게시물별 댓글 DataFrame들을 하나로 (게시물 정보 없음, 없으면 열만 있는 빈 DataFrame)"""
+    return concat_frames(frames, COMMENT_SCHEMA)
+
+
+def attach_post_info(comments_df, posts_df):
+    """댓글에 게시물의 서브레딧/제목(subreddit, post_title)을 post_id로 한 번에 붙임"""
+    return join_parent(comments_df, posts_df, 'post_id', POST_INFO_COLUMNS).reindex(columns=COMMENT_COLUMNS)
+
+
+# 워터마크(가장 최신 게시물)를 쓸 수 있는 최신순 정렬
+# hot/top 등은 순서가 시각과 무관해 오래된 새 게시물도 나오므로 post_id 중복 제거(upsert/merge_new_rows)만 사용
+WATERMARK_SORTS = {'new'}
+
+
+def watermark_key(subreddit_name, sort_by, search_query):
+    """증분 수집 워터마크 키: (서브레딧, 정렬, 검색어)"""
+    return make_state_key("reddit", subreddit_name, sort_by, search_query)
+
+
+def fetch_subreddit(reddit, subreddit_name, search_query, post_limit, sort_by, time_filter, watermark=None,
+                    after=None):
+    """서브레딧 1개의 게시물 리스팅을 POST_SCHEMA DataFrame으로 수집해 (게시물 df, 소요 시간 dict, 끝까지 받았는지) 반환
+
+    리스팅 페이지(LISTING_PAGE_SIZE개)마다 열 단위로 모아 마지막에 한 번만 DataFrame으로 만든다.
+    after가 주어지면 해당 게시물(fullname, 예: 't3_abc') 다음부터 이어서 수집한다.
+
+    watermark는 최신순(WATERMARK_SORTS) 리스팅에서만 쓰며, 처음 만난 기존 게시물에서 페이지 넘김을 멈춘다.
+    끝까지 받았는지: 기존 게시물에 닿았거나 리스팅이 post_limit 전에 끝났으면 True
+    (post_limit에서 멈췄다면 워터마크와의 사이에 받지 못한 게시물이 남아 있을 수 있음)
+    """
+    started = time.perf_counter()
+    batch = ColumnBatch(POST_SCHEMA)
+    page = []
+    status = "성공"
+    skipped = 0
+    seen = 0
+    reached_known = False
+    if sort_by not in WATERMARK_SORTS:
+        watermark = None
+
+    try:
+        subreddit = reddit.subreddit(subreddit_name)
+        _ = subreddit.title
+
+        for post in get_listing(subreddit, search_query, post_limit, sort_by, time_filter, after):
+            seen += 1
+            if is_known(post.created_utc, post.id, watermark):
+                skipped, reached_known = skipped + 1, True
+                break
+            page.append(post)
+            if len(page) >= LISTING_PAGE_SIZE:
+                batch.add(post_columns(page, subreddit_name))
+                page = []
+
+    except ResponseException as e:
+        status = f"접근 불가 ({e})"
+    except Exception as e:
+        status = f"오류 ({e})"
+    batch.add(post_columns(page, subreddit_name))  # 오류로 멈춘 경우에도 그때까지 받은 게시물은 포함
+
+    timing = {
+        '서브레딧': subreddit_name,
+        '게시물_수': len(batch),
+        '기존_게시물_건너뜀': skipped,
+        '소요_시간(초)': round(time.perf_counter() - started, 2),
+        '상태': status,
+    }
+    complete = status == "성공" and (reached_known or post_limit is None or seen < post_limit)
+    return batch.to_frame(), timing, complete
+
+
+def fetch_post_comments(reddit, post_id, comment_limit, replace_more_limit=0, max_depth=None,
+                        request_allowance=None):
+    """게시물 1개의 댓글 트리를 불러와 COMMENT_SCHEMA DataFrame으로 평탄화 (게시물 정보는 붙이지 않음)
+
+    replace_more_limit: '더 보기(MoreComments)'를 펼칠 최대 횟수 (펼칠 때마다 요청 1회)
+    max_depth: 포함할 최대 댓글 깊이 (0 = 최상위 댓글만, None = 제한 없음)
+    request_allowance: 남은 전체 요청 수 - replace_more 횟수를 이 안으로 제한
+    반환값: (댓글 DataFrame, 잘림 여부)
+    """
+    submission = reddit.submission(id=post_id)
+    # 필요한 만큼만 받도록 API의 limit 파라미터 지정
+    submission.comment_limit = comment_limit
+
+    if request_allowance is not None:
+        # 트리 최초 로드에 1회를 쓰고 남은 만큼만 '더 보기'를 펼침
+        replace_more_limit = max(0, min(replace_more_limit, request_allowance - 1))
+    remaining_more = submission.comments.replace_more(limit=replace_more_limit)
+
+    comments = []
+    truncated = bool(remaining_more)
+    for comment in submission.comments.list():
+        if not hasattr(comment, 'body') or comment.body is None:
+            continue
+        if max_depth is not None and getattr(comment, 'depth', 0) > max_depth:
+            truncated = True
+            continue
+        if len(comments) >= comment_limit:
+            truncated = True
+            break
+        comments.append(comment)
+    batch = ColumnBatch(COMMENT_SCHEMA)
+    batch.add(comment_columns(comments, post_id))
+    return batch.to_frame(), truncated
+
+
+def iter_comments_parallel(client_factory, budget, posts, comment_limit, replace_more_limit=0, max_depth=None,
+                           max_requests=None, max_workers=DEFAULT_COMMENT_WORKERS):
+    """게시물 리스팅 수집 이후 댓글 트리를 제한된 워커 풀로 동시에 수집
+
+    posts: 게시물 DataFrame (post_id, num_comments 열 필요)
+    게시물별 (post_id, 댓글 DataFrame)을 끝나는 순서대로 yield하고, 마지막에 통계 dict를 반환한다.
+    댓글에는 게시물 정보가 없으므로 모두 모은 뒤 attach_post_info로 한 번에 붙인다.
+    max_requests: 댓글 단계에서 사용할 최대 요청 수. 예산이 바닥나면 남은 게시물은
+    건너뛰고 잘린 게시물로 집계한다.
+    """
+    started = time.perf_counter()
+    start_count = budget.request_count
+    targets = posts.loc[posts['num_comments'] > 0, 'post_id'].tolist() if not posts.empty else []
+
+    def used_requests():
+        return budget.request_count - start_count
+
+    def worker(post_id):
+        allowance = None
+        if max_requests is not None:
+            allowance = max_requests - used_requests()
+            if allowance <= 0:
+                return empty_frame(COMMENT_SCHEMA), True, "요청 한도 초과"
+        try:
+            comments, truncated = fetch_post_comments(client_factory(), post_id, comment_limit,
+                                                      replace_more_limit, max_depth, allowance)
+            return comments, truncated, None
+        except Exception as e:
+            return empty_frame(COMMENT_SCHEMA), True, str(e)  # 재시도 후에도 실패한 게시물만 건너뜀
+
+    truncated_posts = 0
+    skipped_posts = 0
+    failed_posts = 0
+    if targets:
+        workers = max(1, min(max_workers, len(targets)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reddit-comments") as executor:
+            futures = {executor.submit(worker, post_id): post_id for post_id in targets}
+            try:
+                for future in as_completed(futures):
+                    comments, truncated, error = future.result()
+                    truncated_posts += int(truncated)
+                    if error == "요청 한도 초과":
+                        skipped_posts += 1
+                    elif error:
+                        failed_posts += 1
+                    yield futures[future], comments
+            except (GeneratorExit, KeyboardInterrupt):
+                # 소비하는 쪽이 중단(작업 취소, Ctrl+C 등)하면 아직 시작하지 않은 게시물은 취소
+                for future in futures:
+                    future.cancel()
+                raise
+
+    return {
+        'comment_posts': len(targets),
+        'truncated_posts': truncated_posts,
+        'budget_skipped_posts': skipped_posts,
+        'failed_posts': failed_posts,
+        'comment_requests': used_requests(),
+        'comment_seconds': round(time.perf_counter() - started, 2),
+    }
+
+
+def fetch_comments_parallel(client_factory, budget, posts, comment_limit, replace_more_limit=0, max_depth=None,
+                            max_requests=None, max_workers=DEFAULT_COMMENT_WORKERS):
+    """iter_comments_parallel 결과를 게시물 순서대로 모아 (게시물 정보를 붙인 댓글 DataFrame, 통계) 반환"""
+    by_post = {}
+    stream = iter_comments_parallel(client_factory, budget, posts, comment_limit, replace_more_limit, max_depth,
+                                    max_requests, max_workers)
+    while True:
+        try:
+            post_id, comments = next(stream)
+        except StopIteration as stop:
+            stats = stop.value
+            break
+        by_post[post_id] = comments
+
+    comments = concat_comments([by_post[post_id] for post_id in posts['post_id'] if post_id in by_post])
+    return attach_post_info(comments, posts), stats
+
+
+def iter_collect_subreddits(credentials, subreddit_list, search_query, post_limit, sort_by, time_filter,
+                            collect_comments, comment_limit, max_workers=DEFAULT_MAX_WORKERS,
+                            requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, watermarks=None,
+                            replace_more_limit=0, max_comment_depth=None, max_comment_requests=None,
+                            comment_workers=DEFAULT_COMMENT_WORKERS, requestor_class=None,
+                            requestor_kwargs=None, budget=None, post_limits=None, resume_after=None):
+    """여러 서브레딧을 제한된 스레드 풀로 동시에 수집하며 도착하는 대로 배치를 yield
+
+    1단계에서 서브레딧 리스팅을 병렬로 수집하고, 2단계에서 모인 게시물의 댓글 트리를
+    별도 워커 풀로 병렬 수집한다.
+    PRAW 객체는 스레드 간 공유가 안전하지 않으므로 스레드마다 하나씩 만들고,
+    요청 예산(RateLimitBudget)만 모든 스레드가 공유한다.
+    watermarks(WatermarkStore)를 넘기면 증분 모드로 동작한다. 워터마크는 최신순(WATERMARK_SORTS)일 때만 쓰며
+    (그 외 정렬은 post_id 중복 제거만), 여기서 갱신하지 않고 기존 게시물까지(또는 리스팅 끝까지) 받은
+    서브레딧의 가장 최신 게시물을 통계의 watermark_updates로 돌려준다.
+    호출하는 쪽이 결과를 저장소에 반영한 뒤 watermarks.commit(watermark_updates)로 확정한다.
+    (저장 전에 워터마크를 먼저 기록하면, 저장이 실패했을 때 그 게시물들을 다시 받지 못함)
+    budget: 다른 수집 단계와 요청 예산을 공유할 때 넘김 (없으면 새로 만듦)
+    post_limits / resume_after: 서브레딧별 게시물 수 / 이어서 수집할 시작 지점(fullname) (캐시의 부족분 수집용)
+
+    yield 형식 (끝나는 순서대로):
+        ("posts", 서브레딧 이름, 게시물 DataFrame, 소요 시간 dict)
+        ("comments", post_id, 댓글 DataFrame)  - 게시물 정보 없음 (attach_post_info로 한 번에 붙임)
+        ("done", 통계 dict)  - 마지막 1회
+    """
+    budget = budget or RateLimitBudget(requests_per_minute)
+    client_factory = make_client_factory(credentials, budget, requestor_class, requestor_kwargs)
+    post_limits = post_limits or {}
+    resume_after = resume_after or {}
+
+    track_watermarks = watermarks is not None and sort_by in WATERMARK_SORTS
+
+    def worker(subreddit_name):
+        watermark = None
+        if track_watermarks:
+            watermark = watermarks.get(watermark_key(subreddit_name, sort_by, search_query))
+        return fetch_subreddit(client_factory(), subreddit_name, search_query,
+                               post_limits.get(subreddit_name, post_limit), sort_by, time_filter, watermark,
+                               resume_after.get(subreddit_name))
+
+    started = time.perf_counter()
+    post_frames, timings = [], {}
+    post_source = {}
+    watermark_updates = {}
+    workers = max(1, min(max_workers, len(subreddit_list)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reddit") as executor:
+        futures = {executor.submit(worker, name): name for name in subreddit_list}
+        try:
+            for future in as_completed(futures):
+                subreddit_name = futures[future]
+                posts, timing, complete = future.result()
+                post_frames.append(posts)
+                timings[subreddit_name] = timing
+                post_source.update(dict.fromkeys(posts['post_id'], subreddit_name))
+                # post_limit에서 멈춰 기존 게시물까지 닿지 못했으면 워터마크를 옮기지 않음 (사이 구간이 빠지지 않도록)
+                if track_watermarks and complete and not posts.empty:
+                    newest = posts.loc[posts['created_utc'].idxmax()]
+                    watermark_updates[watermark_key(subreddit_name, sort_by, search_query)] = {
+                        "created": float(newest['created_utc']), "id": str(newest['post_id'])}
+                yield "posts", subreddit_name, posts, timing
+        except (GeneratorExit, KeyboardInterrupt):
+            for future in futures:
+                future.cancel()
+            raise
+
+    stats = {'listing_seconds': round(time.perf_counter() - started, 2), 'watermark_updates': watermark_updates}
+
+    comment_counts = Counter()
+    if collect_comments and comment_limit > 0:
+        stream = iter_comments_parallel(
+            client_factory, budget, concat_posts(post_frames), comment_limit, replace_more_limit, max_comment_depth,
+            max_comment_requests, comment_workers
+        )
+        while True:
+            try:
+                post_id, comments = next(stream)
+            except StopIteration as stop:
+                stats.update(stop.value)
+                break
+            comment_counts[post_source[post_id]] += len(comments)
+            yield "comments", post_id, comments
+
+    # 서브레딧별 댓글 수를 소요 시간 표에 합침 (입력한 서브레딧 순서)
+    timing_df = pd.DataFrame([timings[name] for name in subreddit_list if name in timings])
+    if not timing_df.empty:
+        timing_df.insert(2, '댓글_수', timing_df['서브레딧'].map(comment_counts).fillna(0).astype(int))
+
+    stats.update(budget_stats(budget))
+    stats.update({
+        'timing': timing_df,
+        'total_seconds': round(time.perf_counter() - started, 2),
+        # 재시도 후에도 실패해 결과에서 빠진 항목 (댓글은 failed_posts)
+        'dropped_subreddits': sum(t['상태'] != "성공" for t in timings.values()),
+    })
+    yield "done", stats
+
+
+def merge_collected(subreddit_list, posts_by_subreddit, comments_by_post):
+    """서브레딧별 게시물 / 게시물별 댓글 배치 → (게시물 df, 게시물 정보를 붙인 댓글 df 또는 None)
+
+    입력한 서브레딧 순서, 게시물 순서대로 병합한다.
+    """
+    posts_df = concat_posts([posts_by_subreddit[name] for name in subreddit_list if name in posts_by_subreddit])
+    comments_df = concat_comments([comments_by_post[post_id] for post_id in posts_df['post_id']
+                                   if post_id in comments_by_post])
+    if comments_df.empty:
+        return posts_df, None
+    return posts_df, attach_post_info(comments_df, posts_df)
+
+
+def collect_subreddits_parallel(credentials, subreddit_list, search_query, post_limit, sort_by, time_filter,
+                                collect_comments, comment_limit, **options):
+    """iter_collect_subreddits의 배치를 모두 모아 (게시물 df, 댓글 df 또는 None, 통계) 반환
+
+    결과는 입력한 서브레딧 순서, 게시물 순서대로 병합된다.
+    options: iter_collect_subreddits의 키워드 인자 (max_workers, requests_per_minute, watermarks 등)
+    watermarks를 넘겼으면 결과를 저장한 뒤 watermarks.commit(통계['watermark_updates'])를 호출해야 한다.
+    """
+    posts_by_subreddit, comments_by_post = {}, {}
+    stats = {}
+    for event in iter_collect_subreddits(credentials, subreddit_list, search_query, post_limit, sort_by,
+                                         time_filter, collect_comments, comment_limit, **options):
+        if event[0] == "posts":
+            posts_by_subreddit[event[1]] = event[2]
+        elif event[0] == "comments":
+            comments_by_post[event[1]] = event[2]
+        else:
+            stats = event[1]
+    posts_df, comments_df = merge_collected(subreddit_list, posts_by_subreddit, comments_by_post)
+    return posts_df, comments_df, stats
+
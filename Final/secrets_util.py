@@ -0,0 +1,31 @@
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 이하 - Streamlit 설치 시 함께 설치되는 toml 사용
+    import toml as tomllib
+
+# ========================================
+# secrets.toml / 설정 파일 로드 (Streamlit 밖에서 실행되는 워커/배치 스크립트용)
+# - 수집 모듈(googleapiclient, praw 등)을 불러오지 않으므로 어느 스크립트에서든 가볍게 import 가능
+# ========================================
+
+
+def load_toml(path):
+    """TOML 파일 → dict (tomllib이 없으면 toml 패키지 사용)"""
+    if tomllib.__name__ == "toml":
+        return tomllib.load(path)
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_secrets(path=None):
+    """secrets.toml 로드 (Streamlit과 같은 순서: 실행 폴더 → 홈 폴더)"""
+    candidates = [path] if path else [
+        os.path.join(".streamlit", "secrets.toml"),
+        os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),
+    ]
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return load_toml(candidate)
+    raise FileNotFoundError("secrets.toml을 찾을 수 없습니다. (.streamlit/secrets.toml)")
@@ -0,0 +1,41 @@
+import io
+
+import streamlit as st
+
+import text_analysis
+
+# ========================================
+# 감성 분석 설정 화면 모듈 (Reddit/YouTube 감성 분석 탭이 함께 사용)
+# - 사전 파일(.txt, 한 줄에 단어 하나)을 올리면 해당 페이지의 기본 긍정/부정 사전 대신 사용
+# - 부정어 처리("not good" → 부정)는 기본 꺼짐, 켜면 앞쪽 몇 단어까지 볼지 선택
+# ========================================
+
+
+def read_uploaded_lexicon(uploaded):
+    """업로드한 사전 파일 → 단어 집합"""
+    return text_analysis.read_lexicon(io.TextIOWrapper(io.BytesIO(uploaded.getvalue()), encoding='utf-8-sig'))
+
+
+def lexicon_controls(key_prefix, positive_words, negative_words):
+    """감성 사전/부정어 설정 위젯을 그리고 SentimentLexicon 반환"""
+    with st.expander("⚙️ 감성 사전 / 부정어 설정"):
+        col1, col2 = st.columns(2)
+        with col1:
+            positive_file = st.file_uploader("긍정 사전 (.txt)", type=["txt"], key=f"{key_prefix}_positive_lexicon")
+        with col2:
+            negative_file = st.file_uploader("부정 사전 (.txt)", type=["txt"], key=f"{key_prefix}_negative_lexicon")
+        use_negation = st.checkbox("부정어 처리 (예: not good → 부정, 안 좋아요 → 부정)", value=False,
+                                   key=f"{key_prefix}_negation_checkbox")
+        negation_window = 0
+        if use_negation:
+            negation_window = st.slider("부정어를 찾을 앞 단어 수", 1, 5, text_analysis.DEFAULT_NEGATION_WINDOW,
+                                        key=f"{key_prefix}_negation_window_slider")
+        st.caption(f"긍정 {'업로드 사전' if positive_file else '기본 사전'} / "
+                   f"부정 {'업로드 사전' if negative_file else '기본 사전'} | "
+                   f"부정어: {', '.join(sorted(text_analysis.DEFAULT_NEGATORS))}")
+
+    return text_analysis.SentimentLexicon(
+        read_uploaded_lexicon(positive_file) if positive_file else positive_words,
+        read_uploaded_lexicon(negative_file) if negative_file else negative_words,
+        negation_window=negation_window,
+    )
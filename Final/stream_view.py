@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import Counter
+
+import pandas as pd
+import streamlit as st
+
+# ========================================
+# 스트리밍 수집 화면 모듈
+# - 수집 배치가 도착할 때마다 기본 통계 / 키워드 빈도 / 원본 데이터를 자리표시자에 다시 그림
+# - 수집이 끝난 결과는 프로세스 전역 캐시에 보관해 같은 조건으로 다시 수집하면 재사용
+# ========================================
+
+# 다시 그리는 최소 간격(초) - 배치가 몰려도 화면 갱신 비용이 수집을 늦추지 않도록
+RENDER_INTERVAL = 0.5
+RAW_PREVIEW_ROWS = 200
+TOP_KEYWORDS = 20
+
+
+@st.cache_resource
+def streaming_result_cache():
+    """스트리밍 수집 결과 캐시 {수집 인자 튜플: 결과} (모든 세션 공유)"""
+    return {"lock": threading.Lock(), "results": {}}
+
+
+def get_cached_result(key):
+    cache = streaming_result_cache()
+    with cache["lock"]:
+        return cache["results"].get(key)
+
+
+def set_cached_result(key, result):
+    cache = streaming_result_cache()
+    with cache["lock"]:
+        cache["results"][key] = result
+
+
+class StreamingPanel:
+    """수집 중간 결과를 보여 주는 자리표시자 묶음"""
+
+    def __init__(self, title):
+        st.subheader(title)
+        self.status = st.empty()
+        stats_tab, keyword_tab, raw_tab = st.tabs(["📈 기본 통계", "📊 키워드 빈도", "📋 원본 데이터"])
+        with stats_tab:
+            self.metrics = st.empty()
+        with keyword_tab:
+            self.keywords = st.empty()
+        with raw_tab:
+            self.raw = st.empty()
+        self.keyword_counts = Counter()
+        self.started = time.perf_counter()
+        self._last_render = 0.0
+
+    def add_keywords(self, keyword_pairs):
+        """extract_keywords 결과 [(단어, 빈도), ...]를 누적"""
+        self.keyword_counts.update(dict(keyword_pairs))
+
+    def render(self, metrics, raw_df, message=None, force=False):
+        """metrics: {라벨: 값} / raw_df: 지금까지 수집된 원본 (마지막 RAW_PREVIEW_ROWS행만 표시)"""
+        now = time.perf_counter()
+        if not force and now - self._last_render < RENDER_INTERVAL:
+            return
+        self._last_render = now
+
+        elapsed = now - self.started
+        self.status.caption(f"⏳ {elapsed:.1f}초 경과" + (f" · {message}" if message else ""))
+        with self.metrics.container():
+            cols = st.columns(len(metrics))
+            for col, (label, value) in zip(cols, metrics.items()):
+                col.metric(label, value)
+        if self.keyword_counts:
+            self.keywords.dataframe(
+                pd.DataFrame(self.keyword_counts.most_common(TOP_KEYWORDS), columns=['키워드', '빈도']),
+                use_container_width=True
+            )
+        if raw_df is not None and not raw_df.empty:
+            self.raw.dataframe(raw_df.tail(RAW_PREVIEW_ROWS), use_container_width=True)
@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Final/ 모듈(data_store)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_store  # noqa: E402
+
+
+def dead_pid():
+    """방금 종료된 프로세스의 pid"""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def write_lock(table_dir, pid):
+    with open(os.path.join(table_dir, ".lock"), "w", encoding="utf-8") as f:
+        f.write(str(pid))
+
+
+def test_lock_records_holder_pid(tmp_path):
+    with data_store.StoreLock(str(tmp_path)) as lock:
+        assert lock._holder() == os.getpid()
+    assert not os.path.exists(lock.path)
+
+
+def test_lock_of_dead_holder_is_broken(tmp_path):
+    write_lock(str(tmp_path), dead_pid())
+    with data_store.StoreLock(str(tmp_path)) as lock:
+        assert lock._holder() == os.getpid()
+
+
+def test_lock_of_live_holder_is_kept(tmp_path, monkeypatch):
+    # 오래된 잠금이라도 보유 프로세스가 살아 있으면 끊지 않고 기다림
+    monkeypatch.setattr(data_store, "LOCK_TIMEOUT", 0.2)
+    write_lock(str(tmp_path), os.getpid())
+    lock_path = os.path.join(str(tmp_path), ".lock")
+    os.utime(lock_path, (0, 0))
+    with pytest.raises(TimeoutError):
+        with data_store.StoreLock(str(tmp_path)):
+            pass
+    assert os.path.exists(lock_path)
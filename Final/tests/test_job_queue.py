@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+# Final/ 모듈(job_queue, process_util)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_queue  # noqa: E402
+from process_util import pid_alive  # noqa: E402
+
+
+def dead_pid():
+    """방금 종료된 프로세스의 pid"""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_pid_alive():
+    assert pid_alive(os.getpid())
+    assert not pid_alive(dead_pid())
+    assert not pid_alive(None)
+
+
+def test_stale_job_of_dead_worker_is_reclaimed(tmp_path):
+    jobs_dir = str(tmp_path)
+    job_id = job_queue.submit_job("reddit", {}, jobs_dir=jobs_dir)
+    job_queue.update_job(job_id, jobs_dir=jobs_dir, status="running", worker_pid=dead_pid())
+
+    job = job_queue.claim_next_job(jobs_dir)
+
+    assert job["id"] == job_id
+    assert job["status"] == "running"
+    assert job["worker_pid"] == os.getpid()
+    assert job["message"] == "다시 시작"
+
+
+def test_running_job_of_live_worker_is_not_reclaimed(tmp_path):
+    jobs_dir = str(tmp_path)
+    job_id = job_queue.submit_job("reddit", {}, jobs_dir=jobs_dir)
+    job_queue.update_job(job_id, jobs_dir=jobs_dir, status="running", worker_pid=os.getpid())
+
+    assert job_queue.claim_next_job(jobs_dir) is None
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+
+# Final/ 모듈(job_worker 등)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_store  # noqa: E402
+import fake_youtube  # noqa: E402
+import job_queue  # noqa: E402
+import youtube_quota  # noqa: E402
+from crawl_state import WatermarkStore  # noqa: E402
+from job_worker import JobProgress, run_youtube_job  # noqa: E402
+from youtube_collector import comments_watermark_key, set_api_root  # noqa: E402
+
+
+@pytest.fixture
+def youtube_server(tmp_path, monkeypatch):
+    """가짜 YouTube 서버 (상태 파일/저장소는 임시 폴더에 생성)"""
+    monkeypatch.chdir(tmp_path)
+    fixture = fake_youtube.generate_fixture(videos=3, comments_per_video=10, max_replies=0, disabled_ratio=0, seed=7)
+    with fake_youtube.FakeYouTubeServer(fixture) as server:
+        yield server, fixture
+    youtube_quota.get_ledger().flush()  # 임시 폴더를 벗어나기 전에 남은 사용량 기록
+    set_api_root(None)
+
+
+def run_tracked_sync(server, video_ids):
+    jobs_dir = "jobs"
+    job_id = job_queue.submit_job("youtube", {"video_ids": video_ids, "max_comments_per_video": 100},
+                                  jobs_dir=jobs_dir)
+    secrets = {"youtube": {"YOUTUBE_API_KEY": "test-key", "api_root": server.base_url}}
+    return run_youtube_job(job_queue.get_job(job_id, jobs_dir), secrets, JobProgress(job_id, jobs_dir))
+
+
+def test_youtube_watermarks_are_committed_after_store(youtube_server, monkeypatch):
+    server, fixture = youtube_server
+    video_ids = [video["id"] for video in fixture["videos"]]
+
+    def failing_upsert(*args, **kwargs):
+        raise OSError("disk full")
+
+    # 저장에 실패하면 워터마크는 그대로 (다음 동기화 때 같은 댓글을 다시 받음)
+    with monkeypatch.context() as patch:
+        patch.setattr(data_store, "upsert", failing_upsert)
+        with pytest.raises(OSError):
+            run_tracked_sync(server, video_ids)
+    assert WatermarkStore("youtube").keys() == []
+
+    run_tracked_sync(server, video_ids)
+    watermarks = WatermarkStore("youtube")
+    for video_id in video_ids:
+        newest = max(fixture["comments"][video_id], key=lambda comment: comment["published_at"])
+        assert watermarks.get(comments_watermark_key(video_id)) == {"created": newest["published_at"],
+                                                                    "id": newest["id"]}
@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+# Final/ 모듈(reddit_collector 등)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_reddit  # noqa: E402
+import reddit_collector as rc  # noqa: E402
+from crawl_state import WatermarkStore  # noqa: E402
+
+
+@pytest.fixture
+def reddit_api():
+    """(자격증명, 최신순 게시물 목록) - 가짜 서버의 서브레딧 1개, 게시물 150개"""
+    fixture = fake_reddit.generate_fixture(["kbeauty"], posts_per_subreddit=150, comments_per_post=0)
+    posts = sorted(fixture["subreddits"]["kbeauty"]["posts"], key=lambda post: post["created_utc"], reverse=True)
+    with fake_reddit.FakeRedditServer(fixture, rate_limit=10**7) as server:
+        yield {"client_id": "test", "client_secret": "test", "base_url": server.base_url}, posts
+
+
+def collect(credentials, post_limit, sort_by, watermarks):
+    posts_df, _, stats = rc.collect_subreddits_parallel(credentials, ["kbeauty"], "", post_limit, sort_by, "week",
+                                                        False, 0, watermarks=watermarks)
+    return posts_df, stats["watermark_updates"]
+
+
+def test_new_listing_advances_watermark_only_when_it_reaches_it(reddit_api, tmp_path):
+    credentials, posts = reddit_api
+    watermarks = WatermarkStore("reddit", str(tmp_path))
+    known = posts[120]
+    watermarks.update(rc.watermark_key("kbeauty", "new", ""), known["created_utc"], known["id"])
+
+    # post_limit에서 멈춰 기존 게시물까지 닿지 못함 → 사이 구간이 남으므로 워터마크를 옮기지 않음
+    posts_df, updates = collect(credentials, 50, "new", watermarks)
+    assert len(posts_df) == 50
+    assert updates == {}
+
+    posts_df, updates = collect(credentials, 200, "new", watermarks)
+    assert len(posts_df) == 120
+    assert updates == {rc.watermark_key("kbeauty", "new", ""): {"created": posts[0]["created_utc"],
+                                                                "id": posts[0]["id"]}}
+
+
+def test_hot_listing_ignores_time_watermark(reddit_api, tmp_path):
+    credentials, posts = reddit_api
+    watermarks = WatermarkStore("reddit", str(tmp_path))
+    newest = posts[0]
+    watermarks.update(rc.watermark_key("kbeauty", "hot", ""), newest["created_utc"], newest["id"])
+
+    # hot은 시각순이 아니므로 워터마크보다 오래된 게시물도 건너뛰지 않음 (post_id 중복 제거에 맡김)
+    posts_df, updates = collect(credentials, 30, "hot", watermarks)
+    assert len(posts_df) == 30
+    assert updates == {}
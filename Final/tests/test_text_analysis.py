@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pandas as pd
+
+# Final/ 모듈(text_analysis)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_analysis  # noqa: E402
+
+
+def test_uncached_corpus_leaves_shared_cache_alone():
+    cache = text_analysis.get_token_cache()
+    texts = pd.Series(["streaming batch serum", "one-off toner batch"])
+    misses = cache.misses
+
+    corpus = text_analysis.get_corpus(texts, use_cache=False)
+
+    assert text_analysis.top_keywords(corpus, top_n=1) == [("batch", 2)]
+    assert cache.misses == misses
+    assert text_analysis.get_corpus(texts) is not corpus  # 캐시에 넣지 않았으므로 새로 토큰화
+    assert cache.misses == misses + 1
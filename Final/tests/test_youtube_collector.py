@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+# Final/ 모듈(youtube_collector 등)을 불러오기 위해 상위 폴더를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_youtube  # noqa: E402
+import youtube_collector as yc  # noqa: E402
+from crawl_state import WatermarkStore  # noqa: E402
+from youtube_quota import QuotaLedger  # noqa: E402
+
+
+@pytest.fixture
+def youtube_api(tmp_path):
+    """(가짜 서버, 픽스처, 클라이언트 함수) - 영상 1개, 최상위 댓글 150~300개"""
+    fixture = fake_youtube.generate_fixture(videos=1, comments_per_video=300, max_replies=0, disabled_ratio=0, seed=3)
+    with fake_youtube.FakeYouTubeServer(fixture) as server:
+        ledger = QuotaLedger(str(tmp_path / "quota_state"))
+        yield server, fixture, yc.make_youtube_client_factory("test-key", ledger, cache=False,
+                                                              api_root=server.base_url)
+
+
+def http_error(status, reason):
+    content = json.dumps({"error": {"code": status, "errors": [{"reason": reason}]}}).encode("utf-8")
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+def thread_page(start, count, next_page_token=None):
+    items = [{"id": f"c{i}", "snippet": {"totalReplyCount": 0, "topLevelComment": {"id": f"c{i}", "snippet": {
+        "authorDisplayName": "@user", "textDisplay": "nice", "likeCount": 0, "publishedAt": "2026-01-01T00:00:00Z",
+    }}}} for i in range(start, start + count)]
+    return {"items": items, "nextPageToken": next_page_token} if next_page_token else {"items": items}
+
+
+class StubYouTube:
+    """commentThreads().list(...).execute()가 정해진 응답(또는 예외)을 차례로 돌려주는 클라이언트"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+
+    def commentThreads(self):
+        return self
+
+    def list(self, **params):
+        return self
+
+    def execute(self):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_server_error_is_retried(monkeypatch):
+    monkeypatch.setattr(yc, "BACKOFF_BASE_SECONDS", 0.01)
+    backoff = yc.RequestBackoff()
+    youtube = StubYouTube(http_error(503, "backendError"), thread_page(0, 20))
+
+    comments, complete = yc.fetch_video_comments(youtube, "video", 100, backoff)
+
+    assert complete and len(comments) == 20
+    assert backoff.server_errors == 1 and backoff.rate_limited == 0
+
+
+def test_comments_disabled_is_complete():
+    comments, complete = yc.fetch_video_comments(StubYouTube(http_error(403, "commentsDisabled")), "video", 100)
+    assert complete and comments.empty
+
+
+def test_unexpected_error_is_not_complete():
+    # 중간 페이지의 인증/네트워크 오류는 잘린 결과 (캐시/워터마크에 반영하지 않도록 완료되지 않은 것으로 반환)
+    for error in (http_error(401, "authError"), OSError("connection reset")):
+        youtube = StubYouTube(thread_page(0, 20, "page2"), error)
+        comments, complete = yc.fetch_video_comments(youtube, "video", 100)
+        assert not complete and len(comments) == 20
+
+
+def collect_tracked(client_factory, video_ids, max_comments, watermarks):
+    stream = yc.iter_video_comments_parallel(client_factory, video_ids, max_comments, watermarks=watermarks)
+    frames = {}
+    while True:
+        try:
+            video_id, comments = next(stream)
+        except StopIteration as stop:
+            return frames, stop.value
+        frames[video_id] = comments
+
+
+def test_unreached_watermark_is_not_advanced(youtube_api, tmp_path):
+    server, fixture, client_factory = youtube_api
+    video_id = fixture["videos"][0]["id"]
+    threads = sorted(fixture["comments"][video_id], key=lambda thread: thread["published_at"], reverse=True)
+    watermarks = WatermarkStore("youtube", str(tmp_path / "crawl_state"))
+    oldest = threads[-1]
+    watermarks.update(yc.comments_watermark_key(video_id), oldest["published_at"], oldest["id"])
+
+    # 새 댓글이 상한(100)보다 많으면 최신 100개만 받고, 사이 구간이 남으므로 워터마크를 옮기지 않음
+    frames, stats = collect_tracked(client_factory, [video_id], 100, watermarks)
+    assert len(frames[video_id]) == 100
+    assert stats["partial_videos"] == [video_id]
+    assert stats["watermark_updates"] == {}
+
+    # 상한 안에서 워터마크에 닿으면 완료 - 가장 최신 댓글로 갱신
+    frames, stats = collect_tracked(client_factory, [video_id], len(threads), watermarks)
+    assert len(frames[video_id]) == len(threads) - 1
+    assert stats["partial_videos"] == []
+    assert stats["watermark_updates"] == {
+        yc.comments_watermark_key(video_id): {"created": threads[0]["published_at"], "id": threads[0]["id"]}
+    }
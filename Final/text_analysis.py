@@ -0,0 +1,405 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from scipy import sparse
+
+# ========================================
+# 텍스트 분석 공통 모듈 (Reddit/YouTube 분석 클래스가 함께 사용)
+# - 전처리(소문자, URL 제거, 한글/영문/숫자만 남김) + 공백 토큰화를 데이터셋마다 한 번만 수행
+# - 결과(TokenizedCorpus)는 텍스트 내용 해시(행 해시 → blake2b)를 키로 프로세스 안에서 공유
+#   → 탭을 바꾸거나 페이지가 다시 실행돼도 같은 데이터면 정규식 파이프라인을 다시 돌리지 않음
+# - 키워드/감성/동시출현/영상별 키워드 계산은 캐시된 토큰만 읽음
+# ========================================
+
+MAX_CACHED_ROWS = 2_000_000   # 캐시에 보관할 전체 문서 수 상한 (넘으면 오래 안 쓴 데이터셋부터 제거)
+
+
+URL_PATTERN = re.compile(r'http\S+|www\S+')
+NON_WORD_PATTERN = re.compile(r'[^가-힣a-z0-9\s]')
+SPACE_PATTERN = re.compile(r'\s+')
+
+# 열 전체 전처리(pyarrow, RE2 정규식)용 패턴 - 결과가 preprocess_text와 글자 하나까지 같도록 맞춤
+# - RE2의 \s는 ASCII 공백만 포함 → Python re의 \s(str.isspace) 문자를 직접 나열
+# - 남길 문자(한글/영소문자/숫자)가 아닌 연속 구간 → 공백 1개 (공백 정리까지 한 번에)
+#   단어 사이 공백 1개는 건드리지 않도록 "기호가 섞인 구간 또는 2칸 이상 공백"만 매칭
+# - 소문자 변환은 'İ'(U+0130)만 Python('i̇')과 pyarrow('i') 결과가 달라 먼저 치환
+PY_SPACE_CLASS = ''.join(f'\\x{{{ord(c):x}}}' for c in map(chr, range(0x3001)) if c.isspace())
+ARROW_URL_PATTERN = f'http[^{PY_SPACE_CLASS}]+|www[^{PY_SPACE_CLASS}]+'
+ARROW_NON_WORD_PATTERN = '[^가-힣a-z0-9]*[^가-힣a-z0-9 ][^가-힣a-z0-9]*|  +'
+LOWER_EXCEPTIONS = {'\u0130': '\u0130'.lower()}
+
+
+def preprocess_text(text):
+    """텍스트 전처리 (분석 클래스의 preprocess_text와 같은 규칙)"""
+    if pd.isna(text):
+        return ""
+    text = str(text).lower()
+    text = URL_PATTERN.sub('', text)
+    text = NON_WORD_PATTERN.sub(' ', text)
+    text = SPACE_PATTERN.sub(' ', text).strip()
+    return text
+
+
+def preprocess_texts(texts):
+    """텍스트 열 전체 전처리 → 행마다 preprocess_text를 적용한 것과 같은 리스트"""
+    return preprocess_array(texts).to_pylist()
+
+
+def preprocess_array(texts):
+    """preprocess_texts와 같은 결과를 pyarrow 문자열 배열로
+
+    소문자화/URL 제거/문자 필터+공백 정리를 pyarrow compute로 열 전체에 한 번씩 실행
+    (짝 없는 서로게이트처럼 UTF-8로 바꿀 수 없는 값이 있으면 행 단위로 처리)
+    """
+    series = pd.Series(texts, dtype=object)
+    if series.empty:
+        return pa.array([], type=pa.string())
+    if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+        # 숫자/bytes 등은 preprocess_text처럼 str()로 (빈 값은 그대로)
+        series = pd.Series([str(text) if present else None for text, present in zip(series, series.notna())],
+                           dtype=object)
+    try:
+        values = pa.array(series, type=pa.string(), from_pandas=True)
+    except UnicodeError:
+        return pa.array([preprocess_text(text) for text in series], type=pa.string())
+    values = pc.fill_null(values, '')
+    for char, lowered in LOWER_EXCEPTIONS.items():
+        values = pc.replace_substring(values, char, lowered)
+    values = pc.utf8_lower(values)
+    values = pc.replace_substring_regex(values, ARROW_URL_PATTERN, '')
+    values = pc.replace_substring_regex(values, ARROW_NON_WORD_PATTERN, ' ')
+    return pc.utf8_trim(values, ' ')
+
+
+def content_hash(texts):
+    """텍스트 Series의 내용 해시 (순서 포함, 인덱스 제외)"""
+    row_hashes = pd.util.hash_pandas_object(pd.Series(texts, dtype=object), index=False).to_numpy()
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update(str(len(row_hashes)).encode())
+    return digest.hexdigest()
+
+
+class TokenizedCorpus:
+    """전처리/토큰화된 데이터셋
+
+    token_ids: 모든 문서의 토큰을 이어 붙인 정수 id 배열 (문서 순서 → 문서 안 순서, ' '.join 후 split과 같음)
+    doc_ids: 토큰마다 속한 문서 위치 (0부터, 원본 Series의 위치 순서)
+    vocabulary: id → 단어 (처음 나온 순서 - 데이터가 같으면 항상 같은 id), frequencies: id별 전체 빈도
+    dtm: 문서 × 단어 빈도 희소 행렬 (scipy CSR, 처음 쓸 때 한 번 만듦)
+    """
+
+    def __init__(self, texts):
+        self.clean_array = preprocess_array(texts)
+        # 공백 기준 토큰화 (빈 문서는 null → 토큰 0개), 사전 인코딩 순서 = 처음 나온 순서
+        documents = pc.if_else(pc.equal(self.clean_array, ''), pa.scalar(None, pa.string()), self.clean_array)
+        tokens = pc.split_pattern(documents, ' ')
+        lengths = pc.fill_null(pc.list_value_length(tokens), 0).to_numpy().astype(np.int64)
+        encoded = pc.dictionary_encode(pc.list_flatten(tokens))
+        self.doc_ids = np.repeat(np.arange(len(lengths)), lengths)
+        self.token_ids = encoded.indices.to_numpy().astype(np.int64)
+        self.vocabulary = encoded.dictionary.to_pylist()
+        self.vocabulary_index = {word: i for i, word in enumerate(self.vocabulary)}
+        self.frequencies = np.bincount(self.token_ids, minlength=len(self.vocabulary))
+        self._clean = None
+        self._text = None
+        self._dtm = None
+        self._first_seen = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.clean_array)
+
+    @property
+    def clean(self):
+        """문서별 전처리 텍스트 리스트"""
+        if self._clean is None:
+            self._clean = self.clean_array.to_pylist()
+        return self._clean
+
+    @property
+    def text(self):
+        """전체 전처리 텍스트 (워드클라우드용)"""
+        if self._text is None:
+            self._text = ' '.join(self.clean)
+        return self._text
+
+    @property
+    def dtm(self):
+        self._build_matrices()
+        return self._dtm
+
+    @property
+    def first_seen(self):
+        """dtm과 같은 모양, 값이 클수록 먼저 나온 (문서, 단어) - 부분 집합의 동점 순서를 Counter와 맞출 때 사용"""
+        self._build_matrices()
+        return self._first_seen
+
+    def _build_matrices(self):
+        with self._lock:
+            if self._dtm is not None:
+                return
+            shape = (len(self), len(self.vocabulary))
+            # (문서, 단어) 쌍 → 정렬된 고유 키 = CSR 순서 (행 → 열)
+            keys = self.doc_ids * max(shape[1], 1) + self.token_ids
+            keys, first, counts = np.unique(keys, return_index=True, return_counts=True)
+            rows, columns = np.divmod(keys, max(shape[1], 1))
+            indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=shape[0]))))
+            self._first_seen = sparse.csr_matrix((len(self.token_ids) - first, columns, indptr), shape=shape)
+            self._dtm = sparse.csr_matrix((counts, columns, indptr), shape=shape)
+
+    def ids_of(self, words):
+        """단어 목록 → 정수 id 배열 (코퍼스에 없는 단어는 제외)"""
+        return np.array([self.vocabulary_index[w] for w in words if w in self.vocabulary_index], dtype=np.int64)
+
+    def term_mask(self, min_length=1, stopwords=frozenset()):
+        """단어별 사용 여부 (길이 min_length 이상, 불용어 제외)"""
+        return np.fromiter((len(w) >= min_length and w not in stopwords for w in self.vocabulary),
+                           dtype=bool, count=len(self.vocabulary))
+
+
+class TokenCache:
+    """내용 해시 → TokenizedCorpus (문서 수 기준 LRU)"""
+
+    def __init__(self, max_rows=MAX_CACHED_ROWS):
+        self.max_rows = max_rows
+        self._corpora = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, texts):
+        key = content_hash(texts)
+        with self._lock:
+            corpus = self._corpora.get(key)
+            if corpus is not None:
+                self._corpora.move_to_end(key)
+                self.hits += 1
+                return corpus
+            self.misses += 1
+        corpus = TokenizedCorpus(texts)  # 잠금 밖에서 토큰화 (다른 데이터셋 조회를 막지 않음)
+        with self._lock:
+            self._corpora[key] = corpus
+            self._corpora.move_to_end(key)
+            total = sum(len(c) for c in self._corpora.values())
+            while total > self.max_rows and len(self._corpora) > 1:
+                _, evicted = self._corpora.popitem(last=False)
+                total -= len(evicted)
+        return corpus
+
+    def clear(self):
+        with self._lock:
+            self._corpora.clear()
+
+
+_token_cache = TokenCache()
+
+
+def get_corpus(texts, use_cache=True):
+    """텍스트 Series의 TokenizedCorpus (같은 내용이면 프로세스 안에서 한 번만 토큰화)
+
+    use_cache=False: 캐시를 거치지 않고 토큰화 (스트리밍 배치처럼 다시 쓰지 않는 텍스트가
+    전체 데이터셋의 토큰을 캐시에서 밀어내지 않도록)
+    """
+    if not use_cache:
+        return TokenizedCorpus(texts)
+    return _token_cache.get(texts)
+
+
+def get_token_cache():
+    return _token_cache
+
+
+# ========================================
+# 캐시된 토큰을 읽는 분석 계산 (그래프는 각 페이지의 분석 클래스에서 그림)
+# ========================================
+
+def rank_terms(corpus, counts, tiebreak, keep, top_n):
+    """빈도 내림차순 [(단어, 빈도), ...] (동점은 tiebreak 오름차순, 빈도 0은 제외)"""
+    candidates = np.flatnonzero(keep & (counts > 0))
+    order = np.lexsort((tiebreak[candidates], -counts[candidates]))[:top_n]
+    return [(corpus.vocabulary[i], int(counts[i])) for i in candidates[order]]
+
+
+def top_keywords(corpus, top_n=50, min_length=2, stopwords=frozenset(), rows=None):
+    """[(단어, 빈도), ...] 빈도 내림차순 (동점은 처음 나온 순서 - Counter.most_common과 같음)
+
+    rows: 문서별 bool (주면 그 문서들만의 빈도 = DTM 행 부분합)
+    """
+    keep = corpus.term_mask(min_length, stopwords)
+    if rows is None:
+        return rank_terms(corpus, corpus.frequencies, np.arange(len(corpus.vocabulary)), keep, top_n)
+    rows = np.asarray(rows, dtype=bool)
+    counts = np.asarray(corpus.dtm[rows].sum(axis=0)).ravel()
+    first_seen = corpus.first_seen[rows].max(axis=0).toarray().ravel()
+    return rank_terms(corpus, counts, -first_seen, keep, top_n)
+
+
+def keyword_doc_matrix(corpus, keywords, binary=False):
+    """문서 × keywords 희소 행렬 (코퍼스에 없는 키워드는 0 열)"""
+    keywords = list(keywords)
+    ids = np.array([corpus.vocabulary_index.get(w, -1) for w in keywords], dtype=np.int64)
+    found = np.flatnonzero(ids >= 0)
+    # 찾은 단어 열만 골라 keywords 순서 자리로 옮김 (열 선택 행렬 곱)
+    selector = sparse.csr_matrix((np.ones(len(found), dtype=np.int64), (ids[found], found)),
+                                 shape=(len(corpus.vocabulary), len(keywords)))
+    matrix = (corpus.dtm @ selector).tocsr()
+    if binary:
+        matrix.data = np.ones_like(matrix.data)
+    return matrix
+
+
+# ========================================
+# 감성 사전 기반 점수 (단어 id → 극성 정수 코드를 한 번에 조회)
+# - 극성 코드: 1 긍정, 2 부정 (두 사전에 모두 있으면 3 → 양쪽 모두 셈)
+# - 부정어 창(negation_window > 0): 같은 문서에서 앞의 N 토큰 안에 부정어가 있으면 극성을 뒤집음
+#   예) "not good" → 부정, "안 좋아요" → 부정 (0이면 기존처럼 단어 수만 셈)
+# - 사전 파일: UTF-8 텍스트, 한 줄에 단어 하나, '#' 뒤는 주석
+# ========================================
+
+POSITIVE, NEGATIVE = 1, 2
+DEFAULT_NEGATORS = frozenset({
+    'not', 'no', 'never', 'dont', 'doesnt', 'didnt', 'isnt', 'wasnt', 'cant', 'wont',
+    'don', 'doesn', 'didn', 'isn', 'wasn', 'aren', 'weren', 'haven', 'hasn',   # "don't" → "don t"
+    '안', '못', '전혀',
+})
+DEFAULT_NEGATION_WINDOW = 3
+
+
+def read_lexicon(lines):
+    """사전 텍스트 줄들 → 단어 집합 (전처리 규칙대로 소문자/기호 제거, 빈 줄과 주석 제외)"""
+    words = set()
+    for line in lines:
+        words.update(preprocess_text(line.split('#', 1)[0]).split())
+    return words
+
+
+def load_lexicon(path):
+    with open(path, encoding='utf-8-sig') as f:
+        return read_lexicon(f)
+
+
+class SentimentLexicon:
+    """긍정/부정 사전 + 부정어 처리 설정"""
+
+    def __init__(self, positive_words, negative_words, negators=DEFAULT_NEGATORS, negation_window=0):
+        self.positive_words = frozenset(positive_words)
+        self.negative_words = frozenset(negative_words)
+        self.negators = frozenset(negators)
+        self.negation_window = int(negation_window)
+
+    @classmethod
+    def from_files(cls, positive_path, negative_path, negators_path=None, negation_window=0):
+        negators = load_lexicon(negators_path) if negators_path else DEFAULT_NEGATORS
+        return cls(load_lexicon(positive_path), load_lexicon(negative_path), negators, negation_window)
+
+    def polarity_table(self, corpus):
+        """단어 id → 극성 코드 (np.int8, 어휘 크기)"""
+        table = np.zeros(len(corpus.vocabulary), dtype=np.int8)
+        table[corpus.ids_of(self.positive_words)] |= POSITIVE
+        table[corpus.ids_of(self.negative_words)] |= NEGATIVE
+        return table
+
+    def counts(self, corpus):
+        """문서별 (긍정 단어 수, 부정 단어 수) numpy 배열 - 코퍼스 전체를 한 번에"""
+        codes = self.polarity_table(corpus)[corpus.token_ids]
+        polar = np.flatnonzero(codes)
+        codes = codes[polar]
+        if self.negation_window > 0 and len(polar):
+            is_negator = np.zeros(len(corpus.vocabulary), dtype=np.int64)
+            is_negator[corpus.ids_of(self.negators)] = 1
+            # 부정어 누적 개수의 차로 "같은 문서의 앞 N 토큰 안에 부정어가 있는지" 계산
+            seen = np.concatenate(([0], np.cumsum(is_negator[corpus.token_ids])))
+            lengths = np.bincount(corpus.doc_ids, minlength=len(corpus))
+            doc_start = (np.cumsum(lengths) - lengths)[corpus.doc_ids[polar]]
+            window_start = np.maximum(polar - self.negation_window, doc_start)
+            negated = seen[polar] - seen[window_start] > 0
+            codes[negated] = ((codes[negated] & POSITIVE) << 1) | ((codes[negated] & NEGATIVE) >> 1)
+        docs = corpus.doc_ids[polar]
+        pos_counts = np.bincount(docs[(codes & POSITIVE) > 0], minlength=len(corpus))
+        neg_counts = np.bincount(docs[(codes & NEGATIVE) > 0], minlength=len(corpus))
+        return pos_counts, neg_counts
+
+    def classify(self, corpus):
+        """(긍정 수, 부정 수, '긍정'/'부정'/'중립' 배열)"""
+        pos_counts, neg_counts = self.counts(corpus)
+        return pos_counts, neg_counts, classify_sentiment(pos_counts, neg_counts)
+
+
+def classify_sentiment(pos_counts, neg_counts):
+    """긍정/부정 단어 수 비교로 '긍정'/'부정'/'중립' 배열"""
+    return np.select([pos_counts > neg_counts, pos_counts < neg_counts], ['긍정', '부정'], default='중립')
+
+
+# ========================================
+# 동시출현 (단위 × 키워드 0/1 희소 행렬 B → B.T @ B)
+# - 단위: 토큰이 있는 문서(window=None) 또는 문서 안의 연속 토큰 window개짜리 슬라이딩 창
+#   (창보다 짧은 문서는 문서 전체가 창 1개)
+# - measure: 'count' 함께 나온 단위 수 (대각선 = 단어가 나온 단위 수)
+#            'lift'  N·f(x,y) / (f(x)·f(y)) - 1보다 크면 우연보다 자주 함께 나옴
+#            'pmi'   log2(lift) - 함께 나온 적 없는 쌍과 대각선은 NaN (히트맵에서 빈칸)
+# ========================================
+
+COOCCURRENCE_MEASURES = ('count', 'lift', 'pmi')
+
+
+def window_units(corpus, keywords, window):
+    """슬라이딩 창 × keywords 0/1 희소 행렬과 전체 창 수"""
+    column = np.full(len(corpus.vocabulary), -1, dtype=np.int64)
+    for i, word in enumerate(keywords):
+        if word in corpus.vocabulary_index:
+            column[corpus.vocabulary_index[word]] = i
+    lengths = np.bincount(corpus.doc_ids, minlength=len(corpus))
+    windows = np.where(lengths > 0, np.maximum(lengths - window + 1, 1), 0)
+    window_start = np.concatenate(([0], np.cumsum(windows)))[:-1]
+    token_start = np.concatenate(([0], np.cumsum(lengths)))[:-1]
+
+    hits = np.flatnonzero(column[corpus.token_ids] >= 0)
+    docs = corpus.doc_ids[hits]
+    position = hits - token_start[docs]
+    # 위치 p의 토큰이 들어가는 창: 시작 max(0, p-window+1) ~ min(p, 문서 창 수-1)
+    first = np.maximum(position - window + 1, 0)
+    spans = np.minimum(position, windows[docs] - 1) - first + 1
+    offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+    rows = np.repeat(window_start[docs] + first, spans) + offsets
+    columns = np.repeat(column[corpus.token_ids[hits]], spans)
+    total = int(windows.sum())
+    units = sparse.csr_matrix((np.ones(len(rows), dtype=np.int64), (rows, columns)), shape=(total, len(keywords)))
+    units.data = np.ones_like(units.data)  # 같은 창에 여러 번 나와도 1
+    return units, total
+
+
+def cooccurrence_matrix(corpus, keywords, window=None, measure='count'):
+    """키워드 × 키워드 동시출현 DataFrame (index/columns = keywords 순서)"""
+    if measure not in COOCCURRENCE_MEASURES:
+        raise ValueError(f"지원하지 않는 동시출현 지표입니다: {measure}")
+    keywords = list(keywords)
+    if window is None:
+        units = keyword_doc_matrix(corpus, keywords, binary=True)
+        total = int(np.count_nonzero(np.bincount(corpus.doc_ids, minlength=len(corpus))))  # 토큰 있는 문서 수
+    else:
+        units, total = window_units(corpus, keywords, int(window))
+    counts = (units.T @ units).toarray()
+    if measure == 'count':
+        return pd.DataFrame(counts, index=keywords, columns=keywords)
+
+    marginal = np.diag(counts).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = total * counts / np.outer(marginal, marginal)
+        if measure == 'pmi':
+            values = np.log2(values)
+    values[~np.isfinite(values)] = np.nan  # PMI의 log2(0), 코퍼스에 없는 키워드
+    np.fill_diagonal(values, np.nan)
+    return pd.DataFrame(values, index=keywords, columns=keywords)
+
+
+def group_top_words(corpus, groups, group_values, top_n=5, min_length=2, stopwords=frozenset()):
+    """그룹(예: 영상 제목, 서브레딧)별 상위 단어 {그룹: [단어, ...]} - 그룹마다 DTM 행 부분합"""
+    groups = np.asarray(groups, dtype=object)
+    return {value: [word for word, _ in top_keywords(corpus, top_n, min_length, stopwords, rows=groups == value)]
+            for value in group_values}
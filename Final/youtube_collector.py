@@ -0,0 +1,690 @@
+import functools
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httplib2
+import pandas as pd
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+
+from columnar import ColumnBatch, concat_frames, empty_frame, join_parent
+from crawl_state import is_known
+from youtube_http_cache import CachingHttp, get_response_cache
+from youtube_quota import (COMMENT_PAGE_SIZE, DEFAULT_MAX_REPLIES, SEARCH_PAGE_SIZE, VIDEO_BATCH_SIZE, get_ledger,
+                           make_request_builder)
+
+# ========================================
+# YouTube 수집 모듈
+# - 페이지(3_Gobal_Tremd(youtube).py)와 백그라운드 작업 워커(job_worker.py)에서 공통으로 사용
+# - Streamlit에 의존하지 않도록 API 키는 호출하는 쪽에서 넘겨받음
+# ========================================
+
+
+DEFAULT_COMMENT_WORKERS = 8
+HTTP_TIMEOUT = 60
+DEFAULT_REPLY_WORKERS = 4      # 답글 추가 요청(comments().list) 동시 실행 수 (모든 영상 워커가 공유)
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# 잠시 기다리면 풀리는 제한 (이때만 백오프 후 재시도)
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+# 재시도해도 의미 없는 일일 할당량 소진 (받는 즉시 중단, 태평양 시간 자정에 초기화)
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+# 일시적인 서버 오류 (속도 제한과 같은 공유 백오프 후 재시도)
+SERVER_ERROR_STATUSES = {500, 502, 503, 504}
+# 영상 자체의 상태라 다시 요청해도 같은 결과 (그때까지 받은 댓글이 전부인 것으로 처리)
+COMMENT_SKIP_REASONS = {"commentsDisabled", "videoNotFound"}
+
+
+class YouTubeAPIError(Exception):
+    pass
+
+
+class YouTubeQuotaExceeded(YouTubeAPIError):
+    """일일 할당량 소진 (partial: 소진되기 전까지 받은 데이터, 없으면 None)"""
+
+    def __init__(self, message, partial=None):
+        super().__init__(message)
+        self.partial = partial
+
+
+# ========================================
+# 클라이언트 (프로세스 공용)
+# - discovery 문서: 패키지에 포함된 정적 문서를 한 번만 파싱해 재사용 (네트워크 요청 없음)
+# - 연결: 모든 스레드/수집이 PooledHttp 하나를 공유 → 한 번 연 연결(TLS 핸드셰이크 포함)을 계속 재사용
+# - 클라이언트: (API 키, 할당량 기록, 응답 캐시, API 주소) 조합마다 1개를 만들어 여러 스레드가 함께 사용
+# - API 주소: secrets.toml [youtube] api_root(또는 환경변수 YOUTUBE_API_ROOT)로 실제 API 대신
+#   다른 서버(예: fake_youtube.py)를 가리킬 수 있음
+# ========================================
+
+API_ROOT_ENV = "YOUTUBE_API_ROOT"
+
+class PooledHttp:
+    """여러 스레드가 함께 쓰는 httplib2.Http 연결 풀
+
+    httplib2.Http는 스레드 간 공유가 안전하지 않으므로 요청마다 쉬고 있는 Http를 하나 빌려 쓰고 돌려준다.
+    풀 크기는 동시에 요청한 스레드 수만큼만 늘어난다.
+    """
+
+    def __init__(self, timeout=HTTP_TIMEOUT):
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()  # 최근에 쓴 연결부터 (끊기지 않았을 가능성이 큼)
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.created += 1
+            return httplib2.Http(timeout=self.timeout)
+
+    def request(self, *args, **kwargs):
+        http = self._acquire()
+        try:
+            return http.request(*args, **kwargs)
+        finally:
+            self._idle.put(http)
+
+
+_http_pool = PooledHttp()
+_discovery_document = None
+_discovery_lock = threading.Lock()
+_clients = {}
+_clients_lock = threading.Lock()
+_api_root = os.environ.get(API_ROOT_ENV) or None
+
+
+def set_api_root(api_root):
+    """이후 만드는 기본 클라이언트의 요청 주소 (예: 'http://127.0.0.1:8766', None이면 실제 API)"""
+    global _api_root
+    _api_root = api_root or None
+
+
+def _client_options(api_root):
+    if not api_root:
+        return None
+    # discovery 문서의 메서드 경로에 'youtube/v3/'가 포함되어 있으므로 서버 주소만 바꿈
+    return {"api_endpoint": api_root.rstrip("/") + "/"}
+
+
+def youtube_discovery_document():
+    """YouTube Data API v3 정적 discovery 문서 (처음 한 번만 파싱, 없으면 None)"""
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is None:
+            document = get_static_doc("youtube", "v3")
+            _discovery_document = json.loads(document) if document else False
+        return _discovery_document or None
+
+
+def create_youtube_client(api_key, ledger=None, cache=None, http=None, api_root=None):
+    """클라이언트 생성 - 실행되는 요청마다 할당량 사용량을 ledger(기본: quota_state/)에 기록
+
+    cache: 응답 디스크 캐시 ResponseCache (기본: http_cache/youtube/, False면 캐시하지 않음)
+    http: 요청을 보낼 Http (기본: 프로세스 공용 연결 풀)
+    api_root: 요청을 보낼 서버 주소 (없으면 실제 API)
+    """
+    http = http or _http_pool
+    if cache is not False:
+        http = CachingHttp(cache or get_response_cache(), http)
+    request_builder = make_request_builder(ledger or get_ledger())
+    client_options = _client_options(api_root)
+    document = youtube_discovery_document()
+    if document is None:  # 정적 문서가 없는 구버전 googleapiclient
+        return build("youtube", "v3", developerKey=api_key, http=http, requestBuilder=request_builder,
+                     client_options=client_options)
+    return build_from_document(document, developerKey=api_key, http=http, requestBuilder=request_builder,
+                               client_options=client_options)
+
+
+def get_youtube_client(api_key, ledger=None, cache=None, api_root=None):
+    """프로세스 공용 클라이언트 (같은 조합이면 만들어 둔 것을 반환, 스레드 간 공유 가능)
+
+    api_root: 없으면 set_api_root()/YOUTUBE_API_ROOT로 설정한 주소 (그것도 없으면 실제 API)
+    """
+    ledger = ledger or get_ledger()
+    if cache is not False:
+        cache = cache or get_response_cache()
+    api_root = api_root or _api_root
+    key = (api_key, ledger, cache, api_root)
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = create_youtube_client(api_key, ledger, cache, api_root=api_root)
+        return _clients[key]
+
+
+def make_youtube_client_factory(api_key, ledger=None, cache=None, api_root=None):
+    """워커 스레드에서 부를 클라이언트 함수 (모든 스레드가 공용 클라이언트와 연결 풀을 함께 사용)"""
+    return functools.partial(get_youtube_client, api_key, ledger, cache, api_root)
+
+
+def error_reason(error):
+    """HttpError 응답 본문의 오류 사유 (예: 'quotaExceeded', 'commentsDisabled')"""
+    try:
+        return json.loads(error.content.decode("utf-8"))["error"]["errors"][0]["reason"]
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+        return ""
+
+
+def is_rate_limited(error):
+    return isinstance(error, HttpError) and (
+        error.resp.status == 429 or (error.resp.status == 403 and error_reason(error) in RATE_LIMIT_REASONS)
+    )
+
+
+def is_server_error(error):
+    return isinstance(error, HttpError) and error.resp.status in SERVER_ERROR_STATUSES
+
+
+class RequestBackoff:
+    """여러 스레드가 공유하는 백오프 게이트
+
+    평소에는 기다리지 않고, 속도 제한 응답(또는 일시적인 서버 오류)을 받았을 때만 모든 스레드가
+    지수 백오프(+지터)만큼 함께 멈춘다. 요청이 성공하면 백오프 단계를 초기화한다.
+    일일 할당량이 소진되면 quota_exhausted를 표시해 다른 스레드도 재시도 없이 멈추게 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.blocked_until = 0.0
+        self.consecutive = 0
+        self.rate_limited = 0
+        self.server_errors = 0
+        self.wait_seconds = 0.0
+        self.quota_exhausted = False
+
+    def wait(self):
+        while True:
+            with self._lock:
+                delay = self.blocked_until - time.monotonic()
+                if delay <= 0:
+                    return
+                self.wait_seconds += delay
+            time.sleep(delay)
+
+    def throttled(self, retry_after=None, server_error=False):
+        with self._lock:
+            if server_error:
+                self.server_errors += 1
+            else:
+                self.rate_limited += 1
+            if time.monotonic() < self.blocked_until:
+                return  # 이미 대기 중 - 같은 시점에 보낸 다른 스레드의 요청이 함께 거절된 것
+            self.consecutive += 1
+            delay = retry_after or min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (self.consecutive - 1))
+            delay *= 1 + random.random() * 0.25
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+
+    def succeeded(self):
+        with self._lock:
+            self.consecutive = 0
+
+
+def execute_with_backoff(request, backoff, max_retries=DEFAULT_MAX_RETRIES):
+    """요청 실행 - 속도 제한 응답과 일시적인 서버 오류(5xx)만 공유 백오프 후 재시도,
+    할당량 소진은 바로 YouTubeQuotaExceeded, 그 외 오류는 그대로 raise"""
+    attempt = 0
+    while True:
+        backoff.wait()
+        if backoff.quota_exhausted:
+            raise YouTubeQuotaExceeded("API 할당량 소진")
+        try:
+            response = request.execute()
+            backoff.succeeded()
+            return response
+        except HttpError as e:
+            if error_reason(e) in QUOTA_REASONS:
+                # 기다려도 풀리지 않으므로 백오프 없이 모든 스레드를 멈춤
+                backoff.quota_exhausted = True
+                raise YouTubeQuotaExceeded(f"API 할당량 소진: {e}")
+            server_error = is_server_error(e)
+            if not (server_error or is_rate_limited(e)) or attempt >= max_retries:
+                raise
+            retry_after = e.resp.get("retry-after")
+            backoff.throttled(float(retry_after) if retry_after and retry_after.isdigit() else None, server_error)
+            attempt += 1
+
+
+MAX_SEARCH_RESULTS = 500   # 검색 1건으로 받을 수 있는 영상 수 상한 (API가 그 이상은 페이지를 주지 않음)
+
+
+def iter_search_pages(youtube, keyword, order, page_token=None):
+    """키워드 검색 결과를 페이지 단위로 yield: (영상 ID 목록, 다음 페이지 토큰 또는 None)
+
+    page_token: 이전에 받은 다음 페이지 토큰부터 이어서 검색
+    """
+    while True:
+        try:
+            search_response = youtube.search().list(
+                q=keyword,
+                part="id",
+                maxResults=SEARCH_PAGE_SIZE,
+                type="video",
+                order=order,
+                regionCode="KR",
+                pageToken=page_token
+            ).execute()
+        except Exception as e:
+            raise YouTubeAPIError(f"검색 오류: {e}")
+        page_token = search_response.get("nextPageToken")
+        yield [item["id"]["videoId"] for item in search_response["items"]], page_token
+        if not page_token:
+            return
+
+
+def search_video_ids(youtube, keyword, max_videos, order):
+    """키워드 검색 결과 영상 ID 목록 (nextPageToken을 따라가며 max_videos개까지, 페이지 간 중복 제거)"""
+    max_videos = min(max_videos, MAX_SEARCH_RESULTS)
+    video_ids, seen = [], set()
+    for page_ids, _ in iter_search_pages(youtube, keyword, order):
+        new_ids = [v for v in page_ids if v not in seen]
+        if not new_ids:
+            break  # 같은 결과만 반복되면 더 넘겨도 새 영상이 없음
+        seen.update(new_ids)
+        video_ids.extend(new_ids)
+        if len(video_ids) >= max_videos:
+            break
+    return video_ids[:max_videos]
+
+
+def video_to_dict(item):
+    return {
+        "video_id": item["id"],
+        "title": item["snippet"]["title"],
+        "channel": item["snippet"]["channelTitle"],
+        "published_at": item["snippet"]["publishedAt"],
+        "description": item["snippet"]["description"],
+        "view_count": int(item["statistics"].get("viewCount", 0)),
+        "like_count": int(item["statistics"].get("likeCount", 0)),
+        "comment_count": int(item["statistics"].get("commentCount", 0)),
+        "duration": item["contentDetails"]["duration"],
+        "tags": ", ".join(item["snippet"].get("tags", [])),
+        "url": f"https://www.youtube.com/watch?v={item['id']}"
+    }
+
+
+def fetch_video_details(youtube, video_ids):
+    """영상 상세 정보 (VIDEO_BATCH_SIZE개씩 묶어 요청 - 영상 수 제한 없음)"""
+    videos_data = []
+    try:
+        for i in range(0, len(video_ids), VIDEO_BATCH_SIZE):
+            batch_ids = video_ids[i:i+VIDEO_BATCH_SIZE]
+            video_response = youtube.videos().list(
+                part="snippet,statistics,contentDetails",
+                id=",".join(batch_ids)
+            ).execute()
+            videos_data.extend(video_to_dict(item) for item in video_response["items"])
+    except Exception as e:
+        raise YouTubeAPIError(f"영상 정보 수집 오류: {e}")
+    return videos_data
+
+
+def fetch_video_statistics(youtube, video_ids):
+    """영상 통계만 조회 (part="statistics", VIDEO_BATCH_SIZE개씩 묶어 요청) - 스냅샷용
+
+    삭제/비공개된 영상은 응답에 없으므로 결과에서 빠진다.
+    """
+    stats = []
+    try:
+        for i in range(0, len(video_ids), VIDEO_BATCH_SIZE):
+            response = youtube.videos().list(
+                part="statistics",
+                id=",".join(video_ids[i:i+VIDEO_BATCH_SIZE])  # id와 maxResults는 함께 쓸 수 없음
+            ).execute()
+            stats.extend({
+                "video_id": item["id"],
+                "view_count": int(item["statistics"].get("viewCount", 0)),
+                "like_count": int(item["statistics"].get("likeCount", 0)),
+                "comment_count": int(item["statistics"].get("commentCount", 0)),
+            } for item in response["items"])
+    except Exception as e:
+        raise YouTubeAPIError(f"영상 통계 수집 오류: {e}")
+    return stats
+
+
+# 댓글/답글 열 스키마 (영상 정보는 수집이 끝난 뒤 attach_video_info로 한 번만 붙임)
+# None: 문자열 열 - pandas 기본 문자열 타입으로 추론 (parent_id의 None은 결측값으로 유지)
+COMMENT_SCHEMA = {
+    "comment_id": None,
+    "parent_id": None,
+    "video_id": None,
+    "author": None,
+    "text": None,
+    "like_count": "int64",
+    "published_at": None,
+    "reply_count": "int64",
+}
+VIDEO_INFO_COLUMNS = {"title": "video_title", "channel": "video_channel", "url": "video_url"}
+
+
+def comment_thread_columns(items, video_id):
+    """commentThreads 응답 페이지 → 최상위 댓글 열 dict (댓글마다 dict를 만들지 않음)"""
+    tops = [item["snippet"]["topLevelComment"] for item in items]
+    snippets = [top["snippet"] for top in tops]
+    return {
+        "comment_id": [top["id"] for top in tops],
+        "parent_id": [None] * len(items),
+        "video_id": [video_id] * len(items),
+        "author": [s["authorDisplayName"] for s in snippets],
+        "text": [s["textDisplay"] for s in snippets],
+        "like_count": [s["likeCount"] for s in snippets],
+        "published_at": [s["publishedAt"] for s in snippets],
+        "reply_count": [item["snippet"]["totalReplyCount"] for item in items],
+    }
+
+
+def reply_columns(items, video_id):
+    """답글(comment 리소스) 목록 → 댓글과 같은 열 dict (parent_id에 원댓글 ID)"""
+    snippets = [item["snippet"] for item in items]
+    return {
+        "comment_id": [item["id"] for item in items],
+        "parent_id": [s["parentId"] for s in snippets],
+        "video_id": [video_id] * len(items),
+        "author": [s["authorDisplayName"] for s in snippets],
+        "text": [s["textDisplay"] for s in snippets],
+        "like_count": [s["likeCount"] for s in snippets],
+        "published_at": [s["publishedAt"] for s in snippets],
+        "reply_count": [0] * len(items),
+    }
+
+
+def concat_comments(frames):
+    """영상별 댓글 DataFrame들을 하나로 (없으면 열만 있는 빈 DataFrame)"""
+    return concat_frames(frames, COMMENT_SCHEMA)
+
+
+def attach_video_info(comments_df, videos_df):
+    """댓글에 영상 제목/채널/URL(video_title, video_channel, video_url)을 video_id로 한 번에 붙임"""
+    return join_parent(comments_df, videos_df, "video_id", VIDEO_INFO_COLUMNS)
+
+
+def fetch_replies(youtube, parent_id, max_replies, backoff=None, reply_slots=None):
+    """comments().list(parentId=...)로 댓글 1개의 답글(comment 리소스)을 페이지(최대 100개) 단위로 수집
+
+    reply_slots: 영상 워커 간 공유 세마포어 (답글 요청 동시 실행 수 제한)
+    """
+    backoff = backoff or RequestBackoff()
+    reply_slots = reply_slots or threading.BoundedSemaphore(DEFAULT_REPLY_WORKERS)
+    replies = []
+    next_page_token = None
+    while len(replies) < max_replies:
+        request = youtube.comments().list(
+            part="snippet",
+            parentId=parent_id,
+            maxResults=min(COMMENT_PAGE_SIZE, max_replies - len(replies)),
+            pageToken=next_page_token,
+            textFormat="plainText"
+        )
+        with reply_slots:
+            response = execute_with_backoff(request, backoff)
+        replies.extend(response["items"])
+
+        next_page_token = response.get("nextPageToken")
+        if not next_page_token:
+            break
+    return replies[:max_replies]
+
+
+def thread_replies(youtube, item, max_replies, backoff=None, reply_slots=None):
+    """댓글 스레드의 답글 리소스 - 응답에 포함된 답글이 전부면 그대로 쓰고, 아니면 추가 요청으로 수집"""
+    total = item["snippet"]["totalReplyCount"]
+    inline = item.get("replies", {}).get("comments", [])
+    if total == 0 or max_replies <= 0:
+        return []
+    if len(inline) >= min(total, max_replies):
+        return inline[:max_replies]
+    try:
+        return fetch_replies(youtube, item["id"], max_replies, backoff, reply_slots)
+    except YouTubeQuotaExceeded:
+        raise
+    except Exception:
+        # 추가 요청이 실패하면 응답에 포함된 답글만 사용
+        return inline[:max_replies]
+
+
+COMMENT_WATERMARK_PREFIX = "youtube|comments|"
+VIDEO_ID_PATTERN = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([A-Za-z0-9_-]{11})|^([A-Za-z0-9_-]{11})$")
+
+
+def comments_watermark_key(video_id):
+    """영상별 댓글 증분 동기화 워터마크 키 (영상 ID는 대소문자를 구분하므로 make_state_key로 소문자화하지 않음)"""
+    return COMMENT_WATERMARK_PREFIX + video_id
+
+
+def tracked_video_ids(watermarks):
+    """워터마크가 기록된(한 번 이상 동기화한) 영상 ID 목록"""
+    return [key[len(COMMENT_WATERMARK_PREFIX):] for key in watermarks.keys(COMMENT_WATERMARK_PREFIX)]
+
+
+def parse_video_ids(text):
+    """영상 ID/URL 목록(줄바꿈, 쉼표, 공백 구분) → 중복 없는 영상 ID 리스트"""
+    video_ids = []
+    for token in re.split(r"[\s,]+", text or ""):
+        match = VIDEO_ID_PATTERN.search(token.strip())
+        if match:
+            video_id = match.group(1) or match.group(2)
+            if video_id not in video_ids:
+                video_ids.append(video_id)
+    return video_ids
+
+
+def fetch_video_comments(youtube, video_id, max_comments, backoff=None, include_replies=False,
+                         max_replies=DEFAULT_MAX_REPLIES, reply_slots=None, order="relevance", watermark=None):
+    """영상 1개의 최상위 댓글을 수집해 (COMMENT_SCHEMA DataFrame, 빠짐없이 받았는지) 반환
+
+    댓글 사용 중지/없는 영상(COMMENT_SKIP_REASONS)이면 그때까지 모은 댓글로 완료한다. 재시도 후에도
+    실패한 서버 오류, 네트워크/인증 오류 등은 그때까지 모은 댓글을 완료되지 않은 것으로 반환한다.
+
+    응답 페이지마다 열 단위로 모아 마지막에 한 번만 DataFrame으로 만든다. 영상 정보는 붙이지 않는다.
+    backoff: 스레드 간 공유 RequestBackoff (속도 제한 응답일 때만 대기 후 재시도)
+    include_replies: True면 댓글마다 답글(최대 max_replies개)도 수집 (parent_id로 원댓글과 연결,
+    max_comments는 최상위 댓글 수 기준)
+    watermark: 최신순(order="time")과 함께 넘기면 이미 수집한 댓글을 처음 만난 지점에서 멈춘다.
+    그 지점에 닿기 전에 max_comments에서 멈추면 사이의 댓글이 빠지므로 완료되지 않은 것으로 반환한다.
+    할당량이 완전히 소진되면 backoff.quota_exhausted를 표시하고, 그때까지 모은 댓글을
+    partial로 담은 YouTubeQuotaExceeded를 raise한다.
+    """
+    backoff = backoff or RequestBackoff()
+    batch = ColumnBatch(COMMENT_SCHEMA)
+    top_level = 0
+    next_page_token = None
+    reached_known = False
+    try:
+        while top_level < max_comments and not reached_known:
+            request = youtube.commentThreads().list(
+                # 답글을 쓰지 않으면 replies는 요청하지 않음 (응답 크기만 커짐)
+                part="snippet,replies" if include_replies else "snippet",
+                videoId=video_id,
+                maxResults=min(COMMENT_PAGE_SIZE, max_comments - top_level),
+                pageToken=next_page_token,
+                textFormat="plainText",
+                order=order
+            )
+            response = execute_with_backoff(request, backoff)
+            items = response["items"]
+            if watermark is not None:
+                for index, item in enumerate(items):
+                    top = item["snippet"]["topLevelComment"]
+                    if is_known(top["snippet"]["publishedAt"], top["id"], watermark):
+                        items, reached_known = items[:index], True
+                        break
+            batch.add(comment_thread_columns(items, video_id))
+            top_level += len(items)
+            if include_replies:
+                replies = [reply for item in items
+                           for reply in thread_replies(youtube, item, max_replies, backoff, reply_slots)]
+                batch.add(reply_columns(replies, video_id))
+
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token:
+                break
+        # 새 댓글이 상한보다 많아 워터마크까지 닿지 못함 (워터마크를 옮기면 사이 구간을 영영 받지 못함)
+        complete = watermark is None or reached_known or not next_page_token
+    except YouTubeQuotaExceeded as e:
+        backoff.quota_exhausted = True
+        e.partial = batch.to_frame()
+        raise
+    except HttpError as e:
+        # 댓글 사용 중지(commentsDisabled)/삭제된 영상 등은 그때까지 모은 댓글만 사용
+        complete = error_reason(e) in COMMENT_SKIP_REASONS
+    except Exception:
+        complete = False  # 네트워크 오류 등 - 잘린 결과이므로 캐시/워터마크에 반영하지 않음
+    return batch.to_frame(), complete
+
+
+def iter_video_comments_parallel(client_factory, video_ids, max_comments, max_workers=DEFAULT_COMMENT_WORKERS,
+                                 include_replies=False, reply_workers=DEFAULT_REPLY_WORKERS, watermarks=None):
+    """여러 영상의 댓글을 제한된 워커 풀로 동시에 수집
+
+    영상별 (video_id, 댓글 DataFrame)을 끝나는 순서대로 yield하고, 마지막에 통계 dict를 반환한다.
+    고정 대기 없이 요청하고, 속도 제한 응답을 받았을 때만 모든 워커가 함께 백오프한다.
+    할당량이 소진되면 수집 중이던 영상은 그때까지 받은 댓글만 yield하고, 남은 영상은 건너뛰며
+    통계의 quota_exhausted를 True로, partial_videos에 댓글이 잘리거나 건너뛴 영상 ID를 표시한다.
+    (오류로 중간에 멈춘 영상, 증분 모드에서 워터마크까지 닿지 못한 영상도 partial_videos에 표시한다)
+    include_replies: 답글도 수집 (답글 추가 요청은 전체에서 reply_workers개까지만 동시에 실행)
+    watermarks(WatermarkStore)를 넘기면 증분 모드로 동작한다. 최신순으로 받으면서 영상별
+    워터마크(가장 최신 최상위 댓글)에 도달하면 멈춘다. 워터마크는 여기서 갱신하지 않고
+    통계의 watermark_updates로 돌려주므로, 호출하는 쪽이 저장소에 반영한 뒤 commit()한다.
+    """
+    started = time.perf_counter()
+    backoff = RequestBackoff()
+    reply_slots = threading.BoundedSemaphore(max(1, reply_workers))
+
+    def worker(video_id):
+        """(댓글 DataFrame, 할당량 소진/오류 등으로 잘렸는지)"""
+        if backoff.quota_exhausted:
+            return empty_frame(COMMENT_SCHEMA), True
+        try:
+            if watermarks is None:
+                comments, complete = fetch_video_comments(client_factory(), video_id, max_comments, backoff,
+                                                          include_replies, reply_slots=reply_slots)
+            else:
+                comments, complete = fetch_video_comments(
+                    client_factory(), video_id, max_comments, backoff, include_replies, reply_slots=reply_slots,
+                    order="time", watermark=watermarks.get(comments_watermark_key(video_id))
+                )
+            return comments, not complete
+        except YouTubeQuotaExceeded as e:
+            backoff.quota_exhausted = True
+            return (e.partial if e.partial is not None else empty_frame(COMMENT_SCHEMA)), True
+
+    done_videos = 0
+    partial_videos = []
+    watermark_updates = {}
+    total_comments = 0
+    total_replies = 0
+    if video_ids:
+        workers = max(1, min(max_workers, len(video_ids)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="youtube-comments") as executor:
+            futures = {executor.submit(worker, video_id): video_id for video_id in video_ids}
+            try:
+                for future in as_completed(futures):
+                    comments, cut_short = future.result()
+                    if cut_short:
+                        partial_videos.append(futures[future])
+                    done_videos += 1
+                    total_comments += len(comments)
+                    is_reply = comments['parent_id'].notna()
+                    total_replies += int(is_reply.sum())
+                    top_level = comments[~is_reply]
+                    # 잘린 영상은 워터마크를 옮기지 않음 (다음 동기화 때 빠진 구간을 다시 받도록)
+                    if watermarks is not None and not cut_short and not top_level.empty:
+                        newest = top_level.loc[top_level['published_at'].idxmax()]
+                        watermark_updates[comments_watermark_key(futures[future])] = {
+                            "created": newest['published_at'], "id": newest['comment_id'],
+                        }
+                    yield futures[future], comments
+            except (GeneratorExit, KeyboardInterrupt):
+                # 소비하는 쪽이 중단(작업 취소, Ctrl+C 등)하면 아직 시작하지 않은 영상은 취소
+                for future in futures:
+                    future.cancel()
+                raise
+
+    elapsed = time.perf_counter() - started
+    return {
+        'comment_videos': done_videos,
+        'comments': total_comments,
+        'replies': total_replies,
+        'comment_seconds': round(elapsed, 2),
+        'videos_per_second': round(done_videos / elapsed, 2) if elapsed else 0.0,
+        'comments_per_second': round(total_comments / elapsed, 1) if elapsed else 0.0,
+        'rate_limited': backoff.rate_limited,
+        'server_errors': backoff.server_errors,
+        'backoff_seconds': round(backoff.wait_seconds, 2),
+        'quota_exhausted': backoff.quota_exhausted,
+        'partial_videos': partial_videos,
+        'watermark_updates': watermark_updates,
+    }
+
+
+def fetch_video_comments_parallel(client_factory, video_ids, max_comments, max_workers=DEFAULT_COMMENT_WORKERS,
+                                  include_replies=False):
+    """iter_video_comments_parallel 결과를 영상 순서대로 모아 ({video_id: 댓글 DataFrame}, 통계) 반환"""
+    by_video = {}
+    stream = iter_video_comments_parallel(client_factory, video_ids, max_comments, max_workers, include_replies)
+    while True:
+        try:
+            video_id, comments = next(stream)
+        except StopIteration as stop:
+            stats = stop.value
+            break
+        by_video[video_id] = comments
+    return {video_id: by_video[video_id] for video_id in video_ids if video_id in by_video}, stats
+
+
+def iter_video_batches(client_factory, video_ids, max_comments_per_video, max_workers=DEFAULT_COMMENT_WORKERS,
+                       include_replies=False, watermarks=None):
+    """정해진 영상들의 정보와 댓글을 도착하는 대로 yield (iter_youtube_batches와 같은 형식)"""
+    videos_data = fetch_video_details(client_factory(), video_ids)
+    yield "videos", pd.DataFrame(videos_data)
+
+    stream = iter_video_comments_parallel(client_factory, video_ids, max_comments_per_video, max_workers,
+                                          include_replies, watermarks=watermarks)
+    try:
+        while True:
+            try:
+                video_id, comments = next(stream)
+            except StopIteration as stop:
+                yield "done", stop.value
+                return
+            yield "comments", video_id, comments
+    finally:
+        stream.close()  # 중단되면 아직 시작하지 않은 영상의 댓글 요청 취소
+
+
+def iter_youtube_batches(api_key, keyword, max_videos, max_comments_per_video, order,
+                         max_workers=DEFAULT_COMMENT_WORKERS, include_replies=False):
+    """YouTube API를 통한 데이터 수집 - 도착하는 대로 yield
+
+    yield 형식: ("videos", 영상 df) 1회 → 영상마다 ("comments", video_id, 댓글 df) (끝나는 순서대로)
+    → ("done", 통계 dict) 1회
+    댓글 df에는 영상 정보가 없으므로 모두 모은 뒤 attach_video_info(concat_comments(...), 영상 df)로 한 번에 붙인다.
+    """
+    client_factory = make_youtube_client_factory(api_key)
+    video_ids = search_video_ids(client_factory(), keyword, max_videos, order)
+    yield from iter_video_batches(client_factory, video_ids, max_comments_per_video, max_workers, include_replies)
+
+
+def iter_tracked_video_batches(api_key, video_ids, max_new_comments, watermarks, max_workers=DEFAULT_COMMENT_WORKERS,
+                               include_replies=False):
+    """추적 영상 댓글 증분 동기화 - 검색 없이 영상 정보(50개당 요청 1회)와 워터마크 이후의 새 댓글만 수집
+
+    새 댓글이 없는 영상은 댓글 요청 1회로 끝난다. 댓글 목록 응답은 디스크 캐시의 신선도와 관계없이
+    항상 ETag로 재검증해 새 댓글을 놓치지 않는다. max_new_comments: 영상당 한 번에 받을 새 댓글 상한
+    (처음 동기화하는 영상은 최신 댓글부터 이만큼만 받음)
+    워터마크는 갱신하지 않으므로, 받은 데이터를 저장한 뒤 watermarks.commit(통계['watermark_updates'])를 호출한다.
+    """
+    cache = get_response_cache(freshness={"commentThreads": 0, "comments": 0})
+    client_factory = make_youtube_client_factory(api_key, cache=cache)
+    yield from iter_video_batches(client_factory, video_ids, max_new_comments, max_workers, include_replies,
+                                  watermarks)
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+
+import httplib2
+
+# ========================================
+# YouTube API 응답 디스크 캐시 (httplib2.Http를 감싸 클라이언트 아래에서 동작)
+# - 키: 요청 URL의 호스트/경로 + 정렬한 쿼리 파라미터 (API 키 제외, 가짜 서버 응답과 섞이지 않도록 호스트 포함)
+# - 엔드포인트별 신선도(초) 안에서는 API를 호출하지 않고 저장된 응답을 반환 → 지연 시간/할당량 절약
+# - 신선도가 지나면 ETag로 조건부 요청(If-None-Match) → 304면 저장된 본문을 다시 사용
+# - 구조: http_cache/youtube/{키 앞 2글자}/{키}.json
+# ========================================
+
+CACHE_DIR = os.path.join("http_cache", "youtube")
+LOCAL_CACHE_HEADER = "x-local-cache"   # 응답을 어디서 가져왔는지 표시 (hit / revalidated / miss)
+MAX_AGE_SECONDS = 7 * 24 * 3600        # 이보다 오래된 항목은 정리
+
+# 엔드포인트별 신선도(초) - 0이면 매번 ETag로 확인, 목록에 없으면 캐시하지 않음
+DEFAULT_FRESHNESS = {
+    "search": 6 * 3600,            # 검색 결과 순위
+    "videos": 3600,                # 조회수/좋아요 등 통계가 바뀜
+    "commentThreads": 3 * 3600,
+    "comments": 3 * 3600,
+    "channels": 24 * 3600,
+}
+
+IGNORED_PARAMS = {"key", "alt", "prettyPrint"}
+
+
+def endpoint_name(uri):
+    """'https://youtube.googleapis.com/youtube/v3/commentThreads?...' → 'commentThreads'"""
+    return urllib.parse.urlsplit(uri).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def cache_key(uri):
+    parts = urllib.parse.urlsplit(uri)
+    params = sorted((k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+                    if k not in IGNORED_PARAMS)
+    raw = parts.netloc + parts.path + "?" + urllib.parse.urlencode(params)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """응답 본문과 ETag를 키별 JSON 파일로 보관"""
+
+    def __init__(self, cache_dir=CACHE_DIR, freshness=None):
+        self.cache_dir = cache_dir
+        self.freshness = {**DEFAULT_FRESHNESS, **(freshness or {})}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, entry):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def count(self, outcome):
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+    def prune(self, max_age=MAX_AGE_SECONDS):
+        """오래된 항목 파일 삭제 (삭제한 수 반환)"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        cutoff = time.time() - max_age
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+
+def _response(entry, outcome):
+    headers = {k: v for k, v in entry["headers"].items() if k not in ("status", "content-length")}
+    response = httplib2.Response({**headers, "status": "200", LOCAL_CACHE_HEADER: outcome})
+    return response, entry["content"].encode("utf-8")
+
+
+def _etag(response, content):
+    """ETag 헤더 (없으면 YouTube 응답 본문의 etag 필드)"""
+    if response.get("etag"):
+        return response["etag"]
+    try:
+        return json.loads(content).get("etag")
+    except (ValueError, AttributeError):
+        return None
+
+
+class CachingHttp:
+    """httplib2.Http 대신 googleapiclient에 넘기는 래퍼 (GET 요청만 캐시)"""
+
+    def __init__(self, cache, http=None):
+        self.cache = cache
+        self.http = http or httplib2.Http(timeout=60)
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+    def request(self, uri, method="GET", body=None, headers=None, *args, **kwargs):
+        max_age = self.cache.freshness.get(endpoint_name(uri))
+        if method != "GET" or max_age is None:
+            return self.http.request(uri, method, body, headers, *args, **kwargs)
+
+        key = cache_key(uri)
+        entry = self.cache.get(key)
+        if entry is not None and time.time() - entry["stored_at"] < max_age:
+            self.cache.count("hits")
+            return _response(entry, "hit")
+
+        headers = dict(headers or {})
+        if entry is not None and entry.get("etag"):
+            headers["if-none-match"] = entry["etag"]
+        response, content = self.http.request(uri, method, body, headers, *args, **kwargs)
+
+        if response.status == 304 and entry is not None:
+            entry["stored_at"] = time.time()
+            self.cache.put(key, entry)
+            self.cache.count("revalidated")
+            return _response(entry, "revalidated")
+        if response.status == 200:
+            text = content.decode("utf-8") if isinstance(content, bytes) else content
+            self.cache.put(key, {
+                "uri": uri.split("?", 1)[0],
+                "stored_at": time.time(),
+                "etag": _etag(response, text),
+                "headers": {k: v for k, v in response.items() if k in ("content-type", "etag", "date")},
+                "content": text,
+            })
+        self.cache.count("misses")
+        response[LOCAL_CACHE_HEADER] = "miss"
+        return response, content
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(cache_dir=CACHE_DIR, freshness=None):
+    """프로세스 안에서 같은 폴더/신선도 설정은 하나의 ResponseCache를 공유 (폴더를 처음 열 때 오래된 항목 정리)
+
+    freshness: 기본 신선도에서 바꿀 엔드포인트만 (예: {"videos": 0} → 영상 정보는 매번 ETag로 재검증)
+    """
+    key = (cache_dir, tuple(sorted((freshness or {}).items())))
+    with _caches_lock:
+        if key not in _caches:
+            if not any(dir_ == cache_dir for dir_, _ in _caches):
+                ResponseCache(cache_dir).prune()
+            _caches[key] = ResponseCache(cache_dir, freshness)
+        return _caches[key]
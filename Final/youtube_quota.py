@@ -0,0 +1,226 @@
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from googleapiclient.http import HttpRequest
+
+from data_store import StoreLock
+from youtube_http_cache import LOCAL_CACHE_HEADER
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:  # tzdata가 없는 Windows 등 - 태평양 표준시로 근사
+    QUOTA_TZ = timezone(timedelta(hours=-8))
+
+# ========================================
+# YouTube Data API 할당량 관리
+# - 요청 종류별 비용(unit)으로 수집 전에 예상 사용량을 계산
+# - 실제 사용량은 클라이언트 요청마다 자동 기록 → 날짜별로 디스크(quota_state/)에 누적
+#   (할당량은 태평양 시간 자정에 초기화되므로 날짜도 태평양 시간 기준)
+# - 남은 할당량이 모자라면 답글 수집 → 영상당 댓글 수 → 영상 수 순서로 줄여서 수집 계획을 맞춤
+# ========================================
+
+STATE_DIR = "quota_state"
+DEFAULT_DAILY_QUOTA = 10000
+KEEP_DAYS = 30
+FLUSH_UNITS = 20       # 이만큼 쌓이거나
+FLUSH_SECONDS = 5      # 이 시간이 지나면 파일에 반영 (요청마다 쓰지 않도록)
+
+# 요청 종류별 비용 (https://developers.google.com/youtube/v3/determine_quota_cost)
+COSTS = {
+    "youtube.search.list": 100,
+    "youtube.videos.list": 1,
+    "youtube.commentThreads.list": 1,
+    "youtube.comments.list": 1,
+    "youtube.channels.list": 1,
+}
+DEFAULT_COST = 1
+
+SEARCH_PAGE_SIZE = 50      # search().list의 페이지당 최대 결과 수
+VIDEO_BATCH_SIZE = 50      # videos().list 1회에 넣을 수 있는 최대 ID 수
+COMMENT_PAGE_SIZE = 100    # commentThreads().list의 페이지당 최대 댓글 수
+DEFAULT_MAX_REPLIES = 100  # 댓글 1개당 받을 최대 답글 수 (commentThreads의 replies에는 최대 5개만 포함됨)
+
+
+def quota_day(now=None):
+    """할당량 기준 날짜 (태평양 시간)"""
+    return (now or datetime.now(timezone.utc)).astimezone(QUOTA_TZ).strftime("%Y-%m-%d")
+
+
+class QuotaLedger:
+    """날짜별 실제 사용량 기록 (페이지와 백그라운드 워커가 같은 파일을 공유)"""
+
+    def __init__(self, state_dir=STATE_DIR):
+        os.makedirs(state_dir, exist_ok=True)
+        self.state_dir = state_dir
+        self.path = os.path.join(state_dir, "youtube_quota.json")
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._pending_units = 0
+        self._last_flush = time.monotonic()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def record(self, method_id, units=None):
+        """요청 1회 사용량 기록 (실패한 요청도 할당량이 차감되므로 함께 기록)"""
+        units = COSTS.get(method_id, DEFAULT_COST) if units is None else units
+        with self._lock:
+            day = self._pending.setdefault(quota_day(), {})
+            day[method_id] = day.get(method_id, 0) + units
+            self._pending_units += units
+            due = self._pending_units >= FLUSH_UNITS or time.monotonic() - self._last_flush >= FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_units = 0
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        with StoreLock(self.state_dir):
+            ledger = self._read()
+            for day, usage in pending.items():
+                entry = ledger.setdefault(day, {"used": 0, "calls": {}})
+                for method_id, units in usage.items():
+                    entry["used"] += units
+                    entry["calls"][method_id] = entry["calls"].get(method_id, 0) + units
+            for day in sorted(ledger)[:-KEEP_DAYS]:
+                del ledger[day]
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(ledger, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def usage(self, day=None):
+        """해당 날짜 사용량 {"used": 합계, "calls": {요청 종류: unit}} (아직 파일에 안 쓴 사용량 포함)"""
+        day = day or quota_day()
+        entry = self._read().get(day, {"used": 0, "calls": {}})
+        with self._lock:
+            for method_id, units in self._pending.get(day, {}).items():
+                entry["used"] += units
+                entry["calls"][method_id] = entry["calls"].get(method_id, 0) + units
+        return entry
+
+    def remaining(self, daily_quota=DEFAULT_DAILY_QUOTA):
+        return max(0, daily_quota - self.usage()["used"])
+
+
+_ledgers = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_ledger(state_dir=STATE_DIR):
+    """프로세스 안에서 같은 기록 파일은 하나의 QuotaLedger를 공유"""
+    with _ledgers_lock:
+        if state_dir not in _ledgers:
+            _ledgers[state_dir] = QuotaLedger(state_dir)
+            atexit.register(_ledgers[state_dir].flush)  # 종료 전에 남은 사용량 기록
+        return _ledgers[state_dir]
+
+
+def make_request_builder(ledger):
+    """googleapiclient build(requestBuilder=...)에 넘길 요청 클래스 - 실행되는 요청마다 사용량 기록
+
+    응답 디스크 캐시(youtube_http_cache)에서 바로 꺼낸 응답은 API를 호출하지 않았으므로 기록하지 않는다.
+    """
+
+    class QuotaHttpRequest(HttpRequest):
+        def execute(self, http=None, num_retries=0):
+            # list_next()로 복사된 요청과 콜백 리스트를 공유하므로 실행할 때만 잠시 바꿔 끼움
+            callbacks = self.response_callbacks
+            served = []
+            self.response_callbacks = callbacks + [lambda resp: served.append(resp.get(LOCAL_CACHE_HEADER))]
+            try:
+                return super().execute(http=http, num_retries=num_retries)
+            finally:
+                self.response_callbacks = callbacks
+                if not served or served[0] != "hit":
+                    ledger.record(self.methodId)
+
+    return QuotaHttpRequest
+
+
+# ========================================
+# 수집 전 예상 사용량 / 할당량에 맞춘 수집 계획
+# ========================================
+
+def estimate_cost(max_videos, max_comments_per_video, include_replies=False, max_replies=DEFAULT_MAX_REPLIES):
+    """수집 1회의 최대 예상 사용량 (댓글이 적은 영상은 실제로 더 적게 듦)
+
+    include_replies: 답글 수집 시 모든 댓글이 답글 추가 요청(comments().list)을 한다고 보고 상한을 더함
+    (응답에 답글이 모두 포함된 댓글은 실제로 요청하지 않음)
+    """
+    search = math.ceil(max_videos / SEARCH_PAGE_SIZE) * COSTS["youtube.search.list"]
+    videos = math.ceil(max_videos / VIDEO_BATCH_SIZE) * COSTS["youtube.videos.list"]
+    comments = max_videos * math.ceil(max_comments_per_video / COMMENT_PAGE_SIZE) * COSTS["youtube.commentThreads.list"]
+    replies = 0
+    if include_replies:
+        threads = max_videos * max_comments_per_video
+        replies = threads * math.ceil(max_replies / COMMENT_PAGE_SIZE) * COSTS["youtube.comments.list"]
+    return {"search": search, "videos": videos, "comments": comments, "replies": replies,
+            "total": search + videos + comments + replies}
+
+
+def estimate_sync_cost(video_count):
+    """추적 영상 증분 동기화의 최소 사용량 (영상 정보 + 영상당 댓글 요청 1회, 새 댓글이 많으면 페이지만큼 추가)"""
+    videos = math.ceil(video_count / VIDEO_BATCH_SIZE) * COSTS["youtube.videos.list"]
+    comments = video_count * COSTS["youtube.commentThreads.list"]
+    return {"search": 0, "videos": videos, "comments": comments, "replies": 0, "total": videos + comments}
+
+
+def plan_collection(max_videos, max_comments_per_video, remaining, include_replies=False,
+                    max_replies=DEFAULT_MAX_REPLIES):
+    """남은 할당량에 맞게 (영상 수, 영상당 댓글 수, 답글 수집 여부, 안내 메시지 또는 None) 반환
+
+    답글 추가 요청의 상한까지 포함해 모자라면 답글 수집부터 끄고, 그래도 모자라면
+    영상당 댓글 수를 줄이고(댓글 페이지 단위), 그래도 모자라면 영상 수를 줄인다.
+    검색 1페이지도 못 할 만큼 남지 않았으면 영상 수 0을 반환한다.
+    """
+    if estimate_cost(max_videos, max_comments_per_video, include_replies, max_replies)["total"] <= remaining:
+        return max_videos, max_comments_per_video, include_replies, None
+
+    # 0) 답글 수집을 끔 (댓글 수/영상 수보다 먼저 포기)
+    replies_note = ""
+    if include_replies:
+        include_replies = False
+        replies_note = "답글 수집을 끄고 "
+        if estimate_cost(max_videos, max_comments_per_video)["total"] <= remaining:
+            return max_videos, max_comments_per_video, False, (
+                f"남은 할당량({remaining:,})에 맞춰 답글 수집을 껐습니다."
+            )
+
+    # 1) 영상 수는 그대로, 영상당 댓글 페이지 수를 줄임
+    fixed = estimate_cost(max_videos, 0)["total"]
+    pages_per_video = (remaining - fixed) // max_videos if remaining > fixed else 0
+    if pages_per_video >= 1:
+        capped = min(max_comments_per_video, pages_per_video * COMMENT_PAGE_SIZE)
+        return max_videos, capped, False, (
+            f"남은 할당량({remaining:,})에 맞춰 {replies_note}"
+            f"영상당 댓글 수를 {max_comments_per_video:,}개 → {capped:,}개로 줄였습니다."
+        )
+
+    # 2) 댓글 1페이지씩만 받으면서 영상 수를 줄임
+    comments = min(max_comments_per_video, COMMENT_PAGE_SIZE)
+    videos = max_videos
+    while videos > 0 and estimate_cost(videos, comments)["total"] > remaining:
+        videos -= 1
+    if videos == 0:
+        return 0, 0, False, (
+            f"남은 할당량({remaining:,})으로는 검색을 실행할 수 없습니다. 할당량이 초기화된 뒤(태평양 시간 자정) 다시 시도하세요."
+        )
+    return videos, comments, False, (
+        f"남은 할당량({remaining:,})에 맞춰 {replies_note}영상 수를 {max_videos:,}개 → {videos:,}개, "
+        f"영상당 댓글 수를 {comments:,}개로 줄였습니다."
+    )
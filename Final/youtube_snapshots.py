@@ -0,0 +1,169 @@
+import argparse
+import logging
+import math
+import os
+import signal
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+import data_store
+import youtube_quota
+from secrets_util import load_secrets
+from youtube_collector import fetch_video_statistics, get_youtube_client, parse_video_ids, set_api_root
+from youtube_http_cache import get_response_cache
+
+# ========================================
+# YouTube 영상 통계 스냅샷 (조회수/좋아요/댓글 수 성장 추이)
+# - 추적 영상 목록의 통계만 videos().list로 50개씩 다시 조회 (50개당 할당량 1, 검색 없음)
+# - 저장소 youtube/video_stats 테이블에 (video_id, ts, 카운터) 시계열로 추가
+#   → 대시보드의 '성장 추이' 탭에서 바로 차트로 표시
+# - 추적 영상 목록: crawl_state/youtube_snapshot_videos.txt (한 줄에 영상 ID/URL 1개, 직접 편집 가능)
+#
+# 사용 예) Final 폴더에서
+#   python youtube_snapshots.py                         # 주기(기본 60분)마다 계속 실행
+#   python youtube_snapshots.py --once                  # 한 번만 기록하고 종료
+#   python youtube_snapshots.py --add dQw4w9WgXcQ       # 추적 목록에 추가 (이후 기록에 포함)
+# ========================================
+
+TRACKED_PATH = os.path.join("crawl_state", "youtube_snapshot_videos.txt")
+DEFAULT_EVERY_MINUTES = 60
+COUNTERS = ["view_count", "like_count", "comment_count"]
+SNAPSHOT_COLUMNS = ["video_id", "ts"] + COUNTERS
+
+log = logging.getLogger("youtube_snapshots")
+
+
+def load_tracked(path=TRACKED_PATH):
+    """추적 영상 ID 목록 (파일이 없으면 빈 목록)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return parse_video_ids(f.read())
+    except FileNotFoundError:
+        return []
+
+
+def add_tracked(video_ids, path=TRACKED_PATH):
+    """추적 목록에 없는 영상만 추가하고 추가한 개수 반환"""
+    tracked = load_tracked(path)
+    new_ids = [v for v in video_ids if v not in tracked]
+    if new_ids:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(f"{video_id}\n" for video_id in new_ids)
+    return len(new_ids)
+
+
+def snapshot_cost(video_count):
+    return math.ceil(video_count / youtube_quota.VIDEO_BATCH_SIZE) * youtube_quota.COSTS["youtube.videos.list"]
+
+
+def take_snapshot(api_key, video_ids, data_dir=data_store.DATA_DIR, ts=None):
+    """영상 통계를 한 번 조회해 같은 시각(ts)의 스냅샷으로 저장하고 저장한 행(DataFrame) 반환"""
+    # 응답 캐시의 영상 정보 신선도(1시간)를 쓰면 같은 값이 다시 기록되므로 매번 ETag로 재검증
+    youtube = get_youtube_client(api_key, cache=get_response_cache(freshness={"videos": 0}))
+    ts = ts or pd.Timestamp(datetime.now(timezone.utc)).floor("s")
+    rows = fetch_video_statistics(youtube, video_ids)
+    snapshot = pd.DataFrame(rows, columns=["video_id"] + COUNTERS)
+    snapshot.insert(1, "ts", ts)
+    data_store.upsert("youtube", "video_stats", snapshot, data_dir)
+    return snapshot
+
+
+def load_snapshots(video_ids=None, start_date=None, end_date=None, data_dir=data_store.DATA_DIR):
+    """저장된 스냅샷 (video_id, ts 순 정렬) - video_ids가 있으면 해당 영상만"""
+    filters = [("video_id", "in", list(video_ids))] if video_ids else None
+    snapshots = data_store.load("youtube", "video_stats", columns=SNAPSHOT_COLUMNS, start_date=start_date,
+                                end_date=end_date, filters=filters, data_dir=data_dir)
+    if snapshots.empty:
+        return snapshots
+    snapshots["ts"] = pd.to_datetime(snapshots["ts"], utc=True)
+    return snapshots.sort_values(["video_id", "ts"]).reset_index(drop=True)
+
+
+def growth_frame(snapshots, metric="view_count", mode="value", labels=None):
+    """차트용 표 (행: 스냅샷 시각, 열: 영상)
+
+    mode: "value" 누적 값 / "since_first" 첫 스냅샷 대비 증가 / "delta" 직전 스냅샷 대비 증가
+    labels: {video_id: 표시 이름} (없으면 영상 ID)
+    """
+    wide = snapshots.pivot_table(index="ts", columns="video_id", values=metric, aggfunc="last").sort_index()
+    if mode == "since_first":
+        wide = wide - wide.bfill().iloc[0]
+    elif mode == "delta":
+        wide = wide.diff()
+    if labels:
+        wide = wide.rename(columns=lambda v: labels.get(v, v))
+    return wide
+
+
+def run_snapshot(api_key, video_ids, daily_quota, data_dir):
+    """할당량을 확인하고 스냅샷 1회 기록"""
+    cost = snapshot_cost(len(video_ids))
+    remaining = youtube_quota.get_ledger().remaining(daily_quota)
+    if cost > remaining:
+        log.warning("남은 할당량(%d)이 스냅샷 비용(%d)보다 적어 건너뜀", remaining, cost)
+        return None
+    started = time.perf_counter()
+    snapshot = take_snapshot(api_key, video_ids, data_dir)
+    log.info("영상 %d개 중 %d개 통계 기록 (요청 %d회, %.1f초)", len(video_ids), len(snapshot), cost,
+             time.perf_counter() - started)
+    return snapshot
+
+
+def _terminate(signum, frame):
+    raise KeyboardInterrupt()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube 영상 통계 스냅샷 (추적 영상 목록을 주기마다 기록)")
+    parser.add_argument("--tracked", default=TRACKED_PATH, help="추적 영상 목록 파일")
+    parser.add_argument("--add", nargs="+", default=None, metavar="VIDEO", help="추적 목록에 영상 ID/URL 추가")
+    parser.add_argument("--every-minutes", type=float, default=DEFAULT_EVERY_MINUTES)
+    parser.add_argument("--once", action="store_true", help="한 번만 기록하고 종료")
+    parser.add_argument("--data-dir", default=data_store.DATA_DIR)
+    parser.add_argument("--secrets", default=None, help="secrets.toml 경로 (기본: .streamlit/secrets.toml)")
+    parser.add_argument("--log-file", default=None)
+    args = parser.parse_args()
+
+    handlers = [logging.StreamHandler()]
+    if args.log_file:
+        handlers.append(logging.FileHandler(args.log_file, encoding="utf-8"))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", handlers=handlers)
+    signal.signal(signal.SIGTERM, _terminate)
+
+    if args.add:
+        added = add_tracked(parse_video_ids(" ".join(args.add)), args.tracked)
+        log.info("추적 목록에 %d개 추가 (총 %d개)", added, len(load_tracked(args.tracked)))
+        return
+
+    try:
+        while True:
+            started = time.time()
+            # 실행할 때마다 목록/키를 다시 읽어 변경을 바로 반영
+            video_ids = load_tracked(args.tracked)
+            if not video_ids:
+                log.warning("추적 영상이 없습니다. (%s 또는 --add)", args.tracked)
+            else:
+                try:
+                    youtube_secrets = load_secrets(args.secrets)["youtube"]
+                    set_api_root(youtube_secrets.get("api_root"))
+                    run_snapshot(youtube_secrets["YOUTUBE_API_KEY"], video_ids,
+                                 int(youtube_secrets.get("daily_quota", youtube_quota.DEFAULT_DAILY_QUOTA)),
+                                 args.data_dir)
+                except KeyboardInterrupt:
+                    raise
+                except Exception:
+                    log.exception("스냅샷 실패 - 다음 주기에 다시 시도")
+            if args.once:
+                break
+            time.sleep(max(args.every_minutes * 60 - (time.time() - started), 1))
+    except KeyboardInterrupt:
+        log.info("중단됨")
+    finally:
+        youtube_quota.get_ledger().flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,134 +1,305 @@
+import argparse
+import json
+import logging
 import os
-from dotenv import load_dotenv
-import praw
-
-# .env 파일 불러오기
-load_dotenv()
-
-# 환경변수에서 값 읽기
-client_id = os.getenv("REDDIT_CLIENT_ID")
-client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-username = os.getenv("REDDIT_USERNAME")
-password = os.getenv("REDDIT_PASSWORD")
-
-# Reddit API 연결
-reddit = praw.Reddit(
-    client_id=client_id,
-    client_secret=client_secret,
-    user_agent="yj_beauty_analysis by u/{}".format(username),
-    username=username,
-    password=password
+import signal
+import sys
+import time
+from datetime import datetime
+
+# Final 폴더의 수집/저장 모듈을 그대로 사용 (대시보드와 같은 저장소에 기록)
+FINAL_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Final"))
+sys.path.insert(0, FINAL_DIR)
+
+import data_store  # noqa: E402
+from crawl_state import WatermarkStore  # noqa: E402
+from reddit_collector import (  # noqa: E402
+    RateLimitBudget, attach_post_info, budget_stats, concat_comments, concat_posts, iter_collect_subreddits,
+    iter_comments_parallel, make_client_factory, options_from_secrets
 )
+from secrets_util import load_secrets, load_toml  # noqa: E402
+
+# ========================================
+# Reddit 배치 수집기 (화면 없이 실행)
+# - 설정 파일(crawler_config.toml)의 작업(서브레딧, 검색어, 수집 주기)을 주기마다 실행
+# - 수집 결과는 대시보드가 읽는 저장소(Final/data_store)에 바로 upsert
+#   → 대시보드는 버튼을 눌러 수집하는 대신 저장소에서 미리 모은 데이터를 불러오면 됨
+# - 작업마다 진행 상황을 체크포인트 파일에 기록 → 중간에 멈춰도 다음 실행 때 이어서 수집
+#
+# 사용 예) 이 폴더에서
+#   python reddit_beauty_db.py                      # 주기마다 계속 실행
+#   python reddit_beauty_db.py --once               # 실행할 때가 된 작업만 한 번 실행하고 종료
+#   python reddit_beauty_db.py --once --force dalba_search   # 주기와 관계없이 해당 작업 실행
+# ========================================
+
+CONFIG_PATH = "crawler_config.toml"
+STATE_DIR = "crawl_state"
+DATA_DIR = os.path.join(FINAL_DIR, data_store.DATA_DIR)
+SECRETS_PATHS = [
+    os.path.join(FINAL_DIR, ".streamlit", "secrets.toml"),
+    os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),
+]
+
+DEFAULT_EVERY_MINUTES = 60
+RETRY_MINUTES = 5      # 오류로 멈춘 작업을 다시 시도하기까지 대기 시간
+FLUSH_POSTS = 50       # 댓글을 이 게시물 수만큼 모을 때마다 저장 + 체크포인트
+FLUSH_SECONDS = 30
+LOG_INTERVAL = 10      # 댓글 수집 중 처리량 로그 간격(초)
+
+log = logging.getLogger("reddit_crawler")
+
+
+def load_config(path):
+    """설정 파일 로드 (상대 경로는 설정 파일 위치 기준)"""
+    config = load_toml(path)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for key, default in (("data_dir", DATA_DIR), ("state_dir", STATE_DIR)):
+        config[key] = os.path.join(base_dir, config.get(key, default))
+    if config.get("secrets"):
+        config["secrets"] = os.path.join(base_dir, config["secrets"])
+
+    names = [job.get("name") for job in config.get("jobs", [])]
+    if not names:
+        raise ValueError(f"{path}에 [[jobs]] 항목이 없습니다.")
+    if len(set(names)) != len(names) or None in names:
+        raise ValueError("작업마다 서로 다른 name을 지정하세요.")
+    return config
+
+
+def load_credentials(config):
+    """Reddit 자격증명: 환경 변수(.env) → secrets.toml의 [reddit] 순서, 설정 파일의 [reddit]으로 덮어씀"""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    if os.getenv("REDDIT_CLIENT_ID") and os.getenv("REDDIT_CLIENT_SECRET"):
+        credentials = {
+            "client_id": os.getenv("REDDIT_CLIENT_ID"),
+            "client_secret": os.getenv("REDDIT_CLIENT_SECRET"),
+            "username": os.getenv("REDDIT_USERNAME"),
+            "password": os.getenv("REDDIT_PASSWORD"),
+        }
+    else:
+        path = config.get("secrets") or next((p for p in SECRETS_PATHS if os.path.exists(p)), None)
+        try:
+            credentials = dict(load_secrets(path)["reddit"])
+        except (FileNotFoundError, KeyError):
+            credentials = {}
+    credentials.update(config.get("reddit", {}))
+    if not credentials.get("client_id") or not credentials.get("client_secret"):
+        raise RuntimeError("Reddit API 자격증명이 없습니다. (.env 또는 secrets.toml의 [reddit] 섹션)")
+    return credentials
+
+
+class CrawlCheckpoint:
+    """작업 1개의 진행 상황 (마지막 완료 시각 + 진행 중인 실행)
+
+    run: {"started_at", "listed": {서브레딧: 게시물 수}, "pending": [댓글을 아직 못 받은 post_id]}
+    failed_at: 진행 중인 실행이 오류로 멈춘 시각 (RETRY_MINUTES 후 다시 시도)
+    """
+
+    def __init__(self, state_dir, job_name):
+        os.makedirs(state_dir, exist_ok=True)
+        self.path = os.path.join(state_dir, f"crawler_{job_name}.json")
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.state = {"last_finished": None, "run": None}
+
+    @property
+    def run(self):
+        return self.state["run"]
+
+    def start_run(self):
+        self.state["run"] = {"started_at": datetime.now().isoformat(timespec="seconds"), "listed": {}, "pending": []}
+        self.save()
+
+    def finish_run(self):
+        self.state.update(run=None, last_finished=time.time(), failed_at=None)
+        self.save()
+
+    def mark_failed(self):
+        self.state["failed_at"] = time.time()
+        self.save()
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def next_run_time(job, checkpoint):
+    """다음 실행 시각 (epoch 초)"""
+    if checkpoint.run is not None:
+        # 중단된 실행은 주기와 관계없이 바로 이어서 수집 (오류로 멈췄으면 잠시 뒤에)
+        failed_at = checkpoint.state.get("failed_at")
+        return failed_at + RETRY_MINUTES * 60 if failed_at else 0
+    last = checkpoint.state.get("last_finished") or 0
+    return last + float(job.get("every_minutes", DEFAULT_EVERY_MINUTES)) * 60
+
+
+def load_pending_posts(post_ids, data_dir):
+    """이전 실행에서 저장해 둔 게시물 중 댓글을 아직 못 받은 것 (중단 후 재개용)"""
+    if not post_ids:
+        return concat_posts([])
+    return data_store.load("reddit", "posts", columns=["post_id", "subreddit", "title", "num_comments"],
+                           filters=[("post_id", "in", list(post_ids))], data_dir=data_dir)
+
+
+def run_job(job, credentials, config):
+    """작업 1회 실행 (체크포인트가 있으면 멈춘 지점부터)"""
+    name = job["name"]
+    data_dir = config["data_dir"]
+    checkpoint = CrawlCheckpoint(config["state_dir"], name)
+    resumed = checkpoint.run is not None
+    if not resumed:
+        checkpoint.start_run()
+    run = checkpoint.run
+
+    subreddits = job["subreddits"]
+    query = job.get("query", "")
+    sort_by = job.get("sort_by", "hot")
+    comment_limit = int(job.get("comment_limit", 0)) if job.get("collect_comments", True) else 0
+    options = options_from_secrets(credentials, job.get("comment_options"))
+    watermarks = WatermarkStore("reddit", config["state_dir"]) if job.get("incremental") else None
+    budget = RateLimitBudget(options["requests_per_minute"])
+
+    started = time.perf_counter()
+    totals = {"posts": 0, "comments": 0}
+    todo = [s for s in subreddits if s not in run["listed"]]
+    log.info("[%s] %s: 서브레딧 %d개 중 %d개 수집, 댓글 대기 게시물 %d개",
+             name, "이어서 수집" if resumed else "수집 시작", len(subreddits), len(todo), len(run["pending"]))
+
+    # 1단계: 리스팅 - 서브레딧마다 받는 즉시 저장하고 체크포인트 기록
+    pending_posts = [load_pending_posts(run["pending"], data_dir)] if resumed else []
+    if todo:
+        events = iter_collect_subreddits(
+            credentials, todo, query, int(job.get("post_limit", 100)), sort_by, job.get("time_filter", "all"),
+            False, 0, max_workers=options["max_workers"], watermarks=watermarks, budget=budget
+        )
+        try:
+            for event in events:
+                if event[0] == "done":
+                    # 서브레딧마다 게시물을 저장한 뒤이므로 워터마크 확정 (댓글은 체크포인트의 대기 목록으로 이어 받음)
+                    if watermarks is not None:
+                        watermarks.commit(event[1]['watermark_updates'])
+                    continue
+                if event[0] != "posts":
+                    continue
+                _, subreddit_name, posts, timing = event
+                if timing['상태'] != "성공":
+                    log.warning("[%s] r/%s 수집 실패 (%s) - 다음 실행 때 다시 시도", name, subreddit_name, timing['상태'])
+                    continue
+                data_store.upsert("reddit", "posts", posts, data_dir)
+                totals["posts"] += len(posts)
+                targets = posts[posts['num_comments'] > 0] if comment_limit else posts.iloc[:0]
+                pending_posts.append(targets)
+                run["listed"][subreddit_name] = len(posts)
+                run["pending"].extend(targets['post_id'].tolist())
+                checkpoint.save()
+                log.info("[%s] r/%s 게시물 %d개 저장 (%.1f초)", name, subreddit_name, len(posts), timing['소요_시간(초)'])
+        finally:
+            events.close()
+
+    # 2단계: 댓글 - 일정량마다 저장하고 처리한 게시물을 체크포인트에서 제외
+    pending_posts = concat_posts(pending_posts)
+    if not pending_posts.empty and comment_limit:
+        client_factory = make_client_factory(credentials, budget)
+        stream = iter_comments_parallel(
+            client_factory, budget, pending_posts, comment_limit, options["replace_more_limit"],
+            options["max_comment_depth"], options["max_comment_requests"], options["comment_workers"]
+        )
+        buffer, done_ids = [], set()
+        last_flush = last_log = time.monotonic()
+
+        def flush():
+            comments = attach_post_info(concat_comments(buffer), pending_posts)
+            data_store.upsert("reddit", "comments", comments, data_dir)
+            totals["comments"] += len(comments)
+            run["pending"] = [post_id for post_id in run["pending"] if post_id not in done_ids]
+            checkpoint.save()
+            buffer.clear()
+            done_ids.clear()
+
+        try:
+            for post_id, comments in stream:
+                buffer.append(comments)
+                done_ids.add(post_id)
+                now = time.monotonic()
+                if len(done_ids) >= FLUSH_POSTS or now - last_flush >= FLUSH_SECONDS:
+                    flush()
+                    last_flush = now
+                if now - last_log >= LOG_INTERVAL:
+                    elapsed = time.perf_counter() - started
+                    collected = totals["comments"] + sum(len(frame) for frame in buffer)
+                    log.info("[%s] 댓글 대기 %d개 · 댓글 %d개 (%.1f개/초) · 요청 %d회",
+                             name, len(run["pending"]) - len(done_ids), collected, collected / elapsed,
+                             budget.request_count)
+                    last_log = now
+        finally:
+            stream.close()
+            flush()
+
+    elapsed = time.perf_counter() - started
+    checkpoint.finish_run()
+    stats = budget_stats(budget)
+    log.info("[%s] 완료: 게시물 %d개 (%.1f개/초), 댓글 %d개 (%.1f개/초), 요청 %d회, 속도 조절 대기 %.1f초, 재시도 %d회, %.1f초",
+             name, totals["posts"], totals["posts"] / elapsed, totals["comments"], totals["comments"] / elapsed,
+             stats['request_count'], stats['rate_wait_seconds'], stats['retries'], elapsed)
+    return totals
+
+
+def _terminate(signum, frame):
+    raise KeyboardInterrupt()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reddit 배치 수집기 (설정 파일의 작업을 주기마다 실행)")
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--once", action="store_true", help="실행할 때가 된 작업만 한 번 실행하고 종료")
+    parser.add_argument("--force", nargs="*", default=None, metavar="JOB",
+                        help="주기와 관계없이 실행할 작업 이름 (이름 없이 쓰면 모든 작업)")
+    parser.add_argument("--log-file", default=None)
+    args = parser.parse_args()
+
+    handlers = [logging.StreamHandler()]
+    if args.log_file:
+        handlers.append(logging.FileHandler(args.log_file, encoding="utf-8"))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", handlers=handlers)
+    # 서비스로 실행할 때 종료 신호도 Ctrl+C처럼 처리 → 체크포인트를 남기고 종료
+    signal.signal(signal.SIGTERM, _terminate)
+
+    config = load_config(args.config)
+    credentials = load_credentials(config)
+    forced = set(args.force) if args.force else set()
+    force_all = args.force is not None and not args.force
+
+    try:
+        while True:
+            for job in config["jobs"]:
+                checkpoint = CrawlCheckpoint(config["state_dir"], job["name"])
+                if force_all or job["name"] in forced or next_run_time(job, checkpoint) <= time.time():
+                    try:
+                        run_job(job, credentials, config)
+                    except KeyboardInterrupt:
+                        raise
+                    except Exception:
+                        # 실패한 작업은 체크포인트가 남아 있으므로 RETRY_MINUTES 후 이어서 수집
+                        log.exception("[%s] 작업 실패", job["name"])
+                        CrawlCheckpoint(config["state_dir"], job["name"]).mark_failed()
+            forced, force_all = set(), False
+            if args.once:
+                break
+            next_due = min(next_run_time(job, CrawlCheckpoint(config["state_dir"], job["name"]))
+                           for job in config["jobs"])
+            time.sleep(min(max(next_due - time.time(), 1), 60))
+    except KeyboardInterrupt:
+        log.info("중단됨 - 다음 실행 때 체크포인트부터 이어서 수집합니다.")
+
 
-SUBREDDIT_NAME = "koreanskincare"  # 분석하려는 서브레딧 이름
-LIMIT = 1000  # 가져올 게시글 수 (최대 1000개까지 가능하지만, 한 번에 너무 많이 가져오지 않도록 주의)
-
-# 특정 서브레딧 객체 지정
-subreddit = reddit.subreddit(SUBREDDIT_NAME)
-
-print(f"--- r/{SUBREDDIT_NAME} 의 인기 게시글 {LIMIT}개 수집 시작 ---")
-
-# 'hot' 게시글을 순회하며 데이터 수집
-for submission in subreddit.hot(limit=LIMIT):
-    # 게시글 제목과 URL 출력
-    print(f"\n[제목] {submission.title}")
-    print(f"[URL] {submission.url}")
-    print(f"[점수] {submission.score} | [댓글] {submission.num_comments}")
-    print("---------------------------------")
-    
-    # 여기서 더 나아가 댓글까지 수집할 수 있어
-    # submission.comments.replace_more(limit=0) # '더 보기' 댓글 제거
-    # for top_comment in submission.comments.list()[:3]: # 상위 3개 댓글만 출력
-    #     print(f"    [댓글] {top_comment.body}")
-
-SEARCH_TERM = "dalba"
-SEARCH_LIMIT = 1000
-
-print(f"--- r/{SUBREDDIT_NAME} 내에서 '{SEARCH_TERM}' 검색 결과 {SEARCH_LIMIT}개 ---")
-
-# .search() 함수 사용
-for submission in subreddit.search(query=SEARCH_TERM, limit=SEARCH_LIMIT, sort='new'): # 'new'는 최신순
-    print(f"\n[제목] {submission.title}")
-    print(f"[작성자] {submission.author}")
-    print(f"[텍스트 미리보기] {submission.selftext[:100]}...")
-    print(f"[URL] https://reddit.com{submission.permalink}")
-
-    # 댓글 가져오기
-    print(f"\n--- 댓글 ({submission.num_comments}개) ---")
-    
-    # 모든 댓글을 로드 (MoreComments 객체 제거)
-    submission.comments.replace_more(limit=0)
-    
-    # 최상위 댓글만 가져오기
-    for comment in submission.comments.list()[:5]:  # 상위 5개만
-        if hasattr(comment, 'body'):  # 실제 댓글인지 확인
-            print(f"\n  [{comment.author}] {comment.score}점")
-            print(f"  {comment.body[:200]}...")  # 댓글 내용 미리보기
-
-from transformers import pipeline
-import pandas as pd
-
-# 감성분석 모델 로드
-# 영어용
-sentiment_analyzer_en = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
-
-# 한국어용 (선택사항)
-# sentiment_analyzer_ko = pipeline("sentiment-analysis", model="matthewburke/korean_sentiment")
-
-SEARCH_TERM = "dalba"
-SEARCH_LIMIT = 1000
-
-results = []
-
-print(f"--- r/{SUBREDDIT_NAME} 내에서 '{SEARCH_TERM}' 검색 및 감성분석 ---\n")
-
-for submission in subreddit.search(query=SEARCH_TERM, limit=SEARCH_LIMIT, sort='new'):
-    print(f"\n{'='*80}")
-    print(f"[제목] {submission.title}")
-    print(f"[댓글 수] {submission.num_comments}개")
-    
-    # 댓글 로드
-    submission.comments.replace_more(limit=0)
-    
-    for comment in submission.comments.list()[:10]:  # 상위 10개 댓글
-        if hasattr(comment, 'body') and len(comment.body) > 10:  # 너무 짧은 댓글 제외
-            try:
-                # 감성분석 수행
-                sentiment = sentiment_analyzer_en(comment.body[:512])[0]  # 최대 512자
-                
-                label = sentiment['label']  # POSITIVE or NEGATIVE
-                confidence = sentiment['score']  # 확신도 (0~1)
-                
-                # 결과 저장
-                results.append({
-                    'post_title': submission.title,
-                    'author': str(comment.author),
-                    'comment': comment.body[:200],
-                    'score': comment.score,
-                    'sentiment': label,
-                    'confidence': round(confidence, 3)
-                })
-                
-                # 이모지로 표시
-                emoji = "😊" if label == "POSITIVE" else "😞"
-                print(f"\n{emoji} [{comment.author}] (점수: {comment.score})")
-                print(f"   감성: {label} ({confidence:.2%} 확신도)")
-                print(f"   내용: {comment.body[:150]}...")
-                
-            except Exception as e:
-                print(f"   [오류] {e}")
-                continue
-
-# 결과를 DataFrame으로 변환
-df = pd.DataFrame(results)
-
-# 통계 출력
-print(f"\n{'='*80}")
-print(f"총 분석된 댓글: {len(df)}개")
-print(f"긍정(POSITIVE): {len(df[df['sentiment']=='POSITIVE'])}개 ({len(df[df['sentiment']=='POSITIVE'])/len(df)*100:.1f}%)")
-print(f"부정(NEGATIVE): {len(df[df['sentiment']=='NEGATIVE'])}개 ({len(df[df['sentiment']=='NEGATIVE'])/len(df)*100:.1f}%)")
-print(f"\n평균 확신도: {df['confidence'].mean():.2%}")
-
-# CSV로 저장
-df.to_csv('reddit_sentiment_analysis.csv', index=False, encoding='utf-8-sig')
-print(f"\n결과가 'reddit_sentiment_analysis.csv'에 저장되었습니다.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()